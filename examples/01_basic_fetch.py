@@ -3,6 +3,8 @@ Example: Basic Data Fetching
 Demonstrates how to fetch stock data using the DataFetcher
 """
 
+import asyncio
+
 from src.data_fetcher import DataFetcher
 
 
@@ -38,7 +40,7 @@ def main():
     print("=" * 60)
 
     tickers = ["AAPL", "MSFT", "GOOGL", "TSLA"]
-    multi_data = fetcher.fetch_multiple_tickers(tickers, period="6mo")
+    multi_data = asyncio.run(fetcher.fetch_multiple_tickers_async(tickers, period="6mo"))
 
     print(f"\nFetched {len(multi_data)} tickers:")
     for ticker, data in multi_data.items():
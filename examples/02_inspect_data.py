@@ -3,12 +3,15 @@ Example: Data Inspection
 Inspect and validate fetched data
 """
 
+import io
+import sys
+from contextlib import redirect_stdout
 from pathlib import Path
 
 import pandas as pd
 
 from src.data_fetcher import DataFetcher
-from src.utils import format_date
+from src.utils import daily_return_std, format_date
 
 
 def inspect_data(ticker: str, period: str = "1y", use_cache: bool = True):
@@ -28,75 +31,116 @@ def inspect_data(ticker: str, period: str = "1y", use_cache: bool = True):
 
     data = fetcher.fetch_ticker(ticker, period=period, use_cache=use_cache)
 
-    print(f"{'=' * 60}")
-    print(f"Data Inspection: {ticker}")
-    print(f"{'=' * 60}\n")
-
-    # Basic info
-    print("1. Basic Information")
-    print("-" * 40)
-    print(f"Shape: {data.shape[0]} rows × {data.shape[1]} columns")
-    print(f"Columns: {list(data.columns)}")
-    print(
-        f"Date range: {format_date(data.index[0], 'readable')} to {format_date(data.index[-1], 'readable')}"
-    )
-    print(f"Trading days: {len(data)}")
-
-    # Data types
-    print("\n2. Data Types")
-    print("-" * 40)
-    print(data.dtypes)
-
-    # Missing values
-    print("\n3. Missing Values")
-    print("-" * 40)
-    missing = data.isnull().sum()
-    if missing.sum() == 0:
-        print("No missing values ✓")
-    else:
-        print(missing[missing > 0])
-
-    # Statistical summary
-    print("\n4. Statistical Summary")
-    print("-" * 40)
-    print(data.describe())
-
-    # Price ranges
-    print("\n5. Price Information")
-    print("-" * 40)
-    print(
-        f"Highest Close: ${data['Close'].max():.2f} on {format_date(data['Close'].idxmax(), 'readable')}"
-    )
-    print(
-        f"Lowest Close:  ${data['Close'].min():.2f} on {format_date(data['Close'].idxmin(), 'readable')}"
-    )
-    print(f"Current Close: ${data['Close'].iloc[-1]:.2f}")
-    print(f"Average Close: ${data['Close'].mean():.2f}")
-
-    # Volume analysis
-    print("\n6. Volume Analysis")
-    print("-" * 40)
-    print(f"Average Volume: {data['Volume'].mean():,.0f}")
-    print(
-        f"Max Volume:     {data['Volume'].max():,.0f} on {format_date(data['Volume'].idxmax(), 'readable')}"
-    )
-    print(
-        f"Min Volume:     {data['Volume'].min():,.0f} on {format_date(data['Volume'].idxmin(), 'readable')}"
-    )
-
-    # Return calculation
-    print("\n7. Performance")
-    print("-" * 40)
-    start_price = data["Close"].iloc[0]
-    end_price = data["Close"].iloc[-1]
-    return_pct = ((end_price / start_price) - 1) * 100
-    volatility = data["Close"].pct_change().std() * 100
-    print(f"Period Return: {return_pct:+.2f}%")
-    print(f"Daily Volatility: {volatility:.2f}%")
+    # Collect the report in memory and write it to stdout in one go, even if it fails midway
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            print(f"{'=' * 60}")
+            print(f"Data Inspection: {ticker}")
+            print(f"{'=' * 60}\n")
+
+            # Basic info
+            print("1. Basic Information")
+            print("-" * 40)
+            print(f"Shape: {data.shape[0]} rows × {data.shape[1]} columns")
+            print(f"Columns: {list(data.columns)}")
+            print(
+                f"Date range: {format_date(data.index[0], 'readable')} to {format_date(data.index[-1], 'readable')}"
+            )
+            print(f"Trading days: {len(data)}")
+
+            # Data types
+            print("\n2. Data Types")
+            print("-" * 40)
+            print(data.dtypes)
+
+            # Missing values
+            print("\n3. Missing Values")
+            print("-" * 40)
+            missing = data.isnull().sum()
+            if missing.sum() == 0:
+                print("No missing values ✓")
+            else:
+                print(missing[missing > 0])
+
+            # Statistical summary
+            print("\n4. Statistical Summary")
+            print("-" * 40)
+            desc = data.describe()
+            print(desc)
+
+            # Reuse min/max/mean from describe(); only the arg-extrema need another pass
+            close_stats = desc["Close"]
+            close_dates = data["Close"].agg(["idxmin", "idxmax"])
+            volume_stats = desc["Volume"]
+            volume_dates = data["Volume"].agg(["idxmin", "idxmax"])
+            start_price = data["Close"].iloc[0]
+            end_price = data["Close"].iloc[-1]
+
+            # Price ranges
+            print("\n5. Price Information")
+            print("-" * 40)
+            print(
+                f"Highest Close: ${close_stats['max']:.2f} on {format_date(close_dates['idxmax'], 'readable')}"
+            )
+            print(
+                f"Lowest Close:  ${close_stats['min']:.2f} on {format_date(close_dates['idxmin'], 'readable')}"
+            )
+            print(f"Current Close: ${end_price:.2f}")
+            print(f"Average Close: ${close_stats['mean']:.2f}")
+
+            # Volume analysis
+            print("\n6. Volume Analysis")
+            print("-" * 40)
+            print(f"Average Volume: {volume_stats['mean']:,.0f}")
+            print(
+                f"Max Volume:     {volume_stats['max']:,.0f} on {format_date(volume_dates['idxmax'], 'readable')}"
+            )
+            print(
+                f"Min Volume:     {volume_stats['min']:,.0f} on {format_date(volume_dates['idxmin'], 'readable')}"
+            )
+
+            # Return calculation
+            print("\n7. Performance")
+            print("-" * 40)
+            return_pct = ((end_price / start_price) - 1) * 100
+            volatility = daily_return_std(data["Close"]) * 100
+            print(f"Period Return: {return_pct:+.2f}%")
+            print(f"Daily Volatility: {volatility:.2f}%")
+    finally:
+        sys.stdout.write(buf.getvalue())
 
     return data
 
 
+def compare_tickers(tickers: list[str], period: str = "1y", use_cache: bool = True):
+    """Compare several tickers side by side (vectorized across tickers)"""
+    fetcher = DataFetcher()
+    results = fetcher.fetch_multiple_tickers(tickers, period=period, use_cache=use_cache)
+    if not results:
+        print("No data fetched")
+        return pd.DataFrame()
+
+    # One wide frame per field, so every metric is a single column-wise pass
+    closes = pd.concat({t: d["Close"] for t, d in results.items()}, axis=1)
+    volumes = pd.concat({t: d["Volume"] for t, d in results.items()}, axis=1)
+
+    start = closes.bfill().iloc[0]
+    end = closes.ffill().iloc[-1]
+    comparison = pd.DataFrame(
+        {
+            "Start": start,
+            "End": end,
+            "Return %": (end / start - 1) * 100,
+            "Volatility %": closes.pct_change().std() * 100,
+            "Avg Volume": volumes.mean(),
+        }
+    )
+
+    print(comparison.round(2).to_string())
+    return comparison
+
+
 def main():
     # Inspect single ticker with cache demonstration
     print("=" * 60)
@@ -111,9 +155,15 @@ def main():
     print("-" * 60)
     data = inspect_data(ticker, period=period, use_cache=True)
 
+    # Compare several tickers at once
+    print("\n\n" + "=" * 60)
+    print("Test 2: Multi-ticker comparison")
+    print("=" * 60 + "\n")
+    compare_tickers(["META", "AAPL", "AMZN", "NFLX", "GOOGL"], period=period)
+
     # Optional: Force fresh fetch
     print("\n\n" + "=" * 60)
-    print("Test 2: Force fresh fetch (use_cache=False)")
+    print("Test 3: Force fresh fetch (use_cache=False)")
     print("=" * 60 + "\n")
     user_input = input("Fetch fresh data? (y/n): ").strip().lower()
     if user_input == "y":
@@ -8,15 +8,18 @@ NOTE: This script is kept for backward compatibility.
 """
 
 import argparse
-import sys
+import os
 import warnings
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.reporting import ReportGenerator
-from src.scoring import StockScorer
+def generate_report(ticker: str, options: dict) -> dict:
+    """Generate one report (runs in a worker process when several tickers are given)"""
+    from src.reporting import ReportGenerator
+
+    # Constructed inside the worker so nothing heavy has to be pickled
+    generator = ReportGenerator(output_dir="data")
+    return generator.generate_full_report(ticker=ticker, **options)
 
 
 def main():
@@ -29,7 +32,9 @@ def main():
 
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="Generate comprehensive stock analysis reports")
-    parser.add_argument("ticker", help="Stock ticker symbol (e.g., AAPL, MSFT, TSLA)")
+    parser.add_argument(
+        "tickers", nargs="+", help="One or more stock ticker symbols (e.g., AAPL MSFT TSLA)"
+    )
     parser.add_argument(
         "--period",
         default="1y",
@@ -65,71 +70,81 @@ def main():
 
     args = parser.parse_args()
 
-    # Initialize report generator
-    generator = ReportGenerator(output_dir="data")
+    # Imported after argument parsing so --help and usage errors return immediately
+    from src.scoring import StockScorer
 
     print("=" * 70)
     print("Generating Comprehensive Stock Reports")
     print("=" * 70)
 
-    # Generate report with user-specified options
-    ticker = args.ticker.upper()
-    print(f"\nGenerating report for {ticker}...")
-
-    report_data = generator.generate_full_report(
-        ticker=ticker,
-        period=args.period,
-        output_format=args.format,
-        use_cache=not args.no_cache,
-        include_technical=not args.exclude_technical,
-        include_fundamental=not args.exclude_fundamental,
-        include_risk=not args.exclude_risk,
-        include_valuation=not args.exclude_valuation,
-    )
-
-    print(f"\n✓ Report generated for {ticker}")
-    if args.format in ["json", "all"]:
-        print(f"  - JSON: data/{ticker}/reports/full_report.json")
-    if args.format in ["markdown", "all"]:
-        print(f"  - Markdown: data/{ticker}/reports/report.md")
-    if args.format in ["toon", "all"]:
-        print(f"  - TOON: data/{ticker}/reports/full_report.toon (LLM-optimized)")
-    if not args.exclude_technical:
-        print(f"  - Technical Analysis: data/{ticker}/reports/technical_analysis.md + .json")
-    if not args.exclude_fundamental:
-        print(f"  - Fundamental Analysis: data/{ticker}/reports/fundamental_analysis.md + .json")
-    if not args.exclude_risk:
-        print(f"  - Risk Analysis: data/{ticker}/reports/risk_analysis.md + .json")
-    if not args.exclude_valuation:
-        print(f"  - Valuation Analysis: data/{ticker}/reports/valuation_analysis.md + .json")
-    print(f"  - Stock Score: data/{ticker}/reports/scoring.md + .json")
-
-    # Display scoring summary if available
-    scoring_data = report_data.get("scoring")
-    if scoring_data:
-        # Re-score from report data to get the ScoringResult object for formatting
-        scorer = StockScorer()
-        scoring_result = scorer.score(report_data)
-        print()
-        print(scoring_result.format_scorecard())
+    # Generate reports with user-specified options
+    tickers = [t.upper() for t in args.tickers]
+    options = {
+        "period": args.period,
+        "output_format": args.format,
+        "use_cache": not args.no_cache,
+        "include_technical": not args.exclude_technical,
+        "include_fundamental": not args.exclude_fundamental,
+        "include_risk": not args.exclude_risk,
+        "include_valuation": not args.exclude_valuation,
+    }
+    print(f"\nGenerating report for {', '.join(tickers)}...")
+
+    if len(tickers) == 1:
+        reports = [generate_report(tickers[0], options)]
+    else:
+        # Reports are independent and CPU-heavy, so spread them across processes
+        max_workers = min(len(tickers), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            reports = list(executor.map(generate_report, tickers, [options] * len(tickers)))
+
+    for ticker, report_data in zip(tickers, reports):
+        print(f"\n✓ Report generated for {ticker}")
+        if args.format in ["json", "all"]:
+            print(f"  - JSON: data/{ticker}/reports/full_report.json")
+        if args.format in ["markdown", "all"]:
+            print(f"  - Markdown: data/{ticker}/reports/report.md")
+        if args.format in ["toon", "all"]:
+            print(f"  - TOON: data/{ticker}/reports/full_report.toon (LLM-optimized)")
+        if not args.exclude_technical:
+            print(f"  - Technical Analysis: data/{ticker}/reports/technical_analysis.md + .json")
+        if not args.exclude_fundamental:
+            print(
+                f"  - Fundamental Analysis: data/{ticker}/reports/fundamental_analysis.md + .json"
+            )
+        if not args.exclude_risk:
+            print(f"  - Risk Analysis: data/{ticker}/reports/risk_analysis.md + .json")
+        if not args.exclude_valuation:
+            print(f"  - Valuation Analysis: data/{ticker}/reports/valuation_analysis.md + .json")
+        print(f"  - Stock Score: data/{ticker}/reports/scoring.md + .json")
+
+        # Display scoring summary if available
+        scoring_data = report_data.get("scoring")
+        if scoring_data:
+            # Re-score from report data to get the ScoringResult object for formatting
+            scorer = StockScorer()
+            scoring_result = scorer.score(report_data)
+            print()
+            print(scoring_result.format_scorecard())
 
     # Summary
     print("\n" + "=" * 70)
     print("Report Generation Complete!")
     print("=" * 70)
-    print(f"\nTicker: {ticker}")
+    print(f"\nTickers: {', '.join(tickers)}")
     print(f"Period: {args.period}")
     print(f"Cache: {'Used' if not args.no_cache else 'Bypassed'}")
     print("\nView reports:")
     print("  - JSON files: Machine-readable, complete data")
     print("  - Markdown files: Human-readable, formatted (right-click → 'Open Preview')")
     print("  - TOON files: LLM-optimized, token-efficient representation")
-    print(f"\nFiles saved in: data/{ticker}/reports/")
+    print("\nFiles saved in: data/<TICKER>/reports/")
     print("\nUsage examples:")
     print("  python examples\\04_generate_report.py AAPL")
     print("  python examples\\04_generate_report.py TSLA --period 2y")
     print("  python examples\\04_generate_report.py MSFT --no-cache --format markdown")
     print("  python examples\\04_generate_report.py NVDA --exclude-technical --exclude-risk")
+    print("  python examples\\04_generate_report.py AAPL MSFT GOOGL")
 
 
 if __name__ == "__main__":
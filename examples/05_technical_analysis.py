@@ -3,16 +3,11 @@ Example: Technical Analysis
 Demonstrates calculating technical indicators from price data
 """
 
-import sys
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-import json
-
 from src.analysis import TechnicalAnalyzer
 from src.data_fetcher import DataFetcher
+from src.utils import write_json
 
 
 def main():
@@ -86,13 +81,17 @@ def main():
     print(f"Data Points: {summary['data_points']}")
     print(f"Signals Generated: {len(summary['signals'])}")
 
-    # Save summary to JSON for inspection
-    output_file = Path("data") / ticker / "reports" / "technical_analysis.json"
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, "w") as f:
-        json.dump(summary, f, indent=2)
+    # Save summary (signals + metadata) to JSON and the numeric indicator table to Parquet
+    reports_dir = Path("data") / ticker / "reports"
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    output_file = reports_dir / "technical_analysis.json"
+    write_json(summary, output_file)
     print(f"\n✓ Technical analysis saved to: {output_file}")
 
+    indicators_file = reports_dir / "indicators.parquet"
+    df_with_indicators.to_parquet(indicators_file, compression="zstd")
+    print(f"✓ Indicator table saved to: {indicators_file}")
+
     # Show sample of data with indicators
     print("\n" + "=" * 70)
     print("Sample Data (Last 5 Days)")
@@ -0,0 +1,139 @@
+"""
+Shared pytest fixtures for the example scripts.
+
+The example tests hit Yahoo Finance, so every fetched object is session-scoped:
+each ticker's data is downloaded once and shared by all example tests.
+DataFrames are handed out as copies so one test cannot mutate another's input.
+
+Run with:  pytest examples/ [--ticker GJF.OL,EXE.TO] [--use-data-cache]
+
+By default every session fetches fresh data. --use-data-cache reuses the
+DataFetcher disk cache (files younger than DATA_CACHE_TTL_HOURS), which makes
+re-runs skip the network entirely.
+"""
+
+import pytest
+
+from src.analysis import FundamentalAnalyzer, ValuationAnalyzer
+from src.data_fetcher import DataFetcher
+
+DEFAULT_TICKERS = "GJF.OL"
+DATA_CACHE_TTL_HOURS = 12
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--ticker",
+        default=DEFAULT_TICKERS,
+        help=f"Comma-separated tickers for the example tests (default: {DEFAULT_TICKERS})",
+    )
+    parser.addoption(
+        "--use-data-cache",
+        action="store_true",
+        help=f"Reuse cached market data up to {DATA_CACHE_TTL_HOURS}h old instead of refetching",
+    )
+
+
+def pytest_collect_file(file_path, parent):
+    # Numbered scripts (06_test_*.py) fall outside the default python_files glob;
+    # files named on the command line are already collected by pytest itself
+    if parent.session.isinitpath(file_path):
+        return None
+    if file_path.suffix == ".py" and file_path.name[:2].isdigit() and "_test_" in file_path.name:
+        return pytest.Module.from_parent(parent, path=file_path)
+    return None
+
+
+def pytest_generate_tests(metafunc):
+    if "ticker" in metafunc.fixturenames:
+        tickers = [t.strip().upper() for t in metafunc.config.getoption("ticker").split(",")]
+        metafunc.parametrize("ticker", tickers, scope="session")
+
+
+# ============================================================
+# Session-scoped data (fetched once per ticker)
+# ============================================================
+
+
+@pytest.fixture(scope="session")
+def use_data_cache(pytestconfig):
+    return pytestconfig.getoption("use_data_cache")
+
+
+@pytest.fixture(scope="session")
+def fetcher(use_data_cache):
+    """Single DataFetcher shared by all example tests."""
+    return DataFetcher(cache_ttl=DATA_CACHE_TTL_HOURS if use_data_cache else None)
+
+
+@pytest.fixture(scope="session")
+def _session_data(fetcher, ticker, use_data_cache):
+    """Fetch everything the examples need for one ticker, once."""
+    use_cache = use_data_cache
+    div_data = fetcher.fetch_dividends(ticker, use_cache=use_cache)
+    dividends_df = div_data.get("dividends")
+    dividends_series = None
+    if dividends_df is not None and not dividends_df.empty:
+        # Date may be the index or a column (same handling as ReportGenerator)
+        if "Date" in dividends_df.columns:
+            dividends_series = dividends_df.set_index("Date")["Dividends"]
+        else:
+            dividends_series = dividends_df["Dividends"]
+
+    return {
+        "info": fetcher.get_ticker_info(ticker, use_cache=use_cache),
+        "price_data_1y": fetcher.fetch_ticker(ticker, period="1y", use_cache=use_cache),
+        "fundamentals": fetcher.fetch_fundamentals(ticker, use_cache=use_cache),
+        "earnings": fetcher.fetch_earnings(ticker, use_cache=use_cache),
+        "dividends_series": dividends_series,
+    }
+
+
+# ============================================================
+# Per-test copies
+# ============================================================
+
+
+@pytest.fixture
+def info(_session_data):
+    return dict(_session_data["info"])
+
+
+@pytest.fixture
+def price_data_1y(_session_data):
+    return _session_data["price_data_1y"].copy()
+
+
+@pytest.fixture
+def fundamentals(_session_data):
+    return {k: v.copy() for k, v in _session_data["fundamentals"].items()}
+
+
+@pytest.fixture
+def earnings(_session_data):
+    return {k: v.copy() for k, v in _session_data["earnings"].items()}
+
+
+@pytest.fixture
+def dividends_series(_session_data):
+    series = _session_data["dividends_series"]
+    return series.copy() if series is not None else None
+
+
+@pytest.fixture
+def valuation_analyzer(ticker, info, price_data_1y, fundamentals, earnings, dividends_series):
+    """ValuationAnalyzer built from the session data for the current ticker."""
+    return ValuationAnalyzer(
+        ticker=ticker,
+        ticker_info=info,
+        price_data=price_data_1y,
+        fundamentals=fundamentals,
+        earnings_data=earnings,
+        dividends_data=dividends_series,
+    )
+
+
+@pytest.fixture(scope="module")
+def empty_analyzer():
+    """FundamentalAnalyzer with no statements or prices (no network needed)."""
+    return FundamentalAnalyzer(ticker_info={"symbol": "TEST"}, fundamentals={}, price_data=None)
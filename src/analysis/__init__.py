@@ -1,13 +1,38 @@
 """Analysis modules for fundamental, technical, and risk analysis"""
 
-from .fundamental import FundamentalAnalyzer
-from .risk import RiskMetrics
-from .technical import TechnicalAnalyzer
-from .valuation import ValuationAnalyzer
+from typing import Any
 
 __all__ = [
     "FundamentalAnalyzer",
     "RiskMetrics",
     "TechnicalAnalyzer",
     "ValuationAnalyzer",
+    "ValuationBatch",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import an analyzer on first access to the package attribute
+
+    Each analyzer is imported only when asked for, so e.g. RiskMetrics users
+    don't pay for loading the `ta` indicator library or the valuation models.
+    """
+    if name == "FundamentalAnalyzer":
+        from .fundamental import FundamentalAnalyzer as value
+    elif name == "RiskMetrics":
+        from .risk import RiskMetrics as value
+    elif name == "TechnicalAnalyzer":
+        from .technical import TechnicalAnalyzer as value
+    elif name == "ValuationAnalyzer":
+        from .valuation import ValuationAnalyzer as value
+    elif name == "ValuationBatch":
+        from .valuation import ValuationBatch as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
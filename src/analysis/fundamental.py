@@ -58,6 +58,8 @@ class FundamentalAnalyzer:
         self.cash_flow_q = self.fundamentals.get("cash_flow_quarterly")
         self.cash_flow_a = self.fundamentals.get("cash_flow_annual")
 
+        self._results: Optional[Dict[str, Any]] = None
+
     # ==================== Helper Methods ====================
 
     def _get_value(
@@ -633,9 +635,15 @@ class FundamentalAnalyzer:
         """
         Calculate all fundamental metrics
 
+        The statements are fixed at construction, so the dictionary is built on the
+        first call and reused afterwards.
+
         Returns:
             Dictionary with all analysis results
         """
+        if self._results is not None:
+            return self._results
+
         logger.info("Calculating fundamental metrics...")
 
         results = {
@@ -651,6 +659,7 @@ class FundamentalAnalyzer:
         }
 
         logger.info("Fundamental analysis complete")
+        self._results = results
         return results
 
     def get_summary(self) -> Dict[str, Any]:
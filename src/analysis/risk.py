@@ -11,13 +11,28 @@ Calculates risk and performance metrics for stock analysis:
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import math
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+from statistics import NormalDist
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 from ..config import get_config
 from ..utils.financial import (
+    SQRT_TRADING_DAYS_PER_YEAR,
     TRADING_DAYS_PER_YEAR,
     annualize_volatility,
     calculate_daily_returns,
@@ -30,6 +45,298 @@ from ..utils.serialization import format_date
 
 logger = logging.getLogger(__name__)
 
+# Below this many price rows calculate_all_metrics runs its metrics serially
+PARALLEL_MIN_ROWS = 500
+
+# Key order of the calculate_all_metrics result (independent of completion order)
+METRIC_ORDER = (
+    "returns",
+    "volatility",
+    "sharpe_ratio",
+    "sortino_ratio",
+    "information_ratio",
+    "calmar_ratio",
+    "drawdown",
+    "market_risk",
+    "var_95",
+    "var_99",
+    "rolling_ratios",
+)
+
+
+@lru_cache(maxsize=16)
+def _normal_z_score(confidence_level: float) -> float:
+    """
+    One-sided standard normal z-score for a confidence level (e.g. 0.95 -> 1.645)
+
+    Args:
+        confidence_level: Confidence level between 0 and 1
+
+    Returns:
+        Absolute z-score of the (1 - confidence_level) quantile
+    """
+    return abs(NormalDist().inv_cdf(1 - confidence_level))
+
+
+def _rolling_downside_std(returns: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling sample std of the negative values in each window
+
+    Built from three rolling sums (count, sum and sum of squares of the negative
+    values) using var = (sum_sq - sum**2 / n) / (n - 1), so every window is
+    handled by pandas' O(n) rolling-sum kernel rather than re-walked.
+
+    Args:
+        returns: 1-D array of returns
+        window: Window length
+
+    Returns:
+        Array aligned with returns; NaN for the first window-1 positions and
+        for windows with fewer than two negative values
+    """
+    if returns.size < window:
+        return np.full(returns.shape, np.nan)
+
+    negative = returns < 0
+    r_neg = np.where(negative, returns, 0.0)
+    sums = (
+        pd.DataFrame({"n": negative.astype(np.float64), "s1": r_neg, "s2": r_neg * r_neg})
+        .rolling(window)
+        .sum()
+    )
+    n = sums["n"].to_numpy()
+    s1 = sums["s1"].to_numpy()
+    s2 = sums["s2"].to_numpy()
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Clip tiny negative variances left over from floating-point cancellation
+        variance = np.maximum((s2 - s1 * s1 / n) / (n - 1), 0.0)
+
+    return np.where(n > 1, np.sqrt(variance), np.nan)
+
+
+def _drawdown_scan_loop(prices: np.ndarray) -> Tuple[float, int, float, int, int]:
+    """
+    Single-pass drawdown scan over a price array (JIT-compiled when numba is installed)
+
+    Tracks the running peak, the deepest drawdown and the first close after it
+    that regains the peak held at the drawdown, all in one sweep. NaN prices
+    are skipped like pandas' cummax does.
+
+    Args:
+        prices: 1-D float64 array of closing prices
+
+    Returns:
+        (max_drawdown, max_drawdown_pos, current_drawdown, days_since_peak,
+        recovery_pos) with positions as -1 when not found
+    """
+    n = prices.shape[0]
+    peak = -np.inf
+    last_peak_pos = -1
+    max_dd = np.inf
+    max_dd_pos = -1
+    peak_at_max_dd = np.nan
+    recovery_pos = -1
+    current_dd = np.nan
+
+    for i in range(n):
+        p = prices[i]
+        if np.isnan(p):
+            current_dd = np.nan
+            continue
+
+        if p >= peak:
+            peak = p
+            last_peak_pos = i
+
+        dd = (p - peak) / peak
+        current_dd = dd
+
+        if dd < max_dd:
+            max_dd = dd
+            max_dd_pos = i
+            peak_at_max_dd = peak
+            recovery_pos = -1
+
+        if recovery_pos == -1 and max_dd_pos >= 0 and p >= peak_at_max_dd:
+            recovery_pos = i
+
+    if max_dd_pos == -1:
+        max_dd = np.nan
+    days_since_peak = n - 1 - last_peak_pos if last_peak_pos >= 0 else n
+    return max_dd, max_dd_pos, current_dd, days_since_peak, recovery_pos
+
+
+def _drawdown_scan_numpy(prices: np.ndarray) -> Tuple[float, int, float, int, int]:
+    """
+    Vectorized drawdown scan used when numba is not installed
+
+    Same contract as _drawdown_scan_loop.
+
+    Args:
+        prices: 1-D float64 array of closing prices
+
+    Returns:
+        (max_drawdown, max_drawdown_pos, current_drawdown, days_since_peak,
+        recovery_pos) with positions as -1 when not found
+    """
+    n = prices.size
+    if n == 0 or np.isnan(prices).all():
+        return float("nan"), -1, float("nan"), n, -1
+
+    # Running peak; fmax.accumulate skips NaN exactly like Series.cummax
+    running_max = np.fmax.accumulate(prices)
+    with np.errstate(invalid="ignore"):
+        drawdown = (prices - running_max) / running_max
+
+    max_dd_pos = int(np.nanargmin(drawdown))
+
+    at_peak = prices >= running_max
+    days_since_peak = int(np.argmax(at_peak[::-1]))
+
+    # argmax stops at the first True, so no index array is built for the recovery
+    recovered = prices[max_dd_pos:] >= running_max[max_dd_pos]
+    recovery_pos = max_dd_pos + int(np.argmax(recovered)) if recovered.any() else -1
+
+    return (
+        float(drawdown[max_dd_pos]),
+        max_dd_pos,
+        float(drawdown[-1]),
+        days_since_peak,
+        recovery_pos,
+    )
+
+
+def _mean_std_loop(r: np.ndarray) -> Tuple[float, float]:
+    """
+    Mean and sample std in one Welford pass (JIT-compiled when numba is installed)
+
+    Args:
+        r: 1-D float64 array
+
+    Returns:
+        (mean, std with ddof=1); NaN where undefined
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for x in r:
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+
+    if n == 0:
+        return np.nan, np.nan
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    return mean, std
+
+
+def _mean_downside_std_loop(r: np.ndarray, threshold: float) -> Tuple[float, float, int]:
+    """
+    Mean excess return and downside std in one pass (JIT-compiled when numba is installed)
+
+    Excess returns are r - threshold; the downside std is the sample std of the
+    negative excess returns, accumulated with Welford without materializing them.
+
+    Args:
+        r: 1-D float64 array of returns
+        threshold: Per-period return subtracted from r (e.g. daily risk-free rate)
+
+    Returns:
+        (mean excess return, downside std with ddof=1, number of negative excess returns)
+    """
+    n = 0
+    total = 0.0
+    n_neg = 0
+    neg_mean = 0.0
+    neg_m2 = 0.0
+    for x in r:
+        e = x - threshold
+        n += 1
+        total += e
+        if e < 0:
+            n_neg += 1
+            delta = e - neg_mean
+            neg_mean += delta / n_neg
+            neg_m2 += delta * (e - neg_mean)
+
+    mean = total / n if n > 0 else np.nan
+    downside_std = np.sqrt(neg_m2 / (n_neg - 1)) if n_neg > 1 else np.nan
+    return mean, downside_std, n_neg
+
+
+def _mean_std_numpy(r: np.ndarray) -> Tuple[float, float]:
+    """NumPy fallback for _mean_std_loop"""
+    if r.size == 0:
+        return float("nan"), float("nan")
+    std = float(r.std(ddof=1)) if r.size > 1 else float("nan")
+    return float(r.mean()), std
+
+
+def _mean_downside_std_numpy(r: np.ndarray, threshold: float) -> Tuple[float, float, int]:
+    """NumPy fallback for _mean_downside_std_loop"""
+    excess = r - threshold
+    downside = excess[excess < 0]
+    mean = float(excess.mean()) if excess.size else float("nan")
+    downside_std = float(downside.std(ddof=1)) if downside.size > 1 else float("nan")
+    return mean, downside_std, int(downside.size)
+
+
+# error_model="numpy" makes a zero close give NaN like pandas instead of raising
+if njit is not None:
+    _drawdown_scan = njit(cache=True, error_model="numpy")(_drawdown_scan_loop)
+    _mean_std = njit(cache=True, error_model="numpy")(_mean_std_loop)
+    _mean_downside_std = njit(cache=True, error_model="numpy")(_mean_downside_std_loop)
+else:
+    _drawdown_scan = _drawdown_scan_numpy
+    _mean_std = _mean_std_numpy
+    _mean_downside_std = _mean_downside_std_numpy
+
+
+def _align_returns(
+    stock_returns: pd.Series, benchmark_returns: pd.Series
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Align two NaN-free return series on their common dates
+
+    Both inputs come out of calculate_daily_returns (NaNs already dropped), so
+    aligning is just an index intersection; no intermediate DataFrame needed.
+
+    Args:
+        stock_returns: Daily returns of the stock
+        benchmark_returns: Daily returns of the benchmark
+
+    Returns:
+        (stock, benchmark) float64 arrays over the shared dates
+    """
+    common = stock_returns.index.intersection(benchmark_returns.index)
+    return (
+        stock_returns.reindex(common).to_numpy(dtype=np.float64),
+        benchmark_returns.reindex(common).to_numpy(dtype=np.float64),
+    )
+
+
+@lru_cache(maxsize=32)
+def _fetch_benchmark_prices(ticker: str, start: str, end: str) -> pd.DataFrame:
+    """
+    Fetch benchmark prices, memoized per process on ticker and date range
+
+    Lets repeated RiskMetrics instances (e.g. one per ticker in a batch run)
+    share a single benchmark download. Failed fetches raise and are not cached.
+
+    Args:
+        ticker: Benchmark ticker symbol
+        start: Start date (YYYY-MM-DD)
+        end: End date (YYYY-MM-DD)
+
+    Returns:
+        Benchmark price DataFrame (shared; callers must not mutate it)
+    """
+    from ..data_fetcher import DataFetcher
+
+    return DataFetcher().fetch_ticker(ticker, start=start, end=end)
+
 
 class RiskMetrics:
     """
@@ -56,12 +363,15 @@ class RiskMetrics:
         self.benchmark_data = benchmark_data
         self._cached_metrics: Optional[Dict[str, Any]] = None
 
-    def calculate_returns(self, price_data: pd.DataFrame) -> Dict[str, Any]:
+    def calculate_returns(
+        self, price_data: pd.DataFrame, daily_returns: Optional[pd.Series] = None
+    ) -> Dict[str, Any]:
         """
         Calculate return metrics
 
         Args:
             price_data: DataFrame with 'Close' prices and DatetimeIndex
+            daily_returns: Precomputed daily returns of Close (computed if None)
 
         Returns:
             Dictionary with daily, cumulative, and annualized returns
@@ -72,35 +382,39 @@ class RiskMetrics:
 
         try:
             # Daily returns
-            daily_returns = calculate_daily_returns(price_data)
+            if daily_returns is None:
+                daily_returns = calculate_daily_returns(price_data)
 
             if daily_returns.empty:
                 logger.warning("Insufficient data to calculate returns")
                 return {}
 
-            # Cumulative returns
-            prod_result = (1 + daily_returns).prod()
-            cumulative_return = to_float(prod_result) - 1.0
+            # Reduce on the raw ndarray (NaNs are already dropped)
+            r = daily_returns.to_numpy(dtype=np.float64)
+
+            # Cumulative returns (log-sum of growth factors; no product overflow on long series)
+            log_growth = float(np.log1p(r).sum())
+            cumulative_return = math.expm1(log_growth)
 
             # Annualized return
-            trading_days = len(daily_returns)
+            trading_days = r.size
             years = trading_days / TRADING_DAYS_PER_YEAR
-            annualized_return = (
-                float((1 + cumulative_return) ** (1 / years) - 1) if years > 0 else 0.0
-            )
+            annualized_return = math.expm1(log_growth / years) if years > 0 else 0.0
+
+            positive_days = int(np.count_nonzero(r > 0))
 
             # Return statistics
             return {
-                "daily_mean": to_float(daily_returns.mean()),
-                "daily_std": to_float(daily_returns.std()),
-                "daily_min": to_float(daily_returns.min()),
-                "daily_max": to_float(daily_returns.max()),
+                "daily_mean": float(r.mean()),
+                "daily_std": float(r.std(ddof=1)) if trading_days > 1 else float("nan"),
+                "daily_min": float(r.min()),
+                "daily_max": float(r.max()),
                 "cumulative_return": cumulative_return,
                 "annualized_return": annualized_return,
                 "total_trading_days": int(trading_days),
-                "positive_days": int((daily_returns > 0).sum()),
-                "negative_days": int((daily_returns < 0).sum()),
-                "win_rate": to_float((daily_returns > 0).sum() / len(daily_returns)),
+                "positive_days": positive_days,
+                "negative_days": int(np.count_nonzero(r < 0)),
+                "win_rate": positive_days / trading_days,
             }
 
         except Exception as e:
@@ -108,7 +422,10 @@ class RiskMetrics:
             return {}
 
     def calculate_volatility(
-        self, price_data: pd.DataFrame, window: Optional[int] = None
+        self,
+        price_data: pd.DataFrame,
+        window: Optional[int] = None,
+        daily_returns: Optional[pd.Series] = None,
     ) -> Dict[str, Any]:
         """
         Calculate volatility metrics
@@ -116,6 +433,7 @@ class RiskMetrics:
         Args:
             price_data: DataFrame with 'Close' prices
             window: Rolling window for volatility (None for full period)
+            daily_returns: Precomputed daily returns of Close (computed if None)
 
         Returns:
             Dictionary with volatility metrics
@@ -125,22 +443,26 @@ class RiskMetrics:
             return {}
 
         try:
-            daily_returns = price_data["Close"].pct_change().dropna()
+            if daily_returns is None:
+                daily_returns = calculate_daily_returns(price_data)
 
             if daily_returns.empty:
                 return {}
 
+            r = daily_returns.to_numpy(dtype=np.float64)
+
             # Annualized volatility (252 trading days)
-            daily_vol = daily_returns.std()
-            annualized_vol = annualize_volatility(to_float(daily_vol))
+            daily_vol = float(r.std(ddof=1)) if r.size > 1 else float("nan")
+            annualized_vol = annualize_volatility(daily_vol)
 
             # Downside deviation (only negative returns)
-            downside_returns = daily_returns[daily_returns < 0]
-            downside_deviation = (
-                annualize_volatility(to_float(downside_returns.std()))
-                if len(downside_returns) > 0
-                else 0.0
-            )
+            downside_returns = r[r < 0]
+            if downside_returns.size > 1:
+                downside_deviation = annualize_volatility(float(downside_returns.std(ddof=1)))
+            elif downside_returns.size == 1:
+                downside_deviation = float("nan")
+            else:
+                downside_deviation = 0.0
 
             metrics = {
                 "daily_volatility": float(daily_vol),
@@ -150,10 +472,10 @@ class RiskMetrics:
 
             # Rolling volatility if window specified
             if window and window > 0 and len(daily_returns) >= window:
-                rolling_vol = daily_returns.rolling(window=window).std() * np.sqrt(
-                    TRADING_DAYS_PER_YEAR
+                rolling_vol = (
+                    daily_returns.rolling(window=window).std() * SQRT_TRADING_DAYS_PER_YEAR
                 )
-                metrics["rolling_volatility_current"] = to_float(rolling_vol.iloc[-1])
+                metrics["rolling_volatility_current"] = to_float(rolling_vol.iat[-1])
                 metrics["rolling_volatility_mean"] = to_float(rolling_vol.mean())
                 metrics["rolling_volatility_max"] = to_float(rolling_vol.max())
 
@@ -164,7 +486,10 @@ class RiskMetrics:
             return {}
 
     def calculate_sharpe_ratio(
-        self, price_data: pd.DataFrame, risk_free_rate: Optional[float] = None
+        self,
+        price_data: pd.DataFrame,
+        risk_free_rate: Optional[float] = None,
+        daily_returns: Optional[pd.Series] = None,
     ) -> float:
         """
         Calculate Sharpe Ratio (risk-adjusted return)
@@ -172,6 +497,7 @@ class RiskMetrics:
         Args:
             price_data: DataFrame with 'Close' prices
             risk_free_rate: Annual risk-free rate (uses config default if None)
+            daily_returns: Precomputed daily returns of Close (computed if None)
 
         Returns:
             Sharpe ratio (annualized)
@@ -181,9 +507,15 @@ class RiskMetrics:
             return 0.0
 
         try:
-            daily_returns = price_data["Close"].pct_change().dropna()
+            if daily_returns is None:
+                daily_returns = calculate_daily_returns(price_data)
+
+            if daily_returns.empty:
+                return 0.0
 
-            if daily_returns.empty or daily_returns.std() == 0:
+            # Mean and std in one pass; excess returns share the std of the raw returns
+            mean_return, std_return = _mean_std(daily_returns.to_numpy(dtype=np.float64))
+            if std_return == 0:
                 return 0.0
 
             # Use config risk-free rate if not specified
@@ -192,11 +524,8 @@ class RiskMetrics:
             # Convert annual risk-free rate to daily
             daily_rf = convert_annual_to_daily_rate(rf_rate)
 
-            # Excess returns
-            excess_returns = daily_returns - daily_rf
-
-            # Sharpe ratio (annualized)
-            sharpe = (excess_returns.mean() / excess_returns.std()) * np.sqrt(TRADING_DAYS_PER_YEAR)
+            # Sharpe ratio (annualized) on excess returns
+            sharpe = ((mean_return - daily_rf) / std_return) * SQRT_TRADING_DAYS_PER_YEAR
 
             return to_float(sharpe)
 
@@ -205,7 +534,10 @@ class RiskMetrics:
             return 0.0
 
     def calculate_sortino_ratio(
-        self, price_data: pd.DataFrame, risk_free_rate: Optional[float] = None
+        self,
+        price_data: pd.DataFrame,
+        risk_free_rate: Optional[float] = None,
+        daily_returns: Optional[pd.Series] = None,
     ) -> float:
         """
         Calculate Sortino Ratio (downside risk-adjusted return)
@@ -213,6 +545,7 @@ class RiskMetrics:
         Args:
             price_data: DataFrame with 'Close' prices
             risk_free_rate: Annual risk-free rate (uses config default if None)
+            daily_returns: Precomputed daily returns of Close (computed if None)
 
         Returns:
             Sortino ratio (annualized)
@@ -222,7 +555,8 @@ class RiskMetrics:
             return 0.0
 
         try:
-            daily_returns = price_data["Close"].pct_change().dropna()
+            if daily_returns is None:
+                daily_returns = calculate_daily_returns(price_data)
 
             if daily_returns.empty:
                 return 0.0
@@ -233,18 +567,15 @@ class RiskMetrics:
             # Convert annual risk-free rate to daily
             daily_rf = convert_annual_to_daily_rate(rf_rate)
 
-            # Excess returns
-            excess_returns = daily_returns - daily_rf
-
-            # Downside deviation (only negative excess returns)
-            downside_returns = excess_returns[excess_returns < 0]
-            if len(downside_returns) == 0 or downside_returns.std() == 0:
+            # Mean excess return and downside deviation (only negative excess returns)
+            mean_excess, downside_std, downside_count = _mean_downside_std(
+                daily_returns.to_numpy(dtype=np.float64), daily_rf
+            )
+            if downside_count == 0 or downside_std == 0:
                 return 0.0
 
-            downside_std = downside_returns.std()
-
             # Sortino ratio (annualized)
-            sortino = (excess_returns.mean() / downside_std) * np.sqrt(TRADING_DAYS_PER_YEAR)
+            sortino = (mean_excess / downside_std) * SQRT_TRADING_DAYS_PER_YEAR
 
             return to_float(sortino)
 
@@ -252,12 +583,15 @@ class RiskMetrics:
             logger.error(f"Error calculating Sortino ratio: {e}")
             return 0.0
 
-    def calculate_drawdown(self, price_data: pd.DataFrame) -> Dict[str, Any]:
+    def calculate_drawdown(
+        self, price_data: pd.DataFrame, closes: Optional[np.ndarray] = None
+    ) -> Dict[str, Any]:
         """
         Calculate drawdown metrics
 
         Args:
             price_data: DataFrame with 'Close' prices
+            closes: Precomputed float64 ndarray of Close (extracted if None)
 
         Returns:
             Dictionary with maximum drawdown, current drawdown, recovery time
@@ -267,38 +601,27 @@ class RiskMetrics:
             return {}
 
         try:
-            prices = price_data["Close"]
-
-            # Running maximum (peak)
-            running_max = prices.expanding().max()
+            if closes is None:
+                closes = price_data["Close"].to_numpy(dtype=np.float64)
+            dates = price_data.index
 
-            # Drawdown from peak
-            drawdown = (prices - running_max) / running_max
-
-            # Maximum drawdown
-            max_drawdown = float(drawdown.min())
-            max_dd_date = format_date(drawdown.idxmin(), "iso") if not drawdown.empty else None
-
-            # Current drawdown
-            current_drawdown = float(drawdown.iloc[-1])
-
-            # Days since peak
-            days_since_peak = 0
-            for i in range(len(prices) - 1, -1, -1):
-                if prices.iloc[i] >= running_max.iloc[i]:
-                    break
-                days_since_peak += 1
+            # One sweep for peak, max drawdown, current drawdown and recovery
+            max_drawdown, max_dd_pos, current_drawdown, days_since_peak, recovery_pos = (
+                _drawdown_scan(closes)
+            )
+            max_drawdown = float(max_drawdown)
+            current_drawdown = float(current_drawdown)
+            days_since_peak = int(days_since_peak)
 
-            # Recovery analysis (time from max drawdown to recovery)
+            max_dd_date = None
             recovery_days = None
-            if max_dd_date:
-                max_dd_idx = drawdown.idxmin()
-                # Find when price recovered to pre-drawdown peak
-                peak_before_dd = running_max.loc[:max_dd_idx].iloc[-1]
-                prices_after = prices.loc[max_dd_idx:]
-                recovery_idx = prices_after[prices_after >= peak_before_dd].first_valid_index()
-                if recovery_idx is not None:
-                    recovery_days = int((recovery_idx - max_dd_idx).days)
+            if max_dd_pos >= 0:
+                max_dd_idx = dates[max_dd_pos]
+                max_dd_date = format_date(max_dd_idx, "iso")
+
+                # Time from max drawdown until price regained the pre-drawdown peak
+                if recovery_pos >= 0:
+                    recovery_days = int((dates[recovery_pos] - max_dd_idx).days)
 
             return {
                 "max_drawdown": max_drawdown,
@@ -313,8 +636,38 @@ class RiskMetrics:
             logger.error(f"Error calculating drawdown: {e}")
             return {}
 
+    def _fetch_benchmark(self, price_data: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Fetch benchmark prices covering the same dates as price_data
+
+        Args:
+            price_data: DataFrame with DatetimeIndex
+
+        Returns:
+            Benchmark DataFrame, or None if the fetch fails or the index is not dates
+        """
+        if not isinstance(price_data.index, pd.DatetimeIndex):
+            logger.warning("Price data has no DatetimeIndex, skipping benchmark fetch")
+            return None
+
+        start_date = price_data.index.min()
+        end_date = price_data.index.max()
+        try:
+            data = _fetch_benchmark_prices(
+                self.config.benchmark_ticker,
+                start_date.strftime("%Y-%m-%d"),
+                end_date.strftime("%Y-%m-%d"),
+            )
+            return data.copy(deep=False)
+        except (ValueError, ConnectionError, RuntimeError) as e:
+            logger.warning(f"Could not fetch benchmark {self.config.benchmark_ticker}: {e}")
+            return None
+
     def calculate_beta_alpha(
-        self, price_data: pd.DataFrame, benchmark_data: Optional[pd.DataFrame] = None
+        self,
+        price_data: pd.DataFrame,
+        benchmark_data: Optional[pd.DataFrame] = None,
+        daily_returns: Optional[pd.Series] = None,
     ) -> Dict[str, Any]:
         """
         Calculate Beta and Alpha vs benchmark
@@ -322,6 +675,7 @@ class RiskMetrics:
         Args:
             price_data: DataFrame with 'Close' prices
             benchmark_data: DataFrame with benchmark 'Close' prices (fetches if None)
+            daily_returns: Precomputed daily returns of Close (computed if None)
 
         Returns:
             Dictionary with beta, alpha, correlation
@@ -333,55 +687,50 @@ class RiskMetrics:
         try:
             # Fetch benchmark data if not provided
             if benchmark_data is None or benchmark_data.empty:
-                from ..data_fetcher import DataFetcher
-
-                fetcher = DataFetcher()
-                benchmark_ticker = self.config.benchmark_ticker
-
-                # Match period with price_data
-                start_date = price_data.index[0]
-                end_date = price_data.index[-1]
-
-                benchmark_data = fetcher.fetch_ticker(
-                    benchmark_ticker,
-                    start=start_date.strftime("%Y-%m-%d"),
-                    end=end_date.strftime("%Y-%m-%d"),
-                )
+                benchmark_data = self._fetch_benchmark(price_data)
 
                 if benchmark_data is None or benchmark_data.empty:
-                    logger.warning(f"Could not fetch benchmark data for {benchmark_ticker}")
+                    logger.warning(
+                        f"Could not fetch benchmark data for {self.config.benchmark_ticker}"
+                    )
                     return {}
 
             # Calculate returns
-            stock_returns = price_data["Close"].pct_change().dropna()
-            benchmark_returns = benchmark_data["Close"].pct_change().dropna()
+            stock_returns = (
+                daily_returns if daily_returns is not None else calculate_daily_returns(price_data)
+            )
+            benchmark_returns = calculate_daily_returns(benchmark_data)
 
             # Align dates
-            aligned = pd.DataFrame(
-                {"stock": stock_returns, "benchmark": benchmark_returns}
-            ).dropna()
+            s, b = _align_returns(stock_returns, benchmark_returns)
 
-            if aligned.empty or len(aligned) < 2:
+            if s.size < 2:
                 logger.warning("Insufficient overlapping data for beta/alpha")
                 return {}
 
+            # Covariance matrix gives both variances and the covariance in one call
+            cov_matrix = np.cov(s, b, ddof=1)
+            stock_variance = float(cov_matrix[0, 0])
+            benchmark_variance = float(cov_matrix[1, 1])
+            covariance = float(cov_matrix[0, 1])
+
             # Beta (covariance / variance)
-            covariance = float(aligned["stock"].cov(aligned["benchmark"]))
-            bm_var_result = aligned["benchmark"].var()
-            benchmark_variance = (
-                float(bm_var_result) if isinstance(bm_var_result, (int, float, np.number)) else 0.0
-            )
             beta = covariance / benchmark_variance if benchmark_variance != 0 else 0.0
 
             # Alpha (annualized)
-            stock_mean_return = float(aligned["stock"].mean()) * TRADING_DAYS_PER_YEAR
-            benchmark_mean_return = float(aligned["benchmark"].mean()) * TRADING_DAYS_PER_YEAR
+            stock_mean_return = float(s.mean()) * TRADING_DAYS_PER_YEAR
+            benchmark_mean_return = float(b.mean()) * TRADING_DAYS_PER_YEAR
             rf_rate = self.config.risk_free_rate / 100
 
             alpha = stock_mean_return - (rf_rate + beta * (benchmark_mean_return - rf_rate))
 
             # Correlation
-            correlation = float(aligned["stock"].corr(aligned["benchmark"]))
+            variance_product = stock_variance * benchmark_variance
+            correlation = (
+                covariance / float(np.sqrt(variance_product))
+                if variance_product > 0
+                else float("nan")
+            )
 
             # R-squared
             r_squared = correlation**2
@@ -399,7 +748,10 @@ class RiskMetrics:
             return {}
 
     def calculate_var(
-        self, price_data: pd.DataFrame, confidence_level: float = 0.95
+        self,
+        price_data: pd.DataFrame,
+        confidence_level: float = 0.95,
+        daily_returns: Optional[pd.Series] = None,
     ) -> Dict[str, Any]:
         """
         Calculate Value at Risk (VaR) and Conditional VaR (CVaR)
@@ -407,6 +759,7 @@ class RiskMetrics:
         Args:
             price_data: DataFrame with 'Close' prices
             confidence_level: Confidence level (default 0.95 for 95%)
+            daily_returns: Precomputed daily returns of Close (computed if None)
 
         Returns:
             Dictionary with VaR and CVaR at specified confidence level
@@ -416,24 +769,26 @@ class RiskMetrics:
             return {}
 
         try:
-            daily_returns = price_data["Close"].pct_change().dropna()
+            if daily_returns is None:
+                daily_returns = calculate_daily_returns(price_data)
 
             if daily_returns.empty:
                 return {}
 
+            # Sort once: VaR, CVaR and the worst day all come from the sorted returns
+            r_sorted = np.sort(daily_returns.to_numpy(dtype=np.float64))
+
             # Historical VaR (percentile of returns)
-            var = float(np.percentile(daily_returns, (1 - confidence_level) * 100))
+            var = float(np.percentile(r_sorted, (1 - confidence_level) * 100))
 
-            # CVaR (expected shortfall - mean of returns below VaR)
-            returns_below_var = daily_returns[daily_returns <= var]
-            cvar = float(returns_below_var.mean()) if len(returns_below_var) > 0 else var
+            # CVaR (expected shortfall - mean of returns at or below VaR)
+            k = int(np.searchsorted(r_sorted, var, side="right"))
+            cvar = float(r_sorted[:k].mean()) if k > 0 else var
 
             # Parametric VaR (assumes normal distribution)
-            mean_return = float(daily_returns.mean())
-            std_return = float(daily_returns.std())
-            z_score = np.abs(
-                np.percentile(np.random.standard_normal(10000), (1 - confidence_level) * 100)
-            )
+            mean_return = float(r_sorted.mean())
+            std_return = float(r_sorted.std(ddof=1)) if r_sorted.size > 1 else float("nan")
+            z_score = _normal_z_score(confidence_level)
             parametric_var = mean_return - z_score * std_return
 
             return {
@@ -441,7 +796,7 @@ class RiskMetrics:
                 "var_historical": var,
                 "cvar_historical": cvar,
                 "var_parametric": parametric_var,
-                "worst_day": float(daily_returns.min()),
+                "worst_day": float(r_sorted[0]),
             }
 
         except Exception as e:
@@ -449,7 +804,10 @@ class RiskMetrics:
             return {}
 
     def calculate_information_ratio(
-        self, price_data: pd.DataFrame, benchmark_data: Optional[pd.DataFrame] = None
+        self,
+        price_data: pd.DataFrame,
+        benchmark_data: Optional[pd.DataFrame] = None,
+        daily_returns: Optional[pd.Series] = None,
     ) -> float:
         """
         Calculate Information Ratio (active return / tracking error)
@@ -460,6 +818,7 @@ class RiskMetrics:
         Args:
             price_data: DataFrame with 'Close' prices
             benchmark_data: DataFrame with benchmark 'Close' prices (fetches if None)
+            daily_returns: Precomputed daily returns of Close (computed if None)
 
         Returns:
             Information ratio
@@ -471,47 +830,36 @@ class RiskMetrics:
         try:
             # Fetch benchmark if not provided
             if benchmark_data is None or benchmark_data.empty:
-                from .data_fetcher import DataFetcher
-
-                fetcher = DataFetcher()
-                start_date = price_data.index.min()
-                end_date = price_data.index.max()
-                benchmark_data = fetcher.fetch_ticker(
-                    self.config.benchmark_ticker,
-                    start=start_date.strftime("%Y-%m-%d"),
-                    end=end_date.strftime("%Y-%m-%d"),
-                )
+                benchmark_data = self._fetch_benchmark(price_data)
 
             if benchmark_data is None or benchmark_data.empty:
                 logger.warning("Benchmark data not available for Information Ratio")
                 return 0.0
 
             # Calculate daily returns
-            stock_returns = price_data["Close"].pct_change().dropna()
-            benchmark_returns = benchmark_data["Close"].pct_change().dropna()
+            stock_returns = (
+                daily_returns if daily_returns is not None else calculate_daily_returns(price_data)
+            )
+            benchmark_returns = calculate_daily_returns(benchmark_data)
 
             # Align data
-            aligned = pd.DataFrame(
-                {"stock": stock_returns, "benchmark": benchmark_returns}
-            ).dropna()
+            s, b = _align_returns(stock_returns, benchmark_returns)
 
-            if aligned.empty or len(aligned) < 2:
+            if s.size < 2:
                 return 0.0
 
             # Active returns (excess return over benchmark)
-            active_returns = aligned["stock"] - aligned["benchmark"]
+            active_returns = s - b
 
             # Tracking error (volatility of active returns)
-            tracking_error = active_returns.std()
+            tracking_error = float(active_returns.std(ddof=1))
 
             if tracking_error == 0:
                 return 0.0
 
             # Information Ratio (annualized)
-            mean_active_return = active_returns.mean()
-            information_ratio = (mean_active_return / tracking_error) * np.sqrt(
-                TRADING_DAYS_PER_YEAR
-            )
+            mean_active_return = float(active_returns.mean())
+            information_ratio = (mean_active_return / tracking_error) * SQRT_TRADING_DAYS_PER_YEAR
 
             return to_float(information_ratio)
 
@@ -519,7 +867,14 @@ class RiskMetrics:
             logger.error(f"Error calculating Information Ratio: {e}")
             return 0.0
 
-    def calculate_calmar_ratio(self, price_data: pd.DataFrame) -> float:
+    def calculate_calmar_ratio(
+        self,
+        price_data: pd.DataFrame,
+        daily_returns: Optional[pd.Series] = None,
+        closes: Optional[np.ndarray] = None,
+        returns_metrics: Optional[Dict[str, Any]] = None,
+        drawdown_metrics: Optional[Dict[str, Any]] = None,
+    ) -> float:
         """
         Calculate Calmar Ratio (annualized return / max drawdown)
 
@@ -528,6 +883,10 @@ class RiskMetrics:
 
         Args:
             price_data: DataFrame with 'Close' prices
+            daily_returns: Precomputed daily returns of Close (computed if None)
+            closes: Precomputed float64 ndarray of Close (extracted if None)
+            returns_metrics: Precomputed calculate_returns result (computed if None)
+            drawdown_metrics: Precomputed calculate_drawdown result (computed if None)
 
         Returns:
             Calmar ratio
@@ -538,11 +897,13 @@ class RiskMetrics:
 
         try:
             # Get annualized return
-            returns_metrics = self.calculate_returns(price_data)
+            if returns_metrics is None:
+                returns_metrics = self.calculate_returns(price_data, daily_returns=daily_returns)
             annualized_return = returns_metrics.get("annualized_return", 0.0)
 
             # Get max drawdown
-            drawdown_metrics = self.calculate_drawdown(price_data)
+            if drawdown_metrics is None:
+                drawdown_metrics = self.calculate_drawdown(price_data, closes=closes)
             max_drawdown = abs(drawdown_metrics.get("max_drawdown", 0.0))
 
             if max_drawdown == 0:
@@ -557,7 +918,10 @@ class RiskMetrics:
             return 0.0
 
     def calculate_rolling_ratios(
-        self, price_data: pd.DataFrame, windows: List[int] = [30, 60, 90]
+        self,
+        price_data: pd.DataFrame,
+        windows: List[int] = [30, 60, 90],
+        daily_returns: Optional[pd.Series] = None,
     ) -> Dict[str, Any]:
         """
         Calculate rolling Sharpe and Sortino ratios over different windows
@@ -565,6 +929,7 @@ class RiskMetrics:
         Args:
             price_data: DataFrame with 'Close' prices
             windows: List of rolling window sizes in days
+            daily_returns: Precomputed daily returns of Close (computed if None)
 
         Returns:
             Dictionary with rolling ratio statistics for each window
@@ -574,7 +939,8 @@ class RiskMetrics:
             return {}
 
         try:
-            daily_returns = price_data["Close"].pct_change().dropna()
+            if daily_returns is None:
+                daily_returns = calculate_daily_returns(price_data)
 
             if len(daily_returns) < max(windows):
                 logger.warning(f"Insufficient data for rolling ratios (need {max(windows)} days)")
@@ -584,6 +950,10 @@ class RiskMetrics:
             rf_rate = self.config.risk_free_rate
             daily_rf = convert_annual_to_daily_rate(rf_rate)
 
+            # Rolling series tolerate float32; the headline ratios stay float64
+            dtype = np.float32 if self.config.fast_math else np.float64
+            excess_returns = (daily_returns - daily_rf).astype(dtype)
+
             results = {}
 
             for window in windows:
@@ -591,22 +961,27 @@ class RiskMetrics:
                     continue
 
                 # Rolling Sharpe
-                excess_returns = daily_returns - daily_rf
-                rolling_mean = excess_returns.rolling(window=window).mean()
-                rolling_std = excess_returns.rolling(window=window).std()
-                rolling_sharpe = (rolling_mean / rolling_std) * np.sqrt(TRADING_DAYS_PER_YEAR)
+                if bn is not None:
+                    r = excess_returns.to_numpy()
+                    rolling_mean = pd.Series(
+                        bn.move_mean(r, window=window, min_count=window),
+                        index=excess_returns.index,
+                    )
+                    rolling_std = pd.Series(
+                        bn.move_std(r, window=window, min_count=window, ddof=1),
+                        index=excess_returns.index,
+                    )
+                else:
+                    rolling_mean = excess_returns.rolling(window=window).mean()
+                    rolling_std = excess_returns.rolling(window=window).std()
+                rolling_sharpe = (rolling_mean / rolling_std) * SQRT_TRADING_DAYS_PER_YEAR
 
                 # Rolling Sortino
-                def calculate_downside_std(window_returns):
-                    downside = window_returns[window_returns < 0]
-                    return downside.std() if len(downside) > 0 else np.nan
-
-                rolling_downside_std = excess_returns.rolling(window=window).apply(
-                    calculate_downside_std, raw=False
-                )
-                rolling_sortino = (rolling_mean / rolling_downside_std) * np.sqrt(
-                    TRADING_DAYS_PER_YEAR
+                rolling_downside_std = pd.Series(
+                    _rolling_downside_std(excess_returns.to_numpy(), window),
+                    index=excess_returns.index,
                 )
+                rolling_sortino = (rolling_mean / rolling_downside_std) * SQRT_TRADING_DAYS_PER_YEAR
 
                 # Drop NaN values
                 rolling_sharpe = rolling_sharpe.dropna()
@@ -614,7 +989,7 @@ class RiskMetrics:
 
                 if not rolling_sharpe.empty:
                     results[f"sharpe_{window}d"] = {
-                        "current": to_float(rolling_sharpe.iloc[-1]),
+                        "current": to_float(rolling_sharpe.iat[-1]),
                         "mean": to_float(rolling_sharpe.mean()),
                         "min": to_float(rolling_sharpe.min()),
                         "max": to_float(rolling_sharpe.max()),
@@ -623,7 +998,7 @@ class RiskMetrics:
 
                 if not rolling_sortino.empty:
                     results[f"sortino_{window}d"] = {
-                        "current": to_float(rolling_sortino.iloc[-1]),
+                        "current": to_float(rolling_sortino.iat[-1]),
                         "mean": to_float(rolling_sortino.mean()),
                         "min": to_float(rolling_sortino.min()),
                         "max": to_float(rolling_sortino.max()),
@@ -637,7 +1012,10 @@ class RiskMetrics:
             return {}
 
     def calculate_all_metrics(
-        self, price_data: Optional[pd.DataFrame] = None, benchmark_data: Optional[pd.DataFrame] = None
+        self,
+        price_data: Optional[pd.DataFrame] = None,
+        benchmark_data: Optional[pd.DataFrame] = None,
+        parallel: bool = True,
     ) -> Dict[str, Any]:
         """
         Calculate all risk metrics
@@ -647,6 +1025,8 @@ class RiskMetrics:
                         If None, uses self.price_data from __init__.
             benchmark_data: Optional benchmark data for beta/alpha (fetches if None).
                            If None, uses self.benchmark_data from __init__.
+            parallel: Compute long histories on a thread pool. Pass False when the
+                      caller already runs this on a worker thread.
 
         Returns:
             Dictionary with all risk and performance metrics
@@ -662,20 +1042,66 @@ class RiskMetrics:
             return {}
 
         try:
-            metrics = {
-                "returns": self.calculate_returns(price_data),
-                "volatility": self.calculate_volatility(price_data),
-                "sharpe_ratio": self.calculate_sharpe_ratio(price_data),
-                "sortino_ratio": self.calculate_sortino_ratio(price_data),
-                "information_ratio": self.calculate_information_ratio(price_data, benchmark_data),
-                "calmar_ratio": self.calculate_calmar_ratio(price_data),
-                "drawdown": self.calculate_drawdown(price_data),
-                "market_risk": self.calculate_beta_alpha(price_data, benchmark_data),
-                "var_95": self.calculate_var(price_data, confidence_level=0.95),
-                "var_99": self.calculate_var(price_data, confidence_level=0.99),
-                "rolling_ratios": self.calculate_rolling_ratios(price_data),
+            # Fetch the benchmark once for both beta/alpha and the information ratio
+            if benchmark_data is None or benchmark_data.empty:
+                benchmark_data = self._fetch_benchmark(price_data)
+
+            # Extract Close and compute daily returns once, shared across all metrics
+            closes: Optional[np.ndarray] = None
+            rets: Optional[pd.Series] = None
+            if "Close" in price_data.columns:
+                closes = np.ascontiguousarray(price_data["Close"].to_numpy(dtype=np.float64))
+                rets = calculate_daily_returns(price_data)
+
+            # Ratio metrics return floats, the rest return dicts
+            tasks: Dict[str, Callable[[], Any]] = {
+                "returns": partial(self.calculate_returns, price_data, daily_returns=rets),
+                "volatility": partial(self.calculate_volatility, price_data, daily_returns=rets),
+                "sharpe_ratio": partial(
+                    self.calculate_sharpe_ratio, price_data, daily_returns=rets
+                ),
+                "sortino_ratio": partial(
+                    self.calculate_sortino_ratio, price_data, daily_returns=rets
+                ),
+                "information_ratio": partial(
+                    self.calculate_information_ratio, price_data, benchmark_data, daily_returns=rets
+                ),
+                "drawdown": partial(self.calculate_drawdown, price_data, closes=closes),
+                "market_risk": partial(
+                    self.calculate_beta_alpha, price_data, benchmark_data, daily_returns=rets
+                ),
+                "var_95": partial(
+                    self.calculate_var, price_data, confidence_level=0.95, daily_returns=rets
+                ),
+                "var_99": partial(
+                    self.calculate_var, price_data, confidence_level=0.99, daily_returns=rets
+                ),
+                "rolling_ratios": partial(
+                    self.calculate_rolling_ratios, price_data, daily_returns=rets
+                ),
             }
 
+            # Short histories finish faster serially than it takes to start a pool
+            results: Dict[str, Any]
+            if not parallel or len(price_data) < PARALLEL_MIN_ROWS:
+                results = {name: fn() for name, fn in tasks.items()}
+            else:
+                results = {}
+                with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as executor:
+                    futures = {executor.submit(fn): name for name, fn in tasks.items()}
+                    for future in as_completed(futures):
+                        results[futures[future]] = future.result()
+
+            # Calmar reuses the returns and drawdown results instead of recomputing them
+            results["calmar_ratio"] = self.calculate_calmar_ratio(
+                price_data,
+                returns_metrics=results["returns"],
+                drawdown_metrics=results["drawdown"],
+            )
+
+            # Rebuild in report order so it doesn't depend on completion order
+            metrics = {name: results[name] for name in METRIC_ORDER}
+
             self._cached_metrics = metrics
             logger.info("Risk metrics calculation complete")
             return metrics
@@ -13,6 +13,7 @@ import pandas as pd
 from ta import momentum, trend, volatility, volume
 
 from ..config import AnalysisConfig, get_config
+from ..utils.financial import annualize_volatility, daily_return_std
 from ..utils.report import get_currency_symbol
 from ..utils.serialization import format_date
 
@@ -53,6 +54,10 @@ class TechnicalAnalyzer:
         self.currency = currency
         self.config = config or get_config()
 
+        # Results cached after the first computation
+        self._indicators_calculated = False
+        self._statistics: Optional[Dict[str, Any]] = None
+
     # ==================== Trend Indicators ====================
 
     def calculate_moving_averages(
@@ -258,12 +263,13 @@ class TechnicalAnalyzer:
         if self.df.empty:
             return {}
 
+        # Statistics only depend on Close/Volume, which indicators never modify
+        if self._statistics is not None:
+            return self._statistics
+
         close_prices = self.df["Close"]
         volume = self.df["Volume"]
 
-        # Calculate returns
-        returns = close_prices.pct_change().dropna()
-
         # Price statistics
         current_price = float(close_prices.iloc[-1])
         max_price = float(close_prices.max())
@@ -276,8 +282,8 @@ class TechnicalAnalyzer:
         period_return = ((current_price - start_price) / start_price) * 100
 
         # Volatility (annualized from daily returns)
-        daily_volatility = float(returns.std())
-        annual_volatility = daily_volatility * (252**0.5) * 100  # 252 trading days
+        daily_volatility = daily_return_std(close_prices)
+        annual_volatility = annualize_volatility(daily_volatility) * 100
 
         # Volume statistics
         avg_volume = float(volume.mean())
@@ -290,7 +296,7 @@ class TechnicalAnalyzer:
         min_price_date = format_date(close_prices.idxmin())
         max_volume_date = format_date(volume.idxmax())
 
-        return {
+        self._statistics = {
             "price": {
                 "current": current_price,
                 "high": max_price,
@@ -318,6 +324,8 @@ class TechnicalAnalyzer:
             },
         }
 
+        return self._statistics
+
     # ==================== All-in-One Methods ====================
 
     def calculate_all_indicators(self) -> pd.DataFrame:
@@ -327,6 +335,9 @@ class TechnicalAnalyzer:
         Returns:
             DataFrame with all indicators added
         """
+        if self._indicators_calculated:
+            return self.df
+
         logger.info("Calculating all technical indicators...")
         cfg = self.config
 
@@ -357,6 +368,7 @@ class TechnicalAnalyzer:
         self.calculate_mfi()
 
         logger.info(f"Calculated {len(self.df.columns) - 6} indicators")  # Subtract OHLCV + 1
+        self._indicators_calculated = True
         return self.df
 
     def get_latest_values(self) -> Dict[str, Any]:
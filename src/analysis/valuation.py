@@ -4,16 +4,219 @@ Performs intrinsic value estimation and dividend/earnings analysis
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import math
+import re
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
 from ..utils.dataframe_utils import normalize_datetime_index, safe_get_dataframe_value
 from ..utils.financial import calculate_cagr, to_float
+from ..utils.report import get_currency_symbol
 
 logger = logging.getLogger(__name__)
 
+_CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+# Payments that make up one year of dividends, by detected payment frequency
+_PAYMENTS_PER_YEAR = {"annual": 1, "semi-annual": 2, "quarterly": 4, "monthly": 12}
+
+# Field names used for operating cash flow across data providers, in order of preference
+_OCF_FIELDS = (
+    "Operating Cash Flow",
+    "Cash From Operating Activities",
+    "Cash Flowsfromusedin Operating Activities Direct",
+    "Total Cash From Operating Activities",
+    "Net Cash Provided By Operating Activities",
+)
+
+# Markdown table pieces shared by the valuation sections
+_METRIC_TABLE_HEADER = ("| Metric | Value |", "|--------|-------|")
+_MONEY_ROW = "| {} | {}{:,.2f} |"
+
+# Sustainability score cut-offs (a score equal to a threshold earns the higher label)
+_RATING_THRESHOLDS = (20, 40, 60, 80)
+_RATING_LABELS = ("High Risk", "Poor", "Fair", "Good", "Excellent")
+
+# 1-year EPS growth cut-offs in percent (growth must exceed a threshold to earn the higher label)
+_TREND_THRESHOLDS = (-10.0, 0.0, 10.0)
+_TREND_LABELS = ("Declining", "Slight Decline", "Moderate Growth", "Strong Growth")
+
+# Operating cash flow / net income cut-offs and the (score, assessment) each band earns
+_QUALITY_THRESHOLDS = (0.8, 1.0, 1.2)
+_QUALITY_GRADES = (
+    (25, "Low Quality (weak cash flow)"),
+    (50, "Fair Quality (moderate cash backing)"),
+    (75, "Good Quality (cash flow matches earnings)"),
+    (90, "High Quality (strong cash backing)"),
+)
+
+
+def _numeric_column(df: pd.DataFrame, column: str, default: float) -> np.ndarray:
+    """
+    Column as a float64 array (non-numeric entries become NaN, a missing column the default)
+
+    Args:
+        df: Source DataFrame
+        column: Column name
+        default: Fill value when the column does not exist
+
+    Returns:
+        Float64 ndarray with one value per row
+    """
+    if column not in df.columns:
+        return np.full(len(df), default, dtype=np.float64)
+    return pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=np.float64)
+
+
+def _statement_row(df: Optional[pd.DataFrame], label: str) -> Optional[np.ndarray]:
+    """
+    Financial statement row as a float64 array (non-numeric entries become NaN)
+
+    Args:
+        df: Financial statement DataFrame (rows are line items, columns are periods)
+        label: Row label
+
+    Returns:
+        Float64 ndarray with one value per period, or None if the row is missing
+    """
+    if df is None or df.empty or label not in df.index:
+        return None
+    row = df.loc[label]
+    if isinstance(row, pd.DataFrame):  # duplicated label, keep the first row
+        row = row.iloc[0]
+    return pd.to_numeric(row, errors="coerce").to_numpy(dtype=np.float64)
+
+
+def _row_value(row: Optional[np.ndarray], col_index: int) -> Optional[float]:
+    """Value at a period position of a statement row (None if out of range or NaN)"""
+    if row is None or col_index >= row.size:
+        return None
+    value = float(row[col_index])
+    return None if math.isnan(value) else value
+
+
+def _first_row_value(rows: Tuple[Optional[np.ndarray], ...], col_index: int) -> Optional[float]:
+    """First non-missing value at a period position across fallback statement rows"""
+    for row in rows:
+        value = _row_value(row, col_index)
+        if value is not None:
+            return value
+    return None
+
+
+def _as_float(value: Any) -> float:
+    """to_float with an inline fast path for values that are already Python floats"""
+    return value if type(value) is float else to_float(value)
+
+
+@lru_cache(maxsize=128)
+def _to_snake(key: str) -> str:
+    """Convert a camelCase info key to snake_case (e.g. dividendYield -> dividend_yield)"""
+    return _CAMEL_BOUNDARY.sub("_", key).lower()
+
+
+def _sustainability_score_kernel(payout: float, growth: float, consecutive: int) -> int:
+    """
+    0-100 dividend sustainability score (JIT-compiled when numba is installed)
+
+    Args:
+        payout: Payout ratio in percent (NaN if unknown)
+        growth: Dividend growth rate in percent (NaN if unknown)
+        consecutive: Consecutive years of dividend payments
+
+    Returns:
+        Sustainability score
+    """
+    score = 0
+
+    # Payout ratio component (40 points); NaN fails every comparison and adds nothing
+    if payout <= 50:
+        score += 40
+    elif payout <= 70:
+        score += 30
+    elif payout <= 90:
+        score += 15
+    elif payout <= 100:
+        score += 5
+
+    # Growth rate component (30 points)
+    if growth >= 10:
+        score += 30
+    elif growth >= 5:
+        score += 20
+    elif growth >= 0:
+        score += 10
+
+    # Consistency component (30 points)
+    if consecutive >= 10:
+        score += 30
+    elif consecutive >= 5:
+        score += 20
+    elif consecutive >= 3:
+        score += 10
+    elif consecutive >= 1:
+        score += 5
+
+    return score
+
+
+_sustainability_score = (
+    njit(cache=True)(_sustainability_score_kernel)
+    if njit is not None
+    else _sustainability_score_kernel
+)
+
+
+def _sustainability_scores_kernel(
+    payouts: np.ndarray, growths: np.ndarray, consecutive: np.ndarray
+) -> np.ndarray:
+    """Score many tickers at once (parallel over tickers when numba is installed)"""
+    n = payouts.shape[0]
+    scores = np.empty(n, dtype=np.int64)
+    for i in prange(n):
+        scores[i] = _sustainability_score(payouts[i], growths[i], consecutive[i])
+    return scores
+
+
+_sustainability_scores = (
+    njit(cache=True, parallel=True)(_sustainability_scores_kernel)
+    if njit is not None
+    else _sustainability_scores_kernel
+)
+
+
+def dividend_sustainability_scores(
+    payout_ratios: Any, growth_rates: Any, consecutive_years: Any
+) -> np.ndarray:
+    """
+    Dividend sustainability scores for a batch of tickers
+
+    Same scoring as ValuationAnalyzer.analyze_dividends, for universe-wide scans.
+
+    Args:
+        payout_ratios: Payout ratios in percent (None/NaN if unknown)
+        growth_rates: Dividend growth rates in percent (None/NaN if unknown)
+        consecutive_years: Consecutive years of dividend payments (None treated as 0)
+
+    Returns:
+        Integer array of 0-100 scores, one per ticker
+    """
+    payouts = np.asarray(payout_ratios, dtype=np.float64)
+    growths = np.asarray(growth_rates, dtype=np.float64)
+    consecutive = np.nan_to_num(np.asarray(consecutive_years, dtype=np.float64)).astype(np.int64)
+    return _sustainability_scores(payouts, growths, consecutive)
+
 
 class ValuationAnalyzer:
     """
@@ -53,12 +256,26 @@ class ValuationAnalyzer:
         self.fundamentals = fundamentals or {}
         self.earnings_data = earnings_data or {}
         self.dividends_data = dividends_data
+        self._results: Optional[Dict[str, Any]] = None
+        self._markdown: Optional[List[str]] = None
+        # Dividend intermediates shared by DDM and dividend analysis (computed on first use)
+        self._dividend_cache: Dict[str, Any] = {}
+        # CAPM WACC estimate shared by DCF and DDM (computed on first use)
+        self._wacc: Optional[float] = None
+        # Statement rows as float64 arrays, keyed by (fundamentals key, row label)
+        self._row_cache: Dict[Tuple[str, str], Optional[np.ndarray]] = {}
+
+        # Whether the dividend history shows any payments, checked once
+        self._has_dividend_history = dividends_data is not None and not dividends_data.empty
+        self._pays_dividends = (
+            self._has_dividend_history and float(np.nansum(dividends_data.to_numpy())) > 0
+        )
 
         # Extract currency (default to USD if not specified)
         self.currency = ticker_info.get("currency", "USD")
 
         # Extract current price
-        self.current_price = to_float(ticker_info.get("currentPrice"))
+        self.current_price = _as_float(ticker_info.get("currentPrice"))
         if (
             (self.current_price is None or self.current_price == 0.0)
             and price_data is not None
@@ -79,16 +296,15 @@ class ValuationAnalyzer:
             Float value or None if not found
         """
         # Try camelCase first
-        value = to_float(self.info.get(key))
+        value = _as_float(self.info.get(key))
         if value and value > 0:
             return value
 
-        # Try snake_case conversion
-        # Convert camelCase to snake_case (e.g., dividendYield -> dividend_yield)
-        import re
-
-        snake_key = re.sub(r"(?<!^)(?=[A-Z])", "_", key).lower()
-        value = to_float(self.info.get(snake_key))
+        # Try snake_case conversion (skipped for keys without a camelCase boundary)
+        snake_key = _to_snake(key)
+        if snake_key == key:
+            return None
+        value = _as_float(self.info.get(snake_key))
         return value if value and value > 0 else None
 
     def _get_value(
@@ -97,6 +313,22 @@ class ValuationAnalyzer:
         """Safely extract value from financial statement DataFrame"""
         return safe_get_dataframe_value(df, row_name, col_index)
 
+    def _statement_values(self, statement: str, row_name: str) -> Optional[np.ndarray]:
+        """
+        Cached float64 values of one financial statement row (one entry per period)
+
+        Args:
+            statement: Key into self.fundamentals (e.g. "cash_flow_annual")
+            row_name: Row label
+
+        Returns:
+            Float64 ndarray, or None if the statement or row is missing
+        """
+        key = (statement, row_name)
+        if key not in self._row_cache:
+            self._row_cache[key] = _statement_row(self.fundamentals.get(statement), row_name)
+        return self._row_cache[key]
+
     def _calculate_cagr(
         self, ending_value: float, beginning_value: float, num_periods: int
     ) -> Optional[float]:
@@ -114,18 +346,11 @@ class ValuationAnalyzer:
         if len(dividends_series) < 2:
             return "unknown"
 
-        # Calculate median time between payments (in days)
-        # Convert index to series, diff gives Timedelta objects
-        time_diffs = pd.Series(dividends_series.index).diff()
-        median_timedelta = time_diffs.median()
-
-        if pd.isna(median_timedelta):
-            return "unknown"
-
-        # Convert Timedelta to days - handle both Timedelta and numeric types
+        # Calculate median time between payments (in whole days, whatever the index unit)
         median_days: int
-        if isinstance(median_timedelta, pd.Timedelta):
-            median_days = median_timedelta.days
+        if isinstance(dividends_series.index, pd.DatetimeIndex):
+            gaps = np.diff(dividends_series.index.values).astype("timedelta64[D]")
+            median_days = int(np.median(gaps.astype(np.int64)))
         else:
             # Fallback to 90 if we can't determine (shouldn't happen with proper datetime index)
             median_days = 90
@@ -142,14 +367,18 @@ class ValuationAnalyzer:
         else:
             return "irregular"
 
-    def _calculate_ttm_dividend(self, dividends_series: pd.Series) -> float:
+    def _calculate_ttm_dividend(
+        self, dividends_series: pd.Series, frequency: Optional[str] = None
+    ) -> float:
         """
         Calculate trailing 12-month dividend intelligently based on payment frequency
 
         Handles annual, semi-annual, quarterly, monthly, and irregular payment schedules
 
         Args:
-            dividends_series: Dividend Series with DatetimeIndex
+            dividends_series: Dividend Series with timezone-naive DatetimeIndex
+                (see normalize_datetime_index)
+            frequency: Payment frequency from _get_dividend_frequency (detected if None)
 
         Returns:
             TTM dividend amount
@@ -157,37 +386,65 @@ class ValuationAnalyzer:
         if dividends_series.empty:
             return 0.0
 
-        # Normalize to timezone-naive for consistent comparisons
-        dividends_series = normalize_datetime_index(dividends_series)
-
         # Detect payment frequency
-        frequency = self._get_dividend_frequency(dividends_series)
+        if frequency is None:
+            frequency = self._get_dividend_frequency(dividends_series)
 
         # Try time-based filtering first (last 12 months)
-        now = pd.Timestamp.now()
-        one_year_ago = now - pd.DateOffset(months=12)
-        ttm_dividends = dividends_series[dividends_series.index >= one_year_ago]
+        one_year_ago = pd.Timestamp.now() - pd.DateOffset(months=12)
+        index = dividends_series.index
+        values = dividends_series.to_numpy()
+        if isinstance(index, pd.DatetimeIndex) and index.is_monotonic_increasing:
+            # Binary search for the window start instead of masking the whole history;
+            # the bound must be in the index's unit (yfinance dividends are second-resolution)
+            one_year_ago = one_year_ago.floor(index.unit).as_unit(index.unit)
+            ttm_values = values[index.searchsorted(one_year_ago, side="left") :]
+        else:
+            ttm_values = values[index >= one_year_ago]
 
         # If we got dividends in the TTM window, use them
-        if not ttm_dividends.empty and ttm_dividends.sum() > 0:
-            return ttm_dividends.sum()
-
-        # Fallback: use appropriate number of payments based on frequency
-        if frequency == "annual":
-            # For annual payers, most recent single payment represents the annual dividend
-            return dividends_series.tail(1).sum()
-        elif frequency == "semi-annual":
-            # Last 2 payments = 1 year
-            return dividends_series.tail(2).sum()
-        elif frequency == "quarterly":
-            # Last 4 payments = 1 year
-            return dividends_series.tail(4).sum()
-        elif frequency == "monthly":
-            # Last 12 payments = 1 year
-            return dividends_series.tail(12).sum()
-        else:
-            # For irregular/unknown, use last 4 payments as conservative estimate
-            return dividends_series.tail(min(4, len(dividends_series))).sum()
+        ttm_sum = float(np.nansum(ttm_values))
+        if ttm_values.size > 0 and ttm_sum > 0:
+            return ttm_sum
+
+        # Fallback: sum the most recent year's worth of payments for the frequency
+        # (irregular/unknown payers use the last 4 payments as a conservative estimate)
+        payments = _PAYMENTS_PER_YEAR.get(frequency, 4)
+        return float(np.nansum(values[-payments:]))
+
+    def _normalized_dividends(self) -> pd.Series:
+        """Dividend history with a timezone-naive DatetimeIndex (computed once)"""
+        if "normalized" not in self._dividend_cache:
+            self._dividend_cache["normalized"] = normalize_datetime_index(self.dividends_data)
+        return self._dividend_cache["normalized"]
+
+    def _annual_dividend_totals(self) -> pd.Series:
+        """Annual dividend totals of the normalized history (computed once)"""
+        if "annual" not in self._dividend_cache:
+            self._dividend_cache["annual"] = self._annual_dividends(self._normalized_dividends())
+        return self._dividend_cache["annual"]
+
+    def _dividend_frequency(self) -> str:
+        """Payment frequency of the normalized history (computed once)"""
+        if "frequency" not in self._dividend_cache:
+            self._dividend_cache["frequency"] = self._get_dividend_frequency(
+                self._normalized_dividends()
+            )
+        return self._dividend_cache["frequency"]
+
+    def _ttm_dividend(self) -> float:
+        """Trailing 12-month dividend of the normalized history (computed once)"""
+        if "ttm" not in self._dividend_cache:
+            self._dividend_cache["ttm"] = self._calculate_ttm_dividend(
+                self._normalized_dividends(), self._dividend_frequency()
+            )
+        return self._dividend_cache["ttm"]
+
+    def _dividend_growth_rate(self) -> Optional[float]:
+        """Historical dividend growth rate (computed once; None if not estimable)"""
+        if "growth_rate" not in self._dividend_cache:
+            self._dividend_cache["growth_rate"] = self._estimate_dividend_growth_rate()
+        return self._dividend_cache["growth_rate"]
 
     # ==================== DCF Valuation ====================
 
@@ -235,9 +492,8 @@ class ValuationAnalyzer:
                 return result
 
             # Get current FCF directly (yfinance provides it pre-calculated)
-            fcf_current = self._get_value(
-                self.fundamentals.get("cash_flow_annual"), "Free Cash Flow", 0
-            )
+            fcf_row = self._statement_values("cash_flow_annual", "Free Cash Flow")
+            fcf_current = _row_value(fcf_row, 0)
 
             if fcf_current is None:
                 result["error"] = "Free Cash Flow not available"
@@ -276,21 +532,24 @@ class ValuationAnalyzer:
                 )
                 return result
 
-            # Project FCF for projection_years
-            projected_fcf = []
-            for year in range(1, projection_years + 1):
-                fcf_year = fcf_current * pow(1 + growth_rate / 100, year)
-                pv_fcf = fcf_year / pow(1 + wacc / 100, year)
-                projected_fcf.append({"year": year, "fcf": fcf_year, "present_value": pv_fcf})
+            # Each projected year's PV is the previous one times q = (1 + g) / (1 + wacc),
+            # so the projection is a geometric series with a closed form
+            growth = 1 + growth_rate / 100
+            discount = 1 + wacc / 100
+            q = growth / discount
+            q_n = q**projection_years
+            if q == 1:
+                pv_projected_fcf = fcf_current * projection_years
+            else:
+                pv_projected_fcf = fcf_current * q * (1 - q_n) / (1 - q)
 
-            # Calculate terminal value
-            fcf_terminal_year = fcf_current * pow(1 + growth_rate / 100, projection_years)
+            # Calculate terminal value from the final projected year's FCF
+            fcf_terminal_year = fcf_current * growth**projection_years
             fcf_terminal = fcf_terminal_year * (1 + terminal_growth_rate / 100)
             terminal_value = fcf_terminal / ((wacc - terminal_growth_rate) / 100)
-            pv_terminal_value = terminal_value / pow(1 + wacc / 100, projection_years)
+            pv_terminal_value = terminal_value / discount**projection_years
 
             # Enterprise Value = Sum of PV of projected FCF + PV of terminal value
-            pv_projected_fcf = sum(cf["present_value"] for cf in projected_fcf)
             enterprise_value = pv_projected_fcf + pv_terminal_value
             result["enterprise_value"] = enterprise_value
             result["assumptions"]["pv_projected_fcf"] = pv_projected_fcf
@@ -308,7 +567,7 @@ class ValuationAnalyzer:
             result["assumptions"]["net_debt"] = net_debt
 
             # Per-share intrinsic value
-            shares_outstanding = to_float(self.info.get("sharesOutstanding")) or to_float(
+            shares_outstanding = _as_float(self.info.get("sharesOutstanding")) or _as_float(
                 self.info.get("impliedSharesOutstanding")
             )
 
@@ -347,9 +606,10 @@ class ValuationAnalyzer:
                 return None
 
             # Get 3-year historical FCF
+            fcf_row = self._statement_values("cash_flow_annual", "Free Cash Flow")
             fcf_values = []
             for i in range(3):
-                fcf = self._get_value(cash_flow_a, "Free Cash Flow", i)
+                fcf = _row_value(fcf_row, i)
                 if fcf is not None:
                     fcf_values.append(fcf)
 
@@ -368,6 +628,9 @@ class ValuationAnalyzer:
         WACC ≈ Cost of Equity (for simplicity, ignoring debt component)
         Cost of Equity = Risk-free rate + Beta * Market risk premium
         """
+        if self._wacc is not None:
+            return self._wacc
+
         risk_free_rate = 4.0  # 4% assumption (could pull from config)
         market_risk_premium = 8.0  # Historical equity risk premium
 
@@ -379,6 +642,7 @@ class ValuationAnalyzer:
 
         # For simplicity, using cost of equity as WACC proxy
         # More sophisticated: weight by debt-to-equity ratio
+        self._wacc = cost_of_equity
         return cost_of_equity
 
     # ==================== Dividend Discount Model ====================
@@ -415,20 +679,17 @@ class ValuationAnalyzer:
 
         try:
             # Check if stock pays dividends (check actual data first)
-            if self.dividends_data is None or self.dividends_data.empty:
+            if not self._has_dividend_history:
                 result["error"] = "No dividend history available"
                 return result
 
             # Verify dividends exist
-            if self.dividends_data.sum() <= 0:
+            if not self._pays_dividends:
                 result["error"] = "Stock does not pay dividends - DDM not applicable"
                 return result
 
-            # Normalize to timezone-naive DatetimeIndex for consistent handling
-            dividends_series = normalize_datetime_index(self.dividends_data)
-
             # Calculate trailing 12-month dividend (frequency-aware)
-            ttm_dividend = self._calculate_ttm_dividend(dividends_series)
+            ttm_dividend = self._ttm_dividend()
             if ttm_dividend <= 0:
                 result["error"] = "No dividends paid in trailing 12 months"
                 return result
@@ -437,7 +698,7 @@ class ValuationAnalyzer:
 
             # Estimate growth rate if not provided
             if growth_rate is None:
-                growth_rate = self._estimate_dividend_growth_rate()
+                growth_rate = self._dividend_growth_rate()
                 if growth_rate is None:
                     growth_rate = 3.0  # Default conservative growth
                 result["assumptions"]["growth_rate_source"] = "historical_dividends"
@@ -482,17 +743,39 @@ class ValuationAnalyzer:
 
         return result
 
+    def _annual_dividends(self, dividends_series: pd.Series) -> pd.Series:
+        """
+        Total dividends per calendar year
+
+        Groups on the integer year directly, which is much lighter than
+        resample("YE"). Years without any payment are absent, not zero.
+
+        Args:
+            dividends_series: Dividend Series with timezone-naive DatetimeIndex
+
+        Returns:
+            Series of annual totals indexed by year (ascending)
+        """
+        return dividends_series.groupby(dividends_series.index.year).sum()
+
     def _estimate_dividend_growth_rate(self) -> Optional[float]:
         """Estimate dividend growth rate from historical data"""
+        if not self._has_dividend_history:
+            return None
+
         try:
-            if self.dividends_data is None or self.dividends_data.empty:
-                return None
+            annual_dividends = self._annual_dividend_totals()
+        except Exception as e:
+            logger.warning(f"Could not estimate dividend growth rate: {e}")
+            return None
 
-            # Normalize to timezone-naive DatetimeIndex for consistent handling
-            dividends_series = normalize_datetime_index(self.dividends_data)
+        return self._estimate_dividend_growth_rate_from_annual(annual_dividends)
 
-            # Get annual dividend totals for past years
-            annual_dividends = dividends_series.resample("YE").sum()
+    def _estimate_dividend_growth_rate_from_annual(
+        self, annual_dividends: pd.Series
+    ) -> Optional[float]:
+        """Estimate dividend growth rate from annual dividend totals"""
+        try:
             annual_dividends = annual_dividends[annual_dividends > 0]
 
             if len(annual_dividends) < 2:
@@ -538,13 +821,7 @@ class ValuationAnalyzer:
         try:
             # Check if dividends are paid (check both info and actual dividend data)
             dividend_yield = self._get_info_value("dividendYield")
-            has_dividend_data = (
-                self.dividends_data is not None
-                and not self.dividends_data.empty
-                and self.dividends_data.sum() > 0
-            )
-
-            if not has_dividend_data and (not dividend_yield or dividend_yield <= 0):
+            if not self._pays_dividends and (not dividend_yield or dividend_yield <= 0):
                 return result
 
             result["pays_dividends"] = True
@@ -557,27 +834,27 @@ class ValuationAnalyzer:
                 )
 
             # Get TTM dividend
-            if has_dividend_data and self.dividends_data is not None:
-                # Normalize to timezone-naive DatetimeIndex for consistent handling
-                dividends_series = normalize_datetime_index(self.dividends_data)
+            if self._pays_dividends:
+                # Normalized history, TTM and growth are shared with the DDM valuation
+                dividends_series = self._normalized_dividends()
 
                 # Calculate TTM dividend (frequency-aware)
-                ttm_dividend = self._calculate_ttm_dividend(dividends_series)
-                result["annual_dividend"] = ttm_dividend
+                result["annual_dividend"] = self._ttm_dividend()
 
                 # Calculate growth rate
-                growth_rate = self._estimate_dividend_growth_rate()
-                result["dividend_growth_rate"] = growth_rate
-
-                # Count consecutive years of dividend payments
-                annual_divs = dividends_series.resample("YE").sum()
-                consecutive = 0
-                for div in reversed(annual_divs.values):
-                    if div is not None and div > 0:
-                        consecutive += 1
-                    else:
-                        break
-                result["consecutive_years"] = consecutive
+                result["dividend_growth_rate"] = self._dividend_growth_rate()
+
+                # Annual totals, shared by the growth rate and the payment streak
+                annual_divs = self._annual_dividend_totals()
+
+                # Count consecutive years of dividend payments, counting back from the
+                # latest; a year with a zero total or no payments at all ends the streak
+                years = annual_divs.index.to_numpy()[::-1]
+                unbroken = annual_divs.to_numpy()[::-1] > 0
+                unbroken[1:] &= years[:-1] - years[1:] == 1
+                result["consecutive_years"] = (
+                    len(unbroken) if unbroken.all() else int(np.argmin(unbroken))
+                )
 
                 # Latest ex-dividend date
                 result["latest_ex_dividend_date"] = str(dividends_series.index[-1])
@@ -609,16 +886,8 @@ class ValuationAnalyzer:
             result["sustainability_score"] = score
 
             # Rating interpretation
-            if score >= 80:
-                result["sustainability_rating"] = "Excellent"
-            elif score >= 60:
-                result["sustainability_rating"] = "Good"
-            elif score >= 40:
-                result["sustainability_rating"] = "Fair"
-            elif score >= 20:
-                result["sustainability_rating"] = "Poor"
-            else:
-                result["sustainability_rating"] = "High Risk"
+            rating_index = bisect_right(_RATING_THRESHOLDS, score)
+            result["sustainability_rating"] = _RATING_LABELS[rating_index]
 
         except Exception as e:
             logger.error(f"Dividend analysis error for {self.ticker}: {e}")
@@ -628,42 +897,15 @@ class ValuationAnalyzer:
 
     def _calculate_dividend_sustainability_score(self, dividend_data: Dict[str, Any]) -> int:
         """Calculate 0-100 sustainability score based on dividend metrics"""
-        score = 0
-
-        # Payout ratio component (40 points)
         payout = dividend_data.get("payout_ratio")
-        if payout is not None:
-            if payout <= 50:
-                score += 40
-            elif payout <= 70:
-                score += 30
-            elif payout <= 90:
-                score += 15
-            elif payout <= 100:
-                score += 5
-
-        # Growth rate component (30 points)
         growth = dividend_data.get("dividend_growth_rate")
-        if growth is not None:
-            if growth >= 10:
-                score += 30
-            elif growth >= 5:
-                score += 20
-            elif growth >= 0:
-                score += 10
-
-        # Consistency component (30 points)
-        consecutive = dividend_data.get("consecutive_years") or 0
-        if consecutive >= 10:
-            score += 30
-        elif consecutive >= 5:
-            score += 20
-        elif consecutive >= 3:
-            score += 10
-        elif consecutive >= 1:
-            score += 5
-
-        return score
+        return int(
+            _sustainability_score(
+                float("nan") if payout is None else float(payout),
+                float("nan") if growth is None else float(growth),
+                int(dividend_data.get("consecutive_years") or 0),
+            )
+        )
 
     # ==================== Earnings Analysis ====================
 
@@ -694,9 +936,7 @@ class ValuationAnalyzer:
                 # Sum last 4 quarters for TTM EPS
                 recent_eps = earnings_history.tail(4)
                 if len(recent_eps) == 4:
-                    ttm_eps = sum(
-                        to_float(row.get("epsActual", 0)) for _, row in recent_eps.iterrows()
-                    )
+                    ttm_eps = float(_numeric_column(recent_eps, "epsActual", 0.0).sum())
                     if ttm_eps > 0:
                         result["current_eps"] = ttm_eps
 
@@ -708,23 +948,37 @@ class ValuationAnalyzer:
             if earnings_history is not None and not earnings_history.empty:
                 # Extract recent surprises
                 recent = earnings_history.tail(4)
-                for _, row in recent.iterrows():
-                    surprise = {
-                        "quarter": str(row.get("quarter", "")),
-                        "eps_actual": to_float(row.get("epsActual")),
-                        "eps_estimate": to_float(row.get("epsEstimate")),
-                        "surprise_pct": to_float(row.get("surprisePercent", 0)) * 100,
+                # str() per value keeps Timestamp formatting identical to the old row access
+                # (Series.astype(str) drops the time part of datetime64 columns)
+                quarters = (
+                    [str(q) for q in recent["quarter"].tolist()]
+                    if "quarter" in recent.columns
+                    else [""] * len(recent)
+                )
+                eps_actual = _numeric_column(recent, "epsActual", 0.0)
+                eps_estimate = _numeric_column(recent, "epsEstimate", 0.0)
+                surprises = _numeric_column(recent, "surprisePercent", 0.0) * 100
+
+                result["recent_surprises"] = [
+                    {
+                        "quarter": quarter,
+                        "eps_actual": actual,
+                        "eps_estimate": estimate,
+                        "surprise_pct": surprise_pct,
                     }
-                    result["recent_surprises"].append(surprise)
+                    for quarter, actual, estimate, surprise_pct in zip(
+                        quarters, eps_actual.tolist(), eps_estimate.tolist(), surprises.tolist()
+                    )
+                ]
 
                 # Surprise statistics
-                if len(result["recent_surprises"]) > 0:
-                    surprises = [s["surprise_pct"] for s in result["recent_surprises"]]
+                if surprises.size > 0:
+                    positive = int(np.count_nonzero(surprises > 0))
                     result["surprise_stats"] = {
-                        "avg_surprise_pct": np.mean(surprises),
-                        "positive_surprises": sum(1 for s in surprises if s > 0),
-                        "negative_surprises": sum(1 for s in surprises if s < 0),
-                        "beat_rate": sum(1 for s in surprises if s > 0) / len(surprises) * 100,
+                        "avg_surprise_pct": float(surprises.mean()),
+                        "positive_surprises": positive,
+                        "negative_surprises": int(np.count_nonzero(surprises < 0)),
+                        "beat_rate": positive / surprises.size * 100,
                     }
 
             # Next earnings date
@@ -736,13 +990,15 @@ class ValuationAnalyzer:
                     if not isinstance(earnings_dates.index, pd.DatetimeIndex):
                         earnings_dates.index = pd.to_datetime(earnings_dates.index)
 
-                    now = pd.Timestamp.now()
-                    upcoming = earnings_dates[earnings_dates.index > now]
-                    if not upcoming.empty:
-                        next_date = upcoming.index[0]
-                        result["next_earnings_date"] = str(next_date)
+                    if not earnings_dates.index.is_monotonic_increasing:
+                        earnings_dates = earnings_dates.sort_index()
+
+                    # Binary search for the first date after now
+                    pos = earnings_dates.index.searchsorted(pd.Timestamp.now(), side="right")
+                    if pos < len(earnings_dates):
+                        result["next_earnings_date"] = str(earnings_dates.index[pos])
                         result["next_earnings_estimate"] = to_float(
-                            upcoming.iloc[0].get("EPS Estimate")
+                            earnings_dates.iloc[pos].get("EPS Estimate")
                         )
                 except Exception as e:
                     logger.warning(f"Could not parse earnings dates: {e}")
@@ -750,32 +1006,26 @@ class ValuationAnalyzer:
             # EPS growth calculation
             income_stmt = self.fundamentals.get("income_stmt_annual")
             if income_stmt is not None and not income_stmt.empty:
-                eps_current = self._get_value(income_stmt, "Diluted EPS", 0) or self._get_value(
-                    income_stmt, "Basic EPS", 0
-                )
-                eps_1y = self._get_value(income_stmt, "Diluted EPS", 1) or self._get_value(
-                    income_stmt, "Basic EPS", 1
-                )
-                eps_3y = self._get_value(income_stmt, "Diluted EPS", 3) or self._get_value(
-                    income_stmt, "Basic EPS", 3
+                # Each EPS row is pulled out once; years are then read positionally
+                diluted_eps = self._statement_values("income_stmt_annual", "Diluted EPS")
+                basic_eps = self._statement_values("income_stmt_annual", "Basic EPS")
+                # Basic EPS is used only where diluted EPS is missing (0.0 is a value)
+                eps_current, eps_1y, eps_3y = (
+                    _first_row_value((diluted_eps, basic_eps), i) for i in (0, 1, 3)
                 )
 
-                if eps_current and eps_1y and eps_1y != 0:
-                    result["eps_growth_1y"] = ((eps_current - eps_1y) / abs(eps_1y)) * 100
+                # A current EPS of exactly zero is a real value (-100% growth), so only None
+                # is treated as missing; the base year must be non-zero (or positive for CAGR)
+                if eps_current is not None:
+                    if eps_1y:
+                        result["eps_growth_1y"] = ((eps_current - eps_1y) / abs(eps_1y)) * 100
 
-                if eps_current and eps_3y and eps_3y > 0:
-                    result["eps_growth_3y_cagr"] = self._calculate_cagr(eps_current, eps_3y, 3)
+                    if eps_3y is not None and eps_3y > 0:
+                        result["eps_growth_3y_cagr"] = self._calculate_cagr(eps_current, eps_3y, 3)
 
-            # Trend determination
-            if result["eps_growth_1y"]:
-                if result["eps_growth_1y"] > 10:
-                    result["trend"] = "Strong Growth"
-                elif result["eps_growth_1y"] > 0:
-                    result["trend"] = "Moderate Growth"
-                elif result["eps_growth_1y"] > -10:
-                    result["trend"] = "Slight Decline"
-                else:
-                    result["trend"] = "Declining"
+            # Trend determination (flat 0.0% growth is still classified)
+            if (growth_1y := result["eps_growth_1y"]) is not None:
+                result["trend"] = _TREND_LABELS[bisect_left(_TREND_THRESHOLDS, growth_1y)]
 
             # Earnings quality metrics
             result["earnings_quality"] = self._assess_earnings_quality()
@@ -804,19 +1054,13 @@ class ValuationAnalyzer:
             if income_stmt.empty or cash_flow.empty:
                 return quality
 
-            net_income = self._get_value(income_stmt, "Net Income", 0)
+            net_income = _row_value(self._statement_values("income_stmt_annual", "Net Income"), 0)
 
-            # Try multiple field names for operating cash flow
+            # Operating cash flow under the first field name that has a non-zero value;
+            # names absent from the statement are skipped with one index membership test each
             ocf = None
-            ocf_field_names = [
-                "Operating Cash Flow",
-                "Cash From Operating Activities",
-                "Cash Flowsfromusedin Operating Activities Direct",
-                "Total Cash From Operating Activities",
-                "Net Cash Provided By Operating Activities",
-            ]
-            for field_name in ocf_field_names:
-                ocf = self._get_value(cash_flow, field_name, 0)
+            for field_name in [name for name in _OCF_FIELDS if name in cash_flow.index]:
+                ocf = _row_value(self._statement_values("cash_flow_annual", field_name), 0)
                 if ocf is not None and ocf != 0:
                     break
 
@@ -831,18 +1075,9 @@ class ValuationAnalyzer:
                 quality["metrics"]["accruals_pct"] = accruals_pct
 
                 # Score based on ratio
-                if cf_to_ni_ratio >= 1.2:
-                    quality["score"] = 90
-                    quality["assessment"] = "High Quality (strong cash backing)"
-                elif cf_to_ni_ratio >= 1.0:
-                    quality["score"] = 75
-                    quality["assessment"] = "Good Quality (cash flow matches earnings)"
-                elif cf_to_ni_ratio >= 0.8:
-                    quality["score"] = 50
-                    quality["assessment"] = "Fair Quality (moderate cash backing)"
-                else:
-                    quality["score"] = 25
-                    quality["assessment"] = "Low Quality (weak cash flow)"
+                quality["score"], quality["assessment"] = _QUALITY_GRADES[
+                    bisect_right(_QUALITY_THRESHOLDS, cf_to_ni_ratio)
+                ]
 
         except Exception as e:
             logger.warning(f"Could not assess earnings quality: {e}")
@@ -851,198 +1086,327 @@ class ValuationAnalyzer:
 
     # ==================== Comprehensive Analysis ====================
 
+    def invalidate(self) -> None:
+        """
+        Drop cached results so the next analyze()/format_markdown() recomputes them
+
+        Call after replacing fundamentals, earnings_data or dividends_data on the analyzer.
+        """
+        self._results = None
+        self._markdown = None
+        self._dividend_cache.clear()
+        self._wacc = None
+        self._row_cache.clear()
+        self._has_dividend_history = (
+            self.dividends_data is not None and not self.dividends_data.empty
+        )
+        self._pays_dividends = (
+            self._has_dividend_history and float(np.nansum(self.dividends_data.to_numpy())) > 0
+        )
+
     def analyze(self) -> Dict[str, Any]:
         """
         Run comprehensive valuation analysis
 
+        Cached until invalidate() is called.
+
         Returns:
             Dictionary with all valuation results
         """
-        return {
+        if self._results is not None:
+            return self._results
+
+        self._results = {
             "ticker": self.ticker,
             "dcf_valuation": self.calculate_dcf_valuation(),
             "ddm_valuation": self.calculate_ddm_valuation(),
             "dividend_analysis": self.analyze_dividends(),
             "earnings_analysis": self.analyze_earnings(),
         }
+        return self._results
 
     def format_markdown(self) -> List[str]:
         """
         Format valuation analysis as markdown report
 
         Returns:
-            List of markdown lines
+            List of markdown lines (a new list on every call)
         """
-        md = []
-        md.append("\n## Valuation Analysis")
-        md.append("")
+        if self._markdown is not None:
+            return list(self._markdown)
 
         results = self.analyze()
-        currency_symbols = {"USD": "$", "CAD": "CA$", "NOK": "kr", "EUR": "€", "GBP": "£"}
-        symbol = currency_symbols.get(self.currency, self.currency)
-
-        # DCF Valuation
-        md.append("### DCF (Discounted Cash Flow) Valuation")
-        md.append("")
-        dcf = results["dcf_valuation"]
-
-        if dcf.get("error"):
-            md.append(f"*{dcf['error']}*")
-            md.append("")
-        elif dcf.get("intrinsic_value_per_share"):
-            intrinsic = dcf["intrinsic_value_per_share"]
-            current = dcf.get("current_price", 0)
-            discount = dcf.get("discount_premium_pct", 0)
-
-            md.append("| Metric | Value |")
-            md.append("|--------|-------|")
-            md.append(f"| Intrinsic Value per Share | {symbol}{intrinsic:,.2f} |")
-            md.append(f"| Current Price | {symbol}{current:,.2f} |")
-            if discount:
-                direction = "Premium" if discount > 0 else "Discount"
-                md.append(f"| {direction} | {abs(discount):.1f}% |")
-            md.append("")
-
-            md.append("**Assumptions:**")
-            md.append("")
-            if dcf.get("fcf_current"):
-                md.append(f"- Current FCF: {symbol}{dcf['fcf_current']:,.0f}")
-            if dcf.get("growth_rate_used"):
-                md.append(f"- Growth Rate: {dcf['growth_rate_used']:.2f}%")
-            if dcf.get("terminal_growth_rate"):
-                md.append(f"- Terminal Growth: {dcf['terminal_growth_rate']:.2f}%")
-            if dcf.get("wacc_used"):
-                md.append(f"- WACC: {dcf['wacc_used']:.2f}%")
-            md.append("")
-        else:
-            md.append("*Insufficient data for DCF valuation*")
-            md.append("")
-
-        # DDM Valuation
-        md.append("### DDM (Dividend Discount Model) Valuation")
-        md.append("")
-        ddm = results["ddm_valuation"]
-
-        if ddm.get("error"):
-            md.append(f"*{ddm['error']}*")
-            md.append("")
-        elif ddm.get("intrinsic_value_per_share"):
-            intrinsic = ddm["intrinsic_value_per_share"]
-            current = ddm.get("current_price", 0)
-            discount = ddm.get("discount_premium_pct", 0)
-
-            md.append("| Metric | Value |")
-            md.append("|--------|-------|")
-            md.append(f"| Intrinsic Value per Share | {symbol}{intrinsic:,.2f} |")
-            md.append(f"| Current Price | {symbol}{current:,.2f} |")
+        symbol = get_currency_symbol(self.currency)
+
+        md = list(
+            chain(
+                ("\n## Valuation Analysis", ""),
+                self._iter_intrinsic_value_markdown(
+                    "### DCF (Discounted Cash Flow) Valuation",
+                    results["dcf_valuation"],
+                    symbol,
+                    self._iter_dcf_assumptions,
+                    "*Insufficient data for DCF valuation*",
+                ),
+                self._iter_intrinsic_value_markdown(
+                    "### DDM (Dividend Discount Model) Valuation",
+                    results["ddm_valuation"],
+                    symbol,
+                    self._iter_ddm_assumptions,
+                    "*Insufficient data for DDM valuation*",
+                ),
+                self._iter_dividend_markdown(results["dividend_analysis"], symbol),
+                self._iter_earnings_markdown(results["earnings_analysis"], symbol),
+            )
+        )
+        self._markdown = md
+        return list(md)
+
+    @staticmethod
+    def _iter_intrinsic_value_markdown(
+        heading: str,
+        valuation: Dict[str, Any],
+        symbol: str,
+        iter_assumptions: Callable[[Dict[str, Any], str], Iterator[str]],
+        insufficient: str,
+    ) -> Iterator[str]:
+        """Markdown lines for a DCF/DDM section (value table followed by model assumptions)"""
+        yield from (heading, "")
+
+        if valuation.get("error"):
+            yield from (f"*{valuation['error']}*", "")
+        elif valuation.get("intrinsic_value_per_share"):
+            current = valuation.get("current_price", 0)
+            discount = valuation.get("discount_premium_pct", 0)
+
+            yield from _METRIC_TABLE_HEADER
+            yield _MONEY_ROW.format(
+                "Intrinsic Value per Share", symbol, valuation["intrinsic_value_per_share"]
+            )
+            yield _MONEY_ROW.format("Current Price", symbol, current)
             if discount:
                 direction = "Premium" if discount > 0 else "Discount"
-                md.append(f"| {direction} | {abs(discount):.1f}% |")
-            md.append("")
-
-            md.append("**Assumptions:**")
-            md.append("")
-            if ddm.get("current_dividend"):
-                md.append(f"- Current Annual Dividend: {symbol}{ddm['current_dividend']:.2f}")
-            if ddm.get("growth_rate_used"):
-                md.append(f"- Dividend Growth Rate: {ddm['growth_rate_used']:.2f}%")
-            if ddm.get("required_return_used"):
-                md.append(f"- Required Return: {ddm['required_return_used']:.2f}%")
-            md.append("")
-        else:
-            md.append("*Insufficient data for DDM valuation*")
-            md.append("")
-
-        # Dividend Analysis
-        md.append("### Dividend Analysis")
-        md.append("")
-        div = results["dividend_analysis"]
-
-        if div.get("pays_dividends"):
-            md.append("| Metric | Value |")
-            md.append("|--------|-------|")
-
-            if div.get("dividend_yield"):
-                md.append(f"| Dividend Yield | {div['dividend_yield']:.2f}% |")
-            if div.get("annual_dividend"):
-                md.append(f"| Annual Dividend | {symbol}{div['annual_dividend']:.2f} |")
-            if div.get("payout_ratio"):
-                md.append(f"| Payout Ratio | {div['payout_ratio']:.1f}% |")
-            if div.get("dividend_coverage_ratio"):
-                md.append(f"| Coverage Ratio | {div['dividend_coverage_ratio']:.2f}x |")
-            if div.get("dividend_growth_rate"):
-                md.append(f"| Growth Rate (Historical) | {div['dividend_growth_rate']:.2f}% |")
-            if div.get("consecutive_years"):
-                md.append(f"| Consecutive Years Paid | {div['consecutive_years']} |")
-            md.append("")
-
-            # Sustainability
-            if div.get("sustainability_score") is not None:
-                score = div["sustainability_score"]
-                rating = div.get("sustainability_rating", "N/A")
-                md.append(f"**Sustainability:** {score}/100 ({rating})")
-                md.append("")
-
-                if div.get("warnings"):
-                    md.append("**Warnings:**")
-                    md.append("")
-                    for warning in div["warnings"]:
-                        md.append(f"- {warning}")
-                    md.append("")
-        else:
-            md.append("*Company does not pay dividends*")
-            md.append("")
-
-        # Earnings Analysis
-        md.append("### Earnings Analysis")
-        md.append("")
-        earnings = results["earnings_analysis"]
-
-        if earnings.get("current_eps"):
-            md.append("| Metric | Value |")
-            md.append("|--------|-------|")
-            md.append(f"| Current EPS (TTM) | {symbol}{earnings['current_eps']:.2f} |")
-            if earnings.get("forward_eps"):
-                md.append(f"| Forward EPS | {symbol}{earnings['forward_eps']:.2f} |")
-            if earnings.get("eps_growth_1y"):
-                md.append(f"| EPS Growth (1Y) | {earnings['eps_growth_1y']:+.1f}% |")
-            if earnings.get("eps_growth_3y_cagr"):
-                md.append(f"| EPS Growth (3Y CAGR) | {earnings['eps_growth_3y_cagr']:+.1f}% |")
-            md.append("")
-
-            # Trend
-            if earnings.get("trend"):
-                md.append(f"**Trend:** {earnings['trend']}")
-                md.append("")
-
-            # Earnings quality
-            quality = earnings.get("earnings_quality", {})
-            if quality.get("assessment"):
-                md.append(f"**Earnings Quality:** {quality['assessment']}")
-                if quality.get("score"):
-                    md.append(f"*(OCF/NI Ratio: {quality['score']:.2f})*")
-                md.append("")
-
-            # Recent surprises
-            surprises = earnings.get("recent_surprises", [])
-            if surprises:
-                md.append("**Recent Earnings Surprises:**")
-                md.append("")
-                md.append("| Quarter | Actual | Estimate | Surprise % |")
-                md.append("|---------|--------|----------|------------|")
-                for surprise in surprises[:4]:  # Last 4 quarters
-                    quarter = surprise.get("quarter", "N/A")
-                    actual = surprise.get("actual", 0)
-                    estimate = surprise.get("estimate", 0)
-                    surprise_pct = surprise.get("surprise_pct", 0)
-                    surprise_dir = "+" if surprise_pct >= 0 else ""
-                    md.append(
-                        f"| {quarter} | {symbol}{actual:.2f} | {symbol}{estimate:.2f} | "
-                        f"{surprise_dir}{surprise_pct * 100:.1f}% |"
-                    )
-                md.append("")
+                yield f"| {direction} | {abs(discount):.1f}% |"
+            yield ""
+
+            yield from ("**Assumptions:**", "")
+            yield from iter_assumptions(valuation, symbol)
+            yield ""
         else:
-            md.append("*Earnings data unavailable*")
-            md.append("")
+            yield from (insufficient, "")
+
+    @staticmethod
+    def _iter_dcf_assumptions(dcf: Dict[str, Any], symbol: str) -> Iterator[str]:
+        """Markdown bullet lines for the DCF assumptions"""
+        if dcf.get("fcf_current"):
+            yield f"- Current FCF: {symbol}{dcf['fcf_current']:,.0f}"
+        if dcf.get("growth_rate_used"):
+            yield f"- Growth Rate: {dcf['growth_rate_used']:.2f}%"
+        if dcf.get("terminal_growth_rate"):
+            yield f"- Terminal Growth: {dcf['terminal_growth_rate']:.2f}%"
+        if dcf.get("wacc_used"):
+            yield f"- WACC: {dcf['wacc_used']:.2f}%"
+
+    @staticmethod
+    def _iter_ddm_assumptions(ddm: Dict[str, Any], symbol: str) -> Iterator[str]:
+        """Markdown bullet lines for the DDM assumptions"""
+        if ddm.get("current_dividend"):
+            yield f"- Current Annual Dividend: {symbol}{ddm['current_dividend']:.2f}"
+        if ddm.get("growth_rate_used"):
+            yield f"- Dividend Growth Rate: {ddm['growth_rate_used']:.2f}%"
+        if ddm.get("required_return_used"):
+            yield f"- Required Return: {ddm['required_return_used']:.2f}%"
+
+    @staticmethod
+    def _iter_dividend_markdown(div: Dict[str, Any], symbol: str) -> Iterator[str]:
+        """Markdown lines for the dividend analysis section"""
+        yield from ("### Dividend Analysis", "")
+
+        if not div.get("pays_dividends"):
+            yield from ("*Company does not pay dividends*", "")
+            return
+
+        yield from _METRIC_TABLE_HEADER
+        if div.get("dividend_yield"):
+            yield f"| Dividend Yield | {div['dividend_yield']:.2f}% |"
+        if div.get("annual_dividend"):
+            yield f"| Annual Dividend | {symbol}{div['annual_dividend']:.2f} |"
+        if div.get("payout_ratio"):
+            yield f"| Payout Ratio | {div['payout_ratio']:.1f}% |"
+        if div.get("dividend_coverage_ratio"):
+            yield f"| Coverage Ratio | {div['dividend_coverage_ratio']:.2f}x |"
+        if div.get("dividend_growth_rate"):
+            yield f"| Growth Rate (Historical) | {div['dividend_growth_rate']:.2f}% |"
+        if div.get("consecutive_years"):
+            yield f"| Consecutive Years Paid | {div['consecutive_years']} |"
+        yield ""
+
+        # Sustainability
+        if div.get("sustainability_score") is not None:
+            score = div["sustainability_score"]
+            rating = div.get("sustainability_rating", "N/A")
+            yield from (f"**Sustainability:** {score}/100 ({rating})", "")
+
+            if div.get("warnings"):
+                yield from ("**Warnings:**", "")
+                for warning in div["warnings"]:
+                    yield f"- {warning}"
+                yield ""
+
+    @staticmethod
+    def _iter_earnings_markdown(earnings: Dict[str, Any], symbol: str) -> Iterator[str]:
+        """Markdown lines for the earnings analysis section"""
+        yield from ("### Earnings Analysis", "")
+
+        if not earnings.get("current_eps"):
+            yield from ("*Earnings data unavailable*", "")
+            return
+
+        yield from _METRIC_TABLE_HEADER
+        yield f"| Current EPS (TTM) | {symbol}{earnings['current_eps']:.2f} |"
+        if earnings.get("forward_eps"):
+            yield f"| Forward EPS | {symbol}{earnings['forward_eps']:.2f} |"
+        if earnings.get("eps_growth_1y") is not None:
+            yield f"| EPS Growth (1Y) | {earnings['eps_growth_1y']:+.1f}% |"
+        if earnings.get("eps_growth_3y_cagr"):
+            yield f"| EPS Growth (3Y CAGR) | {earnings['eps_growth_3y_cagr']:+.1f}% |"
+        yield ""
+
+        # Trend
+        if earnings.get("trend"):
+            yield from (f"**Trend:** {earnings['trend']}", "")
+
+        # Earnings quality
+        quality = earnings.get("earnings_quality", {})
+        if quality.get("assessment"):
+            yield f"**Earnings Quality:** {quality['assessment']}"
+            if quality.get("score"):
+                yield f"*(OCF/NI Ratio: {quality['score']:.2f})*"
+            yield ""
+
+        # Recent surprises
+        surprises = earnings.get("recent_surprises", [])
+        if surprises:
+            yield from ("**Recent Earnings Surprises:**", "")
+            yield "| Quarter | Actual | Estimate | Surprise % |"
+            yield "|---------|--------|----------|------------|"
+            for surprise in surprises[:4]:  # Last 4 quarters
+                quarter = surprise.get("quarter", "N/A")
+                actual = surprise.get("actual", 0)
+                estimate = surprise.get("estimate", 0)
+                surprise_pct = surprise.get("surprise_pct", 0)
+                surprise_dir = "+" if surprise_pct >= 0 else ""
+                yield (
+                    f"| {quarter} | {symbol}{actual:.2f} | {symbol}{estimate:.2f} | "
+                    f"{surprise_dir}{surprise_pct * 100:.1f}% |"
+                )
+            yield ""
+
+
+class ValuationBatch:
+    """
+    DCF valuation for many tickers at once
+
+    Stores the DCF inputs column-wise (one array per input, one entry per ticker)
+    so a whole universe is valued with a handful of broadcast array operations
+    instead of one ValuationAnalyzer.calculate_dcf_valuation call per ticker.
+    """
+
+    def __init__(
+        self,
+        tickers: List[str],
+        fcf_current: Any,
+        growth_rate: Any,
+        wacc: Any,
+        shares_outstanding: Any,
+        net_debt: Any = 0.0,
+        current_price: Any = np.nan,
+        terminal_growth_rate: Any = 2.5,
+    ):
+        """
+        Initialize batch valuation inputs
 
-        return md
+        Scalars are broadcast to every ticker.
+
+        Args:
+            tickers: Ticker symbols, one per row
+            fcf_current: Current free cash flow per ticker
+            growth_rate: FCF growth rate (%) per ticker
+            wacc: Weighted Average Cost of Capital (%) per ticker
+            shares_outstanding: Shares outstanding per ticker
+            net_debt: Total debt minus cash per ticker
+            current_price: Current share price per ticker (NaN if unknown)
+            terminal_growth_rate: Perpetual growth rate (%) per ticker
+
+        Raises:
+            ValueError: If an input cannot be broadcast to the number of tickers
+        """
+        self.tickers = list(tickers)
+        n = len(self.tickers)
+        inputs = (
+            fcf_current,
+            growth_rate,
+            wacc,
+            shares_outstanding,
+            net_debt,
+            current_price,
+            terminal_growth_rate,
+        )
+        try:
+            columns = [np.broadcast_to(np.asarray(v, dtype=np.float64), (n,)) for v in inputs]
+        except ValueError as e:
+            raise ValueError(f"Batch inputs must have one value per ticker ({n}): {e}") from e
+
+        (
+            self.fcf_current,
+            self.growth_rate,
+            self.wacc,
+            self.shares_outstanding,
+            self.net_debt,
+            self.current_price,
+            self.terminal_growth_rate,
+        ) = columns
+
+    def calculate_dcf_batch(self, projection_years: int = 5) -> pd.DataFrame:
+        """
+        Calculate DCF intrinsic value for every ticker
+
+        Uses the same model as ValuationAnalyzer.calculate_dcf_valuation. Tickers
+        where DCF does not apply (non-positive FCF or shares, WACC not above
+        terminal growth) get NaN values.
+
+        Args:
+            projection_years: Number of years to project cash flows
+
+        Returns:
+            DataFrame indexed by ticker with enterprise_value, equity_value,
+            intrinsic_value_per_share and discount_premium_pct columns
+        """
+        g = self.growth_rate / 100
+        w = self.wacc / 100
+        tg = self.terminal_growth_rate / 100
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # (tickers, years) matrix of discounted cash flows, summed per ticker
+            years = np.arange(1, projection_years + 1)
+            q = (1 + g[:, None]) / (1 + w[:, None])
+            pv_projected_fcf = (self.fcf_current[:, None] * q**years).sum(axis=1)
+
+            terminal_value = self.fcf_current * (1 + g) ** projection_years * (1 + tg) / (w - tg)
+            pv_terminal_value = terminal_value / (1 + w) ** projection_years
+
+            enterprise_value = pv_projected_fcf + pv_terminal_value
+            equity_value = enterprise_value - self.net_debt
+            intrinsic_value = equity_value / self.shares_outstanding
+            discount_premium = (self.current_price - intrinsic_value) / intrinsic_value * 100
+
+        applicable = (self.fcf_current > 0) & (w > tg) & (self.shares_outstanding > 0)
+        return pd.DataFrame(
+            {
+                "enterprise_value": np.where(applicable, enterprise_value, np.nan),
+                "equity_value": np.where(applicable, equity_value, np.nan),
+                "intrinsic_value_per_share": np.where(applicable, intrinsic_value, np.nan),
+                "discount_premium_pct": np.where(applicable, discount_premium, np.nan),
+            },
+            index=pd.Index(self.tickers, name="ticker"),
+        )
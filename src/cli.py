@@ -14,17 +14,11 @@ from typing import List, Optional, Tuple
 
 import click
 
-from .comparison import (
-    PortfolioView,
-    TickerComparator,
-    format_comparison_json,
-    format_comparison_markdown,
-    format_comparison_table,
-    format_correlation_heatmap,
-)
-from .reporting import ReportGenerator
 from .scoring import ScoringConfig, StockScorer
 
+# The report and comparison modules (pandas, yfinance, ta) are imported inside the
+# commands that use them, so `quant --help` and argument errors return without loading them.
+
 
 def _configure_logging(verbose: bool, quiet: bool):
     """Set up logging based on verbosity flags."""
@@ -97,6 +91,8 @@ def analyze(ctx, ticker, exclude_technical, exclude_fundamental, exclude_risk, e
     output_format = ctx.obj["output_format"]
     period = ctx.obj["period"]
 
+    from .reporting import ReportGenerator
+
     ticker = ticker.upper()
     generator = ReportGenerator(output_dir=output_dir)
 
@@ -152,6 +148,8 @@ def score(ctx, tickers, config_name):
     use_cache = ctx.obj["use_cache"]
     period = ctx.obj["period"]
 
+    from .reporting import ReportGenerator
+
     scoring_config = _get_scoring_config(config_name)
     generator = ReportGenerator(output_dir=output_dir)
     scorer = StockScorer(config=scoring_config)
@@ -235,6 +233,15 @@ def compare(ctx, tickers, config_name, save_chart, weights):
     click.echo(f"  Comparing: {', '.join(tickers_list)}")
     click.echo("=" * 70)
 
+    from .comparison import (
+        PortfolioView,
+        TickerComparator,
+        format_comparison_json,
+        format_comparison_markdown,
+        format_comparison_table,
+        format_correlation_heatmap,
+    )
+
     comparator = TickerComparator(
         tickers=tickers_list,
         period=period,
@@ -354,6 +361,8 @@ def watch(ctx, tickers, interval, count, config_name):
     output_dir = ctx.obj["output_dir"]
     period = ctx.obj["period"]
 
+    from .reporting import ReportGenerator
+
     scoring_config = _get_scoring_config(config_name)
     generator = ReportGenerator(output_dir=output_dir)
     scorer = StockScorer(config=scoring_config)
@@ -5,12 +5,26 @@ Centralized configuration for analysis parameters
 
 import json
 import logging
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, FrozenSet, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Periods and intervals accepted by yfinance; shared by every AnalysisConfig using the defaults
+_VALID_PERIODS = frozenset({"1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"})
+_VALID_INTERVALS = frozenset(
+    {"1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo"}
+)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize set-typed config fields as sorted lists (json.dump default hook)"""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
 @dataclass
 class AnalysisConfig:
@@ -27,6 +41,7 @@ class AnalysisConfig:
     # ==================== Risk Parameters ====================
     risk_free_rate: float = 0.04  # 4% annual
     benchmark_ticker: str = "^GSPC"  # S&P 500 index
+    fast_math: bool = False  # Compute rolling ratio series in float32 (~1e-7 relative error)
 
     # ==================== Technical Analysis ====================
     # Moving averages
@@ -65,47 +80,28 @@ class AnalysisConfig:
     default_period: str = "1y"
     default_interval: str = "1d"
     cache_enabled: bool = True
+    cache_ttl_hours: Optional[float] = None  # None = cached files never expire
 
-    # Validation sets
-    valid_periods: Optional[set] = None
-    valid_intervals: Optional[set] = None
+    # Validation sets (frozen in __post_init__ for O(1) membership checks)
+    valid_periods: Optional[FrozenSet[str]] = None
+    valid_intervals: Optional[FrozenSet[str]] = None
 
     def __post_init__(self):
         """Initialize default values for mutable fields"""
         if self.sma_periods is None:
             self.sma_periods = [20, 50, 200]
 
+        # Defaults share one frozen set; JSON config files provide lists, which are frozen
+        # so lookups stay O(1)
         if self.valid_periods is None:
-            self.valid_periods = {
-                "1d",
-                "5d",
-                "1mo",
-                "3mo",
-                "6mo",
-                "1y",
-                "2y",
-                "5y",
-                "10y",
-                "ytd",
-                "max",
-            }
+            self.valid_periods = _VALID_PERIODS
+        elif not isinstance(self.valid_periods, frozenset):
+            self.valid_periods = frozenset(self.valid_periods)
 
         if self.valid_intervals is None:
-            self.valid_intervals = {
-                "1m",
-                "2m",
-                "5m",
-                "15m",
-                "30m",
-                "60m",
-                "90m",
-                "1h",
-                "1d",
-                "5d",
-                "1wk",
-                "1mo",
-                "3mo",
-            }
+            self.valid_intervals = _VALID_INTERVALS
+        elif not isinstance(self.valid_intervals, frozenset):
+            self.valid_intervals = frozenset(self.valid_intervals)
 
     @classmethod
     def load_from_file(cls, path: Path) -> "AnalysisConfig":
@@ -148,14 +144,11 @@ class AnalysisConfig:
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Convert to dict, excluding non-serializable fields
-            data = asdict(self)
-            # Convert sets to lists for JSON serialization
-            data["valid_periods"] = list(data["valid_periods"])
-            data["valid_intervals"] = list(data["valid_intervals"])
+            # Fields are flat primitives, so a shallow dict avoids asdict()'s deep copy
+            data = {f.name: getattr(self, f.name) for f in fields(self)}
 
             with open(path, "w") as f:
-                json.dump(data, f, indent=2)
+                json.dump(data, f, indent=2, default=_json_default)
 
             logger.info(f"Configuration saved to {path}")
 
@@ -179,8 +172,14 @@ class AnalysisConfig:
         return interval in self.valid_intervals
 
 
-# Global default configuration instance
-_default_config: Optional[AnalysisConfig] = None
+# Configuration installed with set_config(); takes precedence over config.json
+_override_config: Optional[AnalysisConfig] = None
+
+
+@lru_cache(maxsize=1)
+def _load_default_config() -> AnalysisConfig:
+    """Load the default configuration from config.json (once per process)"""
+    return AnalysisConfig.load_from_file(Path("config.json"))
 
 
 def get_config() -> AnalysisConfig:
@@ -190,12 +189,9 @@ def get_config() -> AnalysisConfig:
     Returns:
         Global AnalysisConfig instance
     """
-    global _default_config
-    if _default_config is None:
-        # Try to load from default location
-        config_path = Path("config.json")
-        _default_config = AnalysisConfig.load_from_file(config_path)
-    return _default_config
+    if _override_config is not None:
+        return _override_config
+    return _load_default_config()
 
 
 def set_config(config: AnalysisConfig):
@@ -205,5 +201,7 @@ def set_config(config: AnalysisConfig):
     Args:
         config: AnalysisConfig instance to use globally
     """
-    global _default_config
-    _default_config = config
+    global _override_config
+    _override_config = config
+    # Re-read config.json if the override is ever cleared
+    _load_default_config.cache_clear()
@@ -3,16 +3,33 @@ Data Fetcher Module
 Handles fetching historical market data from Yahoo Finance
 """
 
+import asyncio
 import json
 import logging
-from datetime import datetime
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import pandas as pd
 import yfinance as yf
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .config import get_config
+from .utils.dataframe_utils import optimize_dtypes
 from .utils.serialization import dataframe_to_json_dict, dataframe_to_records, series_to_dataframe
 
 # Configure logging
@@ -23,16 +40,96 @@ logger = logging.getLogger(__name__)
 class DataFetcher:
     """Fetches and caches financial market data"""
 
-    def __init__(self, cache_dir: str = "data"):
+    CACHE_FORMATS = ("parquet", "feather")
+    CACHE_TTL_ENV_VAR = "QUANT_CACHE_TTL"
+    PRICE_DOWNLOAD_BATCH_SIZE = 20  # Tickers per yf.download call in fetch_multiple_tickers
+    PRICE_MEMORY_CACHE_SIZE = 128  # Parsed price frames kept in the in-memory LRU
+
+    # Datetimes pass through to default=str so cached values read the same as with json
+    _ORJSON_CACHE_OPTIONS = (
+        (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+        if orjson is not None
+        else 0
+    )
+
+    def __init__(
+        self,
+        cache_dir: str = "data",
+        cache_format: str = "parquet",
+        cache_ttl: Optional[float] = None,
+    ):
         """
         Initialize DataFetcher
 
         Args:
             cache_dir: Directory to store cached data files
+            cache_format: Price cache format ('parquet' or 'feather')
+            cache_ttl: Hours before a cached file is refetched. Falls back to the
+                QUANT_CACHE_TTL environment variable, then config.cache_ttl_hours.
+                None means cached files never expire.
+
+        Raises:
+            ValueError: If cache_format is not supported
         """
+        if cache_format not in self.CACHE_FORMATS:
+            raise ValueError(
+                f"Invalid cache format '{cache_format}'. "
+                f"Valid options: {list(self.CACHE_FORMATS)}"
+            )
+
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
+        self._cache_root = self.cache_dir.as_posix()
+        self.cache_format = cache_format
         self.config = get_config()
+        self.cache_ttl = self._resolve_cache_ttl(cache_ttl)
+        self._ticker_cache: Dict[str, yf.Ticker] = {}
+        self._ticker_lock = threading.Lock()
+        # key -> (fetch time as a Unix timestamp, parsed prices)
+        self._price_cache: "OrderedDict[tuple, Tuple[float, pd.DataFrame]]" = OrderedDict()
+        self._price_cache_lock = threading.Lock()
+
+    def _resolve_cache_ttl(self, cache_ttl: Optional[float]) -> Optional[float]:
+        """Pick the cache TTL (hours) from argument, environment or config"""
+        if cache_ttl is not None:
+            return cache_ttl
+
+        env_ttl = os.environ.get(self.CACHE_TTL_ENV_VAR)
+        if env_ttl:
+            try:
+                return float(env_ttl)
+            except ValueError:
+                logger.warning(
+                    f"Ignoring invalid {self.CACHE_TTL_ENV_VAR}={env_ttl!r} (expected hours)"
+                )
+
+        return self.config.cache_ttl_hours
+
+    def _get_ticker(self, symbol: str, fresh: bool = False) -> yf.Ticker:
+        """
+        Get a memoized yfinance Ticker for a symbol
+
+        Reusing the Ticker keeps its HTTP session (and open connections) alive
+        across info, history and fundamentals calls for the same symbol. The
+        Ticker also memoizes what it downloads (info, news, statements), so
+        callers bypassing the cache ask for a fresh instance instead.
+
+        Args:
+            symbol: Stock ticker symbol
+            fresh: Build a new, unshared Ticker so no memoized data is returned
+
+        Returns:
+            yfinance Ticker instance
+        """
+        symbol = symbol.upper()
+        if fresh:
+            return yf.Ticker(symbol)
+        with self._ticker_lock:
+            stock = self._ticker_cache.get(symbol)
+            if stock is None:
+                stock = yf.Ticker(symbol)
+                self._ticker_cache[symbol] = stock
+            return stock
 
     def validate_ticker(self, ticker: str) -> bool:
         """
@@ -45,7 +142,7 @@ class DataFetcher:
             True if ticker is valid, False otherwise
         """
         try:
-            stock = yf.Ticker(ticker)
+            stock = self._get_ticker(ticker)
             info = stock.info
             # Valid tickers return a dict with at least some data
             # Empty or error responses will have very few fields
@@ -86,23 +183,18 @@ class DataFetcher:
         # Validate date range if provided
         if start and end:
             try:
-                start_date = datetime.strptime(start, "%Y-%m-%d")
-                end_date = datetime.strptime(end, "%Y-%m-%d")
+                start_date = date.fromisoformat(start)
+                end_date = date.fromisoformat(end)
+            except ValueError as e:
+                raise ValueError(
+                    f"Invalid date format. Use YYYY-MM-DD. " f"Got start='{start}', end='{end}'"
+                ) from e
 
-                if start_date >= end_date:
-                    raise ValueError(f"Start date '{start}' must be before end date '{end}'")
+            if start_date >= end_date:
+                raise ValueError(f"Start date '{start}' must be before end date '{end}'")
 
-                if end_date > datetime.now():
-                    logger.warning(
-                        f"End date '{end}' is in the future, " f"using current date instead"
-                    )
-
-            except ValueError as e:
-                if "does not match format" in str(e):
-                    raise ValueError(
-                        f"Invalid date format. Use YYYY-MM-DD. " f"Got start='{start}', end='{end}'"
-                    ) from e
-                raise
+            if end_date > date.today():
+                logger.warning(f"End date '{end}' is in the future, " f"using current date instead")
 
     def fetch_ticker(
         self,
@@ -137,6 +229,14 @@ class DataFetcher:
         # Validate parameters
         self._validate_params(period, interval, start, end)
 
+        memory_key = (ticker, start, end, period, interval)
+        cache_file = self._get_cache_filename(ticker, start, end, period, interval)
+
+        if use_cache:
+            cached = self._load_cached_prices(memory_key, cache_file)
+            if cached is not None:
+                return cached
+
         # Validate ticker symbol
         if not self.validate_ticker(ticker):
             raise ValueError(
@@ -144,21 +244,10 @@ class DataFetcher:
                 f"Please verify the symbol exists."
             )
 
-        cache_file = self._get_cache_filename(ticker, start, end, period, interval)
-
-        # Check cache
-        if use_cache and cache_file.exists():
-            logger.info(f"Loading cached data for {ticker} from {cache_file}")
-            try:
-                return pd.read_csv(cache_file, index_col=0, parse_dates=True)
-            except Exception as e:
-                logger.warning(f"Failed to load cache for {ticker}: {e}")
-                logger.info("Fetching fresh data instead")
-
         # Fetch from Yahoo Finance
         logger.info(f"Fetching data for {ticker} from Yahoo Finance")
         try:
-            stock = yf.Ticker(ticker)
+            stock = self._get_ticker(ticker, fresh=not use_cache)
 
             if start and end:
                 data = stock.history(start=start, end=end, interval=interval)
@@ -172,17 +261,9 @@ class DataFetcher:
                     f"or no data available for the specified period/interval."
                 )
 
-            # Save to cache
-            try:
-                cache_file.parent.mkdir(parents=True, exist_ok=True)
-                data.to_csv(cache_file)
-                logger.info(f"Cached data saved to {cache_file}")
-            except PermissionError:
-                logger.warning(f"Permission denied writing cache to {cache_file}")
-            except OSError as e:
-                logger.warning(f"Failed to write cache: {e}")
-
-            return data
+            data = optimize_dtypes(data)
+            self._store_fetched_prices(memory_key, cache_file, data)
+            return data.copy(deep=False)
 
         except ValueError:
             # Re-raise ValueError (ticker/param validation)
@@ -222,10 +303,17 @@ class DataFetcher:
         period: str = "1y",
         interval: str = "1d",
         use_cache: bool = True,
+        max_workers: int = 8,
     ) -> dict[str, pd.DataFrame]:
         """
         Fetch data for multiple tickers
 
+        Cache misses are downloaded with yf.download in batches of
+        PRICE_DOWNLOAD_BATCH_SIZE, which skips the per-ticker info request
+        fetch_ticker makes to validate the symbol. Tickers the batch does not
+        return are fetched individually in parallel on a thread pool, which
+        also reports why they failed.
+
         Args:
             tickers: List of ticker symbols
             start: Start date (YYYY-MM-DD format)
@@ -233,18 +321,213 @@ class DataFetcher:
             period: Period to fetch
             interval: Data interval
             use_cache: Whether to use cached data
+            max_workers: Maximum number of tickers fetched at once (bounded to
+                stay within Yahoo Finance rate limits)
 
         Returns:
             Dictionary mapping ticker symbols to DataFrames
         """
+        fetched: Dict[str, pd.DataFrame] = {}
+        if not tickers:
+            return fetched
+
+        try:
+            self._validate_params(period, interval, start, end)
+        except ValueError:
+            # Let the per-ticker path report the invalid parameters
+            pending = list(tickers)
+        else:
+            pending = []
+            for ticker in tickers:
+                symbol = ticker.upper()
+                cached = (
+                    self._load_cached_prices(
+                        (symbol, start, end, period, interval),
+                        self._get_cache_filename(symbol, start, end, period, interval),
+                    )
+                    if use_cache
+                    else None
+                )
+                if cached is not None:
+                    fetched[ticker] = cached
+                else:
+                    pending.append(ticker)
+
+            batch_size = self.PRICE_DOWNLOAD_BATCH_SIZE
+            for i in range(0, len(pending), batch_size):
+                fetched.update(
+                    self._download_price_batch(
+                        pending[i : i + batch_size], start, end, period, interval
+                    )
+                )
+            pending = [ticker for ticker in pending if ticker not in fetched]
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as executor:
+                futures = {
+                    ticker: executor.submit(
+                        self.fetch_ticker, ticker, start, end, period, interval, use_cache
+                    )
+                    for ticker in pending
+                }
+
+            for ticker, future in futures.items():
+                error = future.exception()
+                if error is not None:
+                    logger.warning(f"Failed to fetch {ticker}: {error}")
+                    continue
+                fetched[ticker] = future.result()
+
+        # Keep the caller's ticker order
+        return {ticker: fetched[ticker] for ticker in tickers if ticker in fetched}
+
+    def _download_price_batch(
+        self,
+        tickers: List[str],
+        start: Optional[str],
+        end: Optional[str],
+        period: str,
+        interval: str,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Download prices for several tickers with one yf.download call and cache each
+
+        Args:
+            tickers: Ticker symbols (as given by the caller)
+            start: Start date (YYYY-MM-DD format)
+            end: End date (YYYY-MM-DD format)
+            period: Period to fetch
+            interval: Data interval
+
+        Returns:
+            Dictionary mapping the tickers that returned data to their DataFrames
+        """
+        symbols = [ticker.upper() for ticker in tickers]
+        range_kwargs = {"start": start, "end": end} if start and end else {"period": period}
+
+        logger.info(f"Fetching data for {len(symbols)} tickers from Yahoo Finance")
+        try:
+            # Match Ticker.history: adjusted prices, dividend/split columns, tz-aware index
+            # (yf.download puts the whole batch in one timezone; restored per ticker below)
+            data = yf.download(
+                symbols,
+                interval=interval,
+                group_by="ticker",
+                auto_adjust=True,
+                actions=True,
+                ignore_tz=False,
+                threads=True,
+                progress=False,
+                **range_kwargs,
+            )
+        except Exception as e:
+            logger.warning(f"Batch download failed, fetching tickers individually: {e}")
+            return {}
+
+        if data is None or data.empty:
+            return {}
+
         results = {}
+        multi_ticker = isinstance(data.columns, pd.MultiIndex)
+        available = set(data.columns.get_level_values(0)) if multi_ticker else set()
+        for ticker, symbol in zip(tickers, symbols):
+            if multi_ticker:
+                if symbol not in available:
+                    continue
+                frame = data[symbol]
+            elif len(symbols) == 1:
+                frame = data
+            else:
+                continue
 
-        for ticker in tickers:
-            try:
-                results[ticker] = self.fetch_ticker(ticker, start, end, period, interval, use_cache)
-            except Exception as e:
-                logger.warning(f"Failed to fetch {ticker}: {e}")
+            # Rows from other tickers' trading calendars are all-NaN for this one
+            subset = ["Close"] if "Close" in frame.columns else None
+            frame = frame.dropna(how="all", subset=subset).rename_axis(columns=None)
+            if frame.empty:
+                continue
+
+            # The batch index is in the most common exchange timezone; convert back so
+            # other exchanges' daily bars keep their own dates. Unknown timezones are
+            # left to the per-ticker fetch.
+            exchange_tz = self._exchange_timezone(symbol)
+            if exchange_tz is None:
+                continue
+            frame = optimize_dtypes(frame.tz_convert(exchange_tz))
+            self._store_fetched_prices(
+                (symbol, start, end, period, interval),
+                self._get_cache_filename(symbol, start, end, period, interval),
+                frame,
+            )
+            results[ticker] = frame.copy(deep=False)
+
+        return results
+
+    def _exchange_timezone(self, symbol: str) -> Optional[str]:
+        """
+        Look up the exchange timezone yfinance cached for a symbol
+
+        yf.download records each ticker's timezone while downloading it, so this
+        needs no extra request after a batch download.
+
+        Args:
+            symbol: Ticker symbol (upper case, as passed to yf.download)
+
+        Returns:
+            IANA timezone name, or None if yfinance has no cached timezone
+        """
+        try:
+            return yf.cache.get_tz_cache().lookup(symbol)
+        except Exception as e:
+            logger.debug(f"No cached timezone for {symbol}: {e}")
+            return None
+
+    async def fetch_multiple_tickers_async(
+        self,
+        tickers: List[str],
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        period: str = "1y",
+        interval: str = "1d",
+        use_cache: bool = True,
+        max_concurrency: int = 8,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Fetch data for multiple tickers concurrently
+
+        Each ticker is fetched in a worker thread so the network round-trips
+        overlap instead of running back to back. Concurrency is bounded to
+        stay within Yahoo Finance rate limits.
+
+        Args:
+            tickers: List of ticker symbols
+            start: Start date (YYYY-MM-DD format)
+            end: End date (YYYY-MM-DD format)
+            period: Period to fetch
+            interval: Data interval
+            use_cache: Whether to use cached data
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            Dictionary mapping ticker symbols to DataFrames
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_one(ticker: str) -> pd.DataFrame:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.fetch_ticker, ticker, start, end, period, interval, use_cache
+                )
+
+        fetched = await asyncio.gather(
+            *(fetch_one(ticker) for ticker in tickers), return_exceptions=True
+        )
+
+        results = {}
+        for ticker, data in zip(tickers, fetched):
+            if isinstance(data, BaseException):
+                logger.warning(f"Failed to fetch {ticker}: {data}")
                 continue
+            results[ticker] = data
 
         return results
 
@@ -264,17 +547,17 @@ class DataFetcher:
             to allow other report sections to continue
         """
         ticker = ticker.upper()
-        cache_file = self._get_cache_file_path(ticker, "info.json")
+        cache_file = self._get_cache_file_path(ticker, "info")
 
         # Check cache
         if use_cache:
-            cached = self._load_json_cache(cache_file)
+            cached = self._load_cache(cache_file)
             if cached is not None:
                 logger.info(f"Loaded cached ticker info for {ticker}")
                 return cached
 
         try:
-            stock = yf.Ticker(ticker)
+            stock = self._get_ticker(ticker, fresh=not use_cache)
             info = stock.info
 
             # Validate we got meaningful data
@@ -322,7 +605,7 @@ class DataFetcher:
 
             # Cache the result
             try:
-                self._save_json_cache(cache_file, result)
+                self._save_cache(cache_file, result)
             except (PermissionError, OSError) as e:
                 logger.warning(f"Failed to cache ticker info for {ticker}: {e}")
 
@@ -367,7 +650,7 @@ class DataFetcher:
         return self._fetch_resource(
             ticker=ticker,
             resource_name="fundamentals",
-            cache_filename="fundamentals.json",
+            cache_name="fundamentals",
             fetch_fn=fetch_fn,
             serialize_fn=lambda r: {
                 k: dataframe_to_json_dict(v) if not v.empty else {} for k, v in r.items()
@@ -403,7 +686,7 @@ class DataFetcher:
         return self._fetch_resource(
             ticker=ticker,
             resource_name="earnings",
-            cache_filename="earnings.json",
+            cache_name="earnings",
             fetch_fn=fetch_fn,
             serialize_fn=lambda r: {
                 k: dataframe_to_records(v) if not v.empty else [] for k, v in r.items()
@@ -437,7 +720,7 @@ class DataFetcher:
         return self._fetch_resource(
             ticker=ticker,
             resource_name="holders",
-            cache_filename="holders.json",
+            cache_name="holders",
             fetch_fn=fetch_fn,
             serialize_fn=lambda r: {
                 k: dataframe_to_records(v, preserve_index=False) if not v.empty else []
@@ -460,11 +743,11 @@ class DataFetcher:
             Dictionary with 'dividends', 'splits', and 'actions' DataFrames
         """
         ticker = ticker.upper()
-        cache_file = self._get_cache_file_path(ticker, "dividends.json")
+        cache_file = self._get_cache_file_path(ticker, "dividends")
 
         # Check cache
         if use_cache:
-            cached = self._load_json_cache(cache_file)
+            cached = self._load_cache(cache_file)
             if cached is not None:
                 return {
                     "dividends": pd.DataFrame(cached.get("dividends", {})),
@@ -474,7 +757,7 @@ class DataFetcher:
 
         try:
             logger.info(f"Fetching dividends for {ticker}")
-            stock = yf.Ticker(ticker)
+            stock = self._get_ticker(ticker, fresh=not use_cache)
 
             # Get data and convert Series to DataFrame if needed
             dividends_data = getattr(stock, "dividends", pd.Series())
@@ -511,7 +794,7 @@ class DataFetcher:
                 k: dataframe_to_records(v) if not v.empty else [] for k, v in result.items()
             }
 
-            self._save_json_cache(cache_file, cache_data)
+            self._save_cache(cache_file, cache_data)
 
             return result
 
@@ -553,7 +836,7 @@ class DataFetcher:
         return self._fetch_resource(
             ticker=ticker,
             resource_name="analyst ratings",
-            cache_filename="analyst_ratings.json",
+            cache_name="analyst_ratings",
             fetch_fn=fetch_fn,
             serialize_fn=lambda r: {
                 k: dataframe_to_records(v) if not v.empty else [] for k, v in r.items()
@@ -577,24 +860,24 @@ class DataFetcher:
             List of news article dictionaries with title, publisher, link, etc.
         """
         ticker = ticker.upper()
-        cache_file = self._get_cache_file_path(ticker, "news.json")
+        cache_file = self._get_cache_file_path(ticker, "news")
 
         # Check cache
         if use_cache:
-            cached = self._load_json_cache(cache_file)
+            cached = self._load_cache(cache_file)
             if cached is not None:
                 return cached
 
         try:
             logger.info(f"Fetching news for {ticker}")
-            stock = yf.Ticker(ticker)
+            stock = self._get_ticker(ticker, fresh=not use_cache)
 
             # Get news safely
             news_data = getattr(stock, "news", [])
             news = news_data if isinstance(news_data, list) else []
 
             # Cache the result
-            self._save_json_cache(cache_file, news)
+            self._save_cache(cache_file, news)
 
             return news
 
@@ -602,42 +885,143 @@ class DataFetcher:
             logger.error(f"Error fetching news for {ticker}: {e}")
             return []
 
+    def fetch_all(self, ticker: str, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Fetch all metadata resources for a ticker concurrently
+
+        Info, fundamentals, earnings, holders, dividends, analyst ratings and
+        news are independent network requests, so they run on a thread pool
+        and the total latency is that of the slowest one. All of them share
+        the memoized yfinance Ticker for the symbol.
+
+        Args:
+            ticker: Stock ticker symbol
+            use_cache: Whether to use cached data (news is always fetched fresh)
+
+        Returns:
+            Dictionary with keys 'info', 'fundamentals', 'earnings', 'holders',
+            'dividends', 'analyst_ratings' and 'news'
+        """
+        ticker = ticker.upper()
+        jobs: Dict[str, Callable[[], Any]] = {
+            "info": lambda: self.get_ticker_info(ticker, use_cache),
+            "fundamentals": lambda: self.fetch_fundamentals(ticker, use_cache),
+            "earnings": lambda: self.fetch_earnings(ticker, use_cache),
+            "holders": lambda: self.fetch_institutional_holders(ticker, use_cache),
+            "dividends": lambda: self.fetch_dividends(ticker, use_cache),
+            "analyst_ratings": lambda: self.fetch_analyst_ratings(ticker, use_cache),
+            "news": lambda: self.fetch_news(ticker),
+        }
+
+        # Build the shared Ticker up front instead of racing on first use
+        if use_cache:
+            self._get_ticker(ticker)
+
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {name: executor.submit(fn) for name, fn in jobs.items()}
+
+        results = {}
+        for name, future in futures.items():
+            error = future.exception()
+            if error is not None:
+                logger.warning(f"Failed to fetch {name} for {ticker}: {error}")
+                results[name] = None
+                continue
+            results[name] = future.result()
+
+        return results
+
+    # ==================== Async Wrappers ====================
+
+    async def get_ticker_info_async(self, ticker: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Async variant of get_ticker_info (runs in a worker thread)"""
+        return await asyncio.to_thread(self.get_ticker_info, ticker, use_cache)
+
+    async def fetch_fundamentals_async(
+        self, ticker: str, use_cache: bool = True
+    ) -> Dict[str, pd.DataFrame]:
+        """Async variant of fetch_fundamentals (runs in a worker thread)"""
+        return await asyncio.to_thread(self.fetch_fundamentals, ticker, use_cache)
+
+    async def fetch_earnings_async(
+        self, ticker: str, use_cache: bool = True
+    ) -> Dict[str, pd.DataFrame]:
+        """Async variant of fetch_earnings (runs in a worker thread)"""
+        return await asyncio.to_thread(self.fetch_earnings, ticker, use_cache)
+
+    async def fetch_institutional_holders_async(
+        self, ticker: str, use_cache: bool = True
+    ) -> Dict[str, pd.DataFrame]:
+        """Async variant of fetch_institutional_holders (runs in a worker thread)"""
+        return await asyncio.to_thread(self.fetch_institutional_holders, ticker, use_cache)
+
     # ==================== Cache Helper Methods ====================
 
-    def _get_cache_file_path(self, ticker: str, filename: str) -> Path:
+    def _get_cache_file_path(self, ticker: str, name: str) -> Path:
         """
-        Get cache file path and ensure directory exists
+        Get metadata cache file path (the directory is created when the file is written)
+
+        The cache is stored as msgpack (.mpk) when msgpack is installed and as
+        JSON (.json) otherwise.
 
         Args:
             ticker: Stock ticker symbol
-            filename: Name of cache file (e.g., 'info.json', 'fundamentals.json')
+            name: Cache name without extension (e.g., 'info', 'fundamentals')
 
         Returns:
             Path object for the cache file
         """
-        cache_dir = self.cache_dir / ticker / "cache"
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir / filename
+        suffix = "mpk" if msgpack is not None else "json"
+        return Path(f"{self._cache_root}/{ticker}/cache/{name}.{suffix}")
+
+    def _is_cache_fresh(self, cache_path: Path) -> bool:
+        """
+        Check that a cache file exists and is younger than the cache TTL
+
+        Args:
+            cache_path: Path to cache file
+
+        Returns:
+            True if the file can be used
+        """
+        try:
+            mtime = cache_path.stat().st_mtime
+        except OSError:
+            return False
+
+        if self._is_expired(mtime):
+            logger.info(f"Cache expired: {cache_path}")
+            return False
+        return True
+
+    def _is_expired(self, fetched_at: float) -> bool:
+        """Check whether data fetched at a Unix timestamp is older than the cache TTL"""
+        return self.cache_ttl is not None and time.time() - fetched_at > self.cache_ttl * 3600
 
-    def _load_json_cache(self, cache_path: Path) -> Optional[Any]:
+    def _load_cache(self, cache_path: Path) -> Optional[Any]:
         """
-        Load data from JSON cache file if it exists
+        Load data from a metadata cache file (msgpack or JSON) if it exists
 
         Args:
             cache_path: Path to cache file
 
         Returns:
-            Cached data or None if cache doesn't exist or is invalid
+            Cached data or None if cache doesn't exist, has expired or is invalid
         """
-        if not cache_path.exists():
+        if not self._is_cache_fresh(cache_path):
             return None
 
         try:
             logger.info(f"Loading from cache: {cache_path}")
+            if cache_path.suffix == ".mpk":
+                return msgpack.unpackb(cache_path.read_bytes(), raw=False, strict_map_key=False)
+            if orjson is not None:
+                return orjson.loads(cache_path.read_bytes())
             with open(cache_path, "r") as f:
                 return json.load(f)
-        except json.JSONDecodeError as e:
-            logger.warning(f"Invalid JSON in cache file {cache_path}: {e}")
+        except ValueError as e:
+            # Covers json/orjson.JSONDecodeError and msgpack's unpack errors
+            logger.warning(f"Invalid data in cache file {cache_path}: {e}")
             logger.info("Cache will be regenerated")
             return None
         except PermissionError:
@@ -647,9 +1031,9 @@ class DataFetcher:
             logger.warning(f"OS error reading cache {cache_path}: {e}")
             return None
 
-    def _save_json_cache(self, cache_path: Path, data: Any) -> None:
+    def _save_cache(self, cache_path: Path, data: Any) -> None:
         """
-        Save data to JSON cache file with error handling
+        Save data to a metadata cache file (msgpack or JSON) with error handling
 
         Args:
             cache_path: Path to cache file
@@ -661,15 +1045,24 @@ class DataFetcher:
         """
         try:
             cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(cache_path, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+            if cache_path.suffix == ".mpk":
+                cache_path.write_bytes(msgpack.packb(data, default=str, use_bin_type=True))
+            elif orjson is not None:
+                cache_path.write_bytes(
+                    orjson.dumps(data, default=str, option=self._ORJSON_CACHE_OPTIONS)
+                )
+            else:
+                # Compact output: the cache is machine-read, indentation only costs time and bytes
+                with open(cache_path, "w") as f:
+                    json.dump(data, f, separators=(",", ":"), default=str)
             logger.info(f"Saved to cache: {cache_path}")
         except PermissionError:
             logger.warning(f"Permission denied writing cache to {cache_path}")
         except OSError as e:
             logger.warning(f"OS error saving cache to {cache_path}: {e}")
         except TypeError as e:
-            logger.warning(f"Data not JSON-serializable for {cache_path}: {e}")
+            # Also covers orjson.JSONEncodeError
+            logger.warning(f"Data not serializable for {cache_path}: {e}")
 
     # ==================== Fetch Template ====================
 
@@ -677,7 +1070,7 @@ class DataFetcher:
         self,
         ticker: str,
         resource_name: str,
-        cache_filename: str,
+        cache_name: str,
         fetch_fn: Callable[[yf.Ticker], Dict[str, pd.DataFrame]],
         serialize_fn: Callable[[Dict[str, pd.DataFrame]], Any],
         deserialize_fn: Callable[[Any], Dict[str, pd.DataFrame]],
@@ -690,7 +1083,7 @@ class DataFetcher:
         Args:
             ticker: Stock ticker symbol
             resource_name: Human-readable name for logging
-            cache_filename: Cache file name (e.g., 'fundamentals.json')
+            cache_name: Cache name without extension (e.g., 'fundamentals')
             fetch_fn: Function that fetches data from yfinance Ticker
             serialize_fn: Function to serialize data for caching
             deserialize_fn: Function to deserialize cached data
@@ -701,41 +1094,207 @@ class DataFetcher:
             Dictionary with fetched data
         """
         ticker = ticker.upper()
-        cache_file = self._get_cache_file_path(ticker, cache_filename)
+        cache_file = self._get_cache_file_path(ticker, cache_name)
 
         # Check cache
         if use_cache:
-            cached = self._load_json_cache(cache_file)
+            cached = self._load_cache(cache_file)
             if cached is not None:
                 return deserialize_fn(cached)
 
         try:
             logger.info(f"Fetching {resource_name} for {ticker}")
-            stock = yf.Ticker(ticker)
+            stock = self._get_ticker(ticker, fresh=not use_cache)
             result = fetch_fn(stock)
             cache_data = serialize_fn(result)
-            self._save_json_cache(cache_file, cache_data)
+            self._save_cache(cache_file, cache_data)
             return result
 
         except Exception as e:
             logger.error(f"Error fetching {resource_name} for {ticker}: {e}")
             return empty_result
 
+    def _load_cached_prices(self, key: tuple, cache_file: Path) -> Optional[pd.DataFrame]:
+        """
+        Look up price data in the in-memory cache, then in a fresh disk cache file
+
+        Cached data skips ticker validation (it was validated when first fetched).
+
+        Args:
+            key: (ticker, start, end, period, interval) tuple
+            cache_file: Path to the price cache file
+
+        Returns:
+            Shallow copy of the cached DataFrame, or None on a cache miss
+        """
+        cached = self._get_memory_cached_prices(key)
+        if cached is not None:
+            return cached
+
+        if not self._is_cache_fresh(cache_file):
+            return self._load_legacy_csv_prices(key, cache_file)
+
+        logger.info(f"Loading cached data for {key[0]} from {cache_file}")
+        try:
+            fetched_at = cache_file.stat().st_mtime
+            data = optimize_dtypes(self._read_price_cache(cache_file))
+        except Exception as e:
+            logger.warning(f"Failed to load cache for {key[0]}: {e}")
+            logger.info("Fetching fresh data instead")
+            return None
+
+        self._set_memory_cached_prices(key, data, fetched_at)
+        return data.copy(deep=False)
+
+    def _load_legacy_csv_prices(self, key: tuple, cache_file: Path) -> Optional[pd.DataFrame]:
+        """
+        Read a price cache written as CSV by older versions and migrate it
+
+        The CSV file is converted to the configured cache format on first read,
+        so later loads skip the text parsing.
+
+        Args:
+            key: (ticker, start, end, period, interval) tuple
+            cache_file: Path to the (missing or stale) price cache file
+
+        Returns:
+            Shallow copy of the cached DataFrame, or None if there is no fresh CSV cache
+        """
+        legacy_file = cache_file.with_suffix(".csv")
+        if not self._is_cache_fresh(legacy_file):
+            return None
+
+        logger.info(f"Loading legacy CSV cache for {key[0]} from {legacy_file}")
+        try:
+            legacy_stat = legacy_file.stat()
+            data = pd.read_csv(legacy_file, index_col=0)
+            # Offsets change across DST, so parse as UTC and convert back to the exchange
+            # timezone (kept in UTC if yfinance has not cached it)
+            index = pd.to_datetime(data.index, utc=True)
+            exchange_tz = self._exchange_timezone(key[0])
+            data.index = index.tz_convert(exchange_tz) if exchange_tz else index
+            data = optimize_dtypes(data)
+        except Exception as e:
+            logger.warning(f"Failed to load legacy cache for {key[0]}: {e}")
+            return None
+
+        try:
+            self._write_price_cache(data, cache_file)
+            # Keep the original fetch time so the cache TTL still applies
+            os.utime(cache_file, (legacy_stat.st_atime, legacy_stat.st_mtime))
+            legacy_file.unlink()
+            logger.info(f"Migrated {legacy_file} to {cache_file}")
+        except Exception as e:
+            logger.warning(f"Could not migrate legacy cache {legacy_file}: {e}")
+
+        self._set_memory_cached_prices(key, data, legacy_stat.st_mtime)
+        return data.copy(deep=False)
+
+    def _store_fetched_prices(self, key: tuple, cache_file: Path, data: pd.DataFrame):
+        """
+        Save freshly fetched price data to the disk and in-memory caches
+
+        Disk write failures are logged; the data is still kept in memory.
+
+        Args:
+            key: (ticker, start, end, period, interval) tuple
+            cache_file: Path to the price cache file
+            data: Price DataFrame
+        """
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self._write_price_cache(data, cache_file)
+            logger.info(f"Cached data saved to {cache_file}")
+        except PermissionError:
+            logger.warning(f"Permission denied writing cache to {cache_file}")
+        except OSError as e:
+            logger.warning(f"Failed to write cache: {e}")
+        except ImportError as e:
+            logger.warning(f"Price cache disabled, {self.cache_format} support missing: {e}")
+
+        self._set_memory_cached_prices(key, data, time.time())
+
+    def _get_memory_cached_prices(self, key: tuple) -> Optional[pd.DataFrame]:
+        """
+        Look up parsed price data in the in-memory LRU cache
+
+        Entries older than the cache TTL are dropped, like expired disk files.
+
+        Args:
+            key: (ticker, start, end, period, interval) tuple
+
+        Returns:
+            Shallow copy of the cached DataFrame, or None if not cached or expired
+        """
+        with self._price_cache_lock:
+            entry = self._price_cache.get(key)
+            if entry is None:
+                return None
+            fetched_at, data = entry
+            if self._is_expired(fetched_at):
+                del self._price_cache[key]
+                logger.info(f"In-memory price data expired for {key[0]}")
+                return None
+            self._price_cache.move_to_end(key)
+        logger.debug(f"Using in-memory price data for {key[0]}")
+        return data.copy(deep=False)
+
+    def _set_memory_cached_prices(self, key: tuple, data: pd.DataFrame, fetched_at: float):
+        """
+        Store parsed price data in the in-memory LRU cache
+
+        Args:
+            key: (ticker, start, end, period, interval) tuple
+            data: Price DataFrame
+            fetched_at: Unix timestamp of when the data was fetched from Yahoo Finance
+        """
+        with self._price_cache_lock:
+            self._price_cache[key] = (fetched_at, data)
+            self._price_cache.move_to_end(key)
+            while len(self._price_cache) > self.PRICE_MEMORY_CACHE_SIZE:
+                self._price_cache.popitem(last=False)
+
+    def _read_price_cache(self, cache_file: Path) -> pd.DataFrame:
+        """
+        Read cached price data in the configured format
+
+        Args:
+            cache_file: Path to cache file
+
+        Returns:
+            DataFrame with DatetimeIndex
+        """
+        if self.cache_format == "feather":
+            data = pd.read_feather(cache_file)
+            return data.set_index(data.columns[0])
+        return pd.read_parquet(cache_file, engine="pyarrow")
+
+    def _write_price_cache(self, data: pd.DataFrame, cache_file: Path):
+        """
+        Write price data to cache in the configured format (zstd-compressed)
+
+        Args:
+            data: Price DataFrame with DatetimeIndex
+            cache_file: Path to cache file
+        """
+        if self.cache_format == "feather":
+            # Feather requires a default index, so store the dates as a column
+            data.reset_index().to_feather(cache_file, compression="zstd")
+        else:
+            data.to_parquet(cache_file, engine="pyarrow", compression="zstd", index=True)
+
     # ==================== Legacy Methods ====================
 
     def _get_cache_filename(
         self, ticker: str, start: Optional[str], end: Optional[str], period: str, interval: str
     ) -> Path:
-        """Generate cache filename based on parameters (for CSV price data)"""
-        # Create cache subdirectory
-        cache_dir = self.cache_dir / ticker / "cache"
-        cache_dir.mkdir(parents=True, exist_ok=True)
-
+        """Generate cache filename based on parameters (for price data)"""
+        # The directory is created by fetch_ticker when the cache is written
         if start and end:
-            filename = f"prices_{start}_{end}_{interval}.csv"
+            filename = f"prices_{start}_{end}_{interval}.{self.cache_format}"
         else:
-            filename = f"prices_{period}_{interval}.csv"
-        return cache_dir / filename
+            filename = f"prices_{period}_{interval}.{self.cache_format}"
+        return Path(f"{self._cache_root}/{ticker}/cache/{filename}")
 
     def clear_cache(self, ticker: Optional[str] = None):
         """
@@ -744,6 +1303,13 @@ class DataFetcher:
         Args:
             ticker: If specified, only clear cache for this ticker. Otherwise clear all.
         """
+        with self._price_cache_lock:
+            if ticker:
+                for key in [k for k in self._price_cache if k[0] == ticker.upper()]:
+                    del self._price_cache[key]
+            else:
+                self._price_cache.clear()
+
         if ticker:
             ticker = ticker.upper()
             ticker_dir = self.cache_dir / ticker
@@ -5,9 +5,10 @@ Aggregates and formats data from DataFetcher into comprehensive reports
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -100,6 +101,10 @@ class ReportGenerator:
             "period": period,
         }
 
+        # Fetch the inputs shared by several sections and analyses once, before any
+        # worker starts, so concurrent workers never refetch or rewrite the same cache file
+        shared_inputs = self._fetch_shared_inputs(ticker, use_cache)
+
         # Fetch data from all sections
         for section_name, section in self.sections.items():
             try:
@@ -108,102 +113,64 @@ class ReportGenerator:
                     ticker,
                     use_cache=use_cache,
                     period=period,  # Pass through for price data
+                    **shared_inputs,
                 )
                 report_data[section_name] = section.format_for_json(raw_data)
             except Exception as e:
                 logger.error(f"Error processing {section_name} section: {e}")
                 report_data[section_name] = None
 
-        # Add technical analysis if requested
-        technical_analyzer = None
-        if include_technical:
-            try:
-                tech_section = TechnicalAnalysisSection()
-                technical_analyzer = tech_section.fetch_data(
-                    self.fetcher,
-                    ticker,
-                    use_cache=use_cache,
-                    period="1y",  # Force 1y for technical analysis
-                )
-                report_data["technical_analysis"] = tech_section.format_for_json(technical_analyzer)
-            except Exception as e:
-                logger.error(f"Error processing technical analysis: {e}")
-                report_data["technical_analysis"] = None
+        # Fetch shared price data once; the analysis sections below reuse it
+        try:
+            price_data_1y = self.fetcher.fetch_ticker(ticker, period="1y", use_cache=use_cache)
+        except Exception as e:
+            logger.warning(f"Could not fetch price data for analysis: {e}")
+            price_data_1y = None
 
-        # Add fundamental analysis if requested
-        fundamental_analyzer = None
+        # Run the requested analyses concurrently; they are independent of each other
+        tasks: Dict[str, Tuple[Callable[..., Any], tuple]] = {}
+        if include_technical:
+            tasks["technical_analysis"] = (
+                self._run_technical_analysis,
+                (ticker, use_cache, price_data_1y, shared_inputs),
+            )
         if include_fundamental:
-            try:
-                fund_section = FundamentalAnalysisSection()
-                # Pass price data if available for market-based calculations
-                price_data = self.fetcher.fetch_ticker(ticker, period="1y", use_cache=use_cache)
-                fundamental_analyzer = fund_section.fetch_data(
-                    self.fetcher, ticker, use_cache=use_cache, price_data=price_data
-                )
-                report_data["fundamental_analysis"] = fund_section.format_for_json(
-                    fundamental_analyzer
-                )
-            except Exception as e:
-                logger.error(f"Error processing fundamental analysis: {e}")
-                report_data["fundamental_analysis"] = None
-
-        # Add risk analysis if requested
-        risk_analyzer_tuple = None
+            tasks["fundamental_analysis"] = (
+                self._run_fundamental_analysis,
+                (ticker, use_cache, price_data_1y, shared_inputs),
+            )
         if include_risk:
-            try:
-                risk_section = RiskAnalysisSection()
-                # Reuse price data from fundamental analysis if available
-                price_data = self.fetcher.fetch_ticker(ticker, period=period, use_cache=use_cache)
-                risk_analyzer_tuple = risk_section.fetch_data(
-                    self.fetcher, ticker, use_cache=use_cache, price_data=price_data, period=period
-                )
-                report_data["risk_analysis"] = risk_section.format_for_json(risk_analyzer_tuple)
-            except Exception as e:
-                logger.error(f"Error processing risk analysis: {e}")
-                report_data["risk_analysis"] = None
-
-        # Add valuation analysis if requested
-        valuation_analyzer = None
+            risk_price_data = price_data_1y if period == "1y" else None
+            tasks["risk_analysis"] = (
+                self._run_risk_analysis,
+                (ticker, use_cache, period, risk_price_data),
+            )
         if include_valuation:
-            try:
-                from ..analysis import ValuationAnalyzer
-
-                # Fetch required data
-                price_data = self.fetcher.fetch_ticker(ticker, period="1y", use_cache=use_cache)
-                fundamentals = self.fetcher.fetch_fundamentals(ticker, use_cache=use_cache)
-                earnings_data = self.fetcher.fetch_earnings(ticker, use_cache=use_cache)
-
-                # Fetch dividends and convert to Series
-                div_data = self.fetcher.fetch_dividends(ticker, use_cache=use_cache)
-                dividends_series = None
-                if div_data and div_data.get("dividends") is not None:
-                    dividends_df = div_data["dividends"]
-                    if not dividends_df.empty:
-                        # Check if Date is already the index or a column
-                        if "Date" in dividends_df.columns:
-                            dividends_series = dividends_df.set_index("Date")["Dividends"]
-                        elif dividends_df.index.name == "Date":
-                            dividends_series = dividends_df["Dividends"]
-                        else:
-                            logger.warning("Dividends DataFrame has unexpected structure")
-                            dividends_series = dividends_df.iloc[:, 0]  # Fallback to first column
-
-                # Create analyzer
-                valuation_analyzer = ValuationAnalyzer(
-                    ticker=ticker,
-                    ticker_info=report_data.get("info", {}),
-                    price_data=price_data,
-                    fundamentals=fundamentals,
-                    earnings_data=earnings_data,
-                    dividends_data=dividends_series,
-                )
+            tasks["valuation_analysis"] = (
+                self._run_valuation_analysis,
+                (ticker, use_cache, price_data_1y, shared_inputs),
+            )
 
-                # Run analysis
-                valuation_results = valuation_analyzer.analyze()
-                report_data["valuation_analysis"] = valuation_results
-            except Exception as e:
-                logger.error(f"Error processing valuation analysis: {e}")
-                report_data["valuation_analysis"] = None
+        # Reserve keys up front so report ordering doesn't depend on completion order
+        analyzers: Dict[str, Any] = {}
+        for name in tasks:
+            report_data[name] = None
+
+        if tasks:
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = {executor.submit(fn, *args): name for name, (fn, args) in tasks.items()}
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        analyzers[name], report_data[name] = future.result()
+                    except Exception as e:
+                        logger.error(f"Error processing {name.replace('_', ' ')}: {e}")
+                        analyzers[name], report_data[name] = None, None
+
+        technical_analyzer = analyzers.get("technical_analysis")
+        fundamental_analyzer = analyzers.get("fundamental_analysis")
+        risk_analyzer_tuple = analyzers.get("risk_analysis")
+        valuation_analyzer = analyzers.get("valuation_analysis")
 
         # Run Composite Scoring Engine
         scoring_result = None
@@ -245,6 +212,121 @@ class ReportGenerator:
         logger.info(f"Report generation complete for {ticker}")
         return report_data
 
+    def _fetch_shared_inputs(self, ticker: str, use_cache: bool) -> Dict[str, Any]:
+        """
+        Fetch the data used by more than one section or analysis
+
+        Returns:
+            Dictionary with 'ticker_info', 'fundamentals', 'earnings' and 'dividends'
+        """
+        return {
+            "ticker_info": self.fetcher.get_ticker_info(ticker, use_cache=use_cache),
+            "fundamentals": self.fetcher.fetch_fundamentals(ticker, use_cache=use_cache),
+            "earnings": self.fetcher.fetch_earnings(ticker, use_cache=use_cache),
+            "dividends": self.fetcher.fetch_dividends(ticker, use_cache=use_cache),
+        }
+
+    def _run_technical_analysis(
+        self,
+        ticker: str,
+        use_cache: bool,
+        price_data: Optional[pd.DataFrame],
+        shared_inputs: Dict[str, Any],
+    ):
+        """Run technical analysis, returning (analyzer, json_data)"""
+        tech_section = TechnicalAnalysisSection()
+        technical_analyzer = tech_section.fetch_data(
+            self.fetcher,
+            ticker,
+            use_cache=use_cache,
+            period="1y",  # Force 1y for technical analysis
+            price_data=price_data,
+            ticker_info=shared_inputs["ticker_info"],
+        )
+        return technical_analyzer, tech_section.format_for_json(technical_analyzer)
+
+    def _run_fundamental_analysis(
+        self,
+        ticker: str,
+        use_cache: bool,
+        price_data: Optional[pd.DataFrame],
+        shared_inputs: Dict[str, Any],
+    ):
+        """Run fundamental analysis, returning (analyzer, json_data)"""
+        fund_section = FundamentalAnalysisSection()
+        # Pass price data if available for market-based calculations
+        fundamental_analyzer = fund_section.fetch_data(
+            self.fetcher,
+            ticker,
+            use_cache=use_cache,
+            price_data=price_data,
+            ticker_info=shared_inputs["ticker_info"],
+            fundamentals=shared_inputs["fundamentals"],
+        )
+        return fundamental_analyzer, fund_section.format_for_json(fundamental_analyzer)
+
+    def _run_risk_analysis(
+        self, ticker: str, use_cache: bool, period: str, price_data: Optional[pd.DataFrame]
+    ):
+        """Run risk analysis, returning (analyzer tuple, json_data)"""
+        risk_section = RiskAnalysisSection()
+        if price_data is None:
+            price_data = self.fetcher.fetch_ticker(ticker, period=period, use_cache=use_cache)
+        # Already on a report worker thread, so don't start a nested pool
+        risk_analyzer_tuple = risk_section.fetch_data(
+            self.fetcher,
+            ticker,
+            use_cache=use_cache,
+            price_data=price_data,
+            period=period,
+            parallel=False,
+        )
+        return risk_analyzer_tuple, risk_section.format_for_json(risk_analyzer_tuple)
+
+    def _run_valuation_analysis(
+        self,
+        ticker: str,
+        use_cache: bool,
+        price_data: Optional[pd.DataFrame],
+        shared_inputs: Dict[str, Any],
+    ):
+        """Run valuation analysis (DCF, DDM, dividends, earnings), returning (analyzer, results)"""
+        from ..analysis import ValuationAnalyzer
+
+        if price_data is None:
+            price_data = self.fetcher.fetch_ticker(ticker, period="1y", use_cache=use_cache)
+        ticker_info = shared_inputs["ticker_info"] or {}
+        fundamentals = shared_inputs["fundamentals"]
+        earnings_data = shared_inputs["earnings"]
+
+        # Convert dividends to Series
+        div_data = shared_inputs["dividends"]
+        dividends_series = None
+        if div_data and div_data.get("dividends") is not None:
+            dividends_df = div_data["dividends"]
+            if not dividends_df.empty:
+                # Check if Date is already the index or a column
+                if "Date" in dividends_df.columns:
+                    dividends_series = dividends_df.set_index("Date")["Dividends"]
+                elif dividends_df.index.name == "Date":
+                    dividends_series = dividends_df["Dividends"]
+                else:
+                    logger.warning("Dividends DataFrame has unexpected structure")
+                    dividends_series = dividends_df.iloc[:, 0]  # Fallback to first column
+
+        # Create analyzer
+        valuation_analyzer = ValuationAnalyzer(
+            ticker=ticker,
+            ticker_info=ticker_info,
+            price_data=price_data,
+            fundamentals=fundamentals,
+            earnings_data=earnings_data,
+            dividends_data=dividends_series,
+        )
+
+        # Run analysis
+        return valuation_analyzer, valuation_analyzer.analyze()
+
     def _get_reports_dir(self, ticker: str) -> Path:
         """Get (and create) reports directory for a ticker"""
         reports_dir = self.output_dir / ticker / "reports"
@@ -429,28 +511,32 @@ class ReportGenerator:
     def _save_technical_json(self, ticker: str, technical_analyzer):
         """Save detailed technical analysis as separate JSON file"""
         self._save_analysis_files(
-            ticker, "technical_analysis",
+            ticker,
+            "technical_analysis",
             json_data=technical_analyzer.get_summary(),
         )
 
     def _save_technical_markdown(self, ticker: str, technical_analyzer):
         """Save detailed technical analysis as separate markdown file"""
         self._save_analysis_files(
-            ticker, "technical_analysis",
+            ticker,
+            "technical_analysis",
             markdown_lines=technical_analyzer.format_markdown(),
         )
 
     def _save_fundamental_json(self, ticker: str, fundamental_analyzer):
         """Save detailed fundamental analysis as separate JSON file"""
         self._save_analysis_files(
-            ticker, "fundamental_analysis",
+            ticker,
+            "fundamental_analysis",
             json_data=fundamental_analyzer.get_summary(),
         )
 
     def _save_fundamental_markdown(self, ticker: str, fundamental_analyzer):
         """Save detailed fundamental analysis as separate markdown file"""
         self._save_analysis_files(
-            ticker, "fundamental_analysis",
+            ticker,
+            "fundamental_analysis",
             markdown_lines=fundamental_analyzer.format_markdown(),
         )
 
@@ -469,7 +555,8 @@ class ReportGenerator:
             return
         risk_analyzer, metrics, _ = risk_analyzer_tuple
         self._save_analysis_files(
-            ticker, "risk_analysis",
+            ticker,
+            "risk_analysis",
             markdown_lines=risk_analyzer.format_markdown(ticker=ticker, metrics=metrics),
         )
 
@@ -480,14 +567,16 @@ class ReportGenerator:
     def _save_valuation_markdown(self, ticker: str, valuation_analyzer):
         """Save detailed valuation analysis as separate markdown file"""
         self._save_analysis_files(
-            ticker, "valuation_analysis",
+            ticker,
+            "valuation_analysis",
             markdown_lines=valuation_analyzer.format_markdown(),
         )
 
     def _save_scoring_json(self, ticker: str, scoring_result):
         """Save scoring results as separate JSON file"""
         self._save_analysis_files(
-            ticker, "scoring",
+            ticker,
+            "scoring",
             json_data=scoring_result.to_dict(),
         )
 
@@ -531,7 +620,9 @@ class ReportGenerator:
         # LLM Context section
         md.append("## LLM Context Block")
         md.append("")
-        md.append("*The following block is designed to be prepended to TOON reports for LLM analysis:*")
+        md.append(
+            "*The following block is designed to be prepended to TOON reports for LLM analysis:*"
+        )
         md.append("")
         md.append("```")
         md.append(scoring_result.format_llm_context())
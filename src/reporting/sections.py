@@ -11,6 +11,7 @@ import pandas as pd
 
 from ..analysis.fundamental import FundamentalAnalyzer
 from ..analysis.valuation import ValuationAnalyzer
+from ..utils.financial import daily_return_std
 from ..utils.report import format_number, format_percent, get_currency_symbol, safe_get
 
 logger = logging.getLogger(__name__)
@@ -66,6 +67,9 @@ class InfoSection(ReportSection):
     """Company information section"""
 
     def fetch_data(self, fetcher, ticker: str, use_cache: bool = True, **kwargs) -> Dict[str, Any]:
+        ticker_info = kwargs.get("ticker_info")  # Optional, prefetched by the generator
+        if ticker_info is not None:
+            return ticker_info
         logger.info(f"Fetching info for {ticker}")
         return fetcher.get_ticker_info(ticker, use_cache=use_cache)
 
@@ -127,22 +131,23 @@ class PriceDataSection(ReportSection):
         period = kwargs.get("period", "1mo")
         try:
             price_data = fetcher.fetch_ticker(ticker, period=period, use_cache=use_cache)
+            latest = price_data.iloc[-1]
             return {
                 "shape": price_data.shape,
-                "date_range": {"start": str(price_data.index[0]), "end": str(price_data.index[-1])},
+                "date_range": {"start": str(price_data.index[0]), "end": str(latest.name)},
                 "latest": {
-                    "date": str(price_data.index[-1]),
-                    "open": float(price_data["Open"].iloc[-1]),
-                    "high": float(price_data["High"].iloc[-1]),
-                    "low": float(price_data["Low"].iloc[-1]),
-                    "close": float(price_data["Close"].iloc[-1]),
-                    "volume": int(price_data["Volume"].iloc[-1]),
+                    "date": str(latest.name),
+                    "open": float(latest["Open"]),
+                    "high": float(latest["High"]),
+                    "low": float(latest["Low"]),
+                    "close": float(latest["Close"]),
+                    "volume": int(latest["Volume"]),
                 },
                 "statistics": {
                     "high_52w": float(price_data["High"].max()),
                     "low_52w": float(price_data["Low"].min()),
                     "avg_volume": float(price_data["Volume"].mean()),
-                    "volatility": float(price_data["Close"].pct_change().std()),
+                    "volatility": daily_return_std(price_data["Close"]),
                 },
             }
         except Exception as e:
@@ -182,8 +187,10 @@ class FundamentalsSection(ReportSection):
     """Fundamentals section"""
 
     def fetch_data(self, fetcher, ticker: str, use_cache: bool = True, **kwargs) -> Dict[str, Any]:
-        logger.info(f"Fetching fundamentals for {ticker}")
-        fundamentals = fetcher.fetch_fundamentals(ticker, use_cache=use_cache)
+        fundamentals = kwargs.get("fundamentals")  # Optional, prefetched by the generator
+        if fundamentals is None:
+            logger.info(f"Fetching fundamentals for {ticker}")
+            fundamentals = fetcher.fetch_fundamentals(ticker, use_cache=use_cache)
         return {k: {"shape": v.shape, "has_data": not v.empty} for k, v in fundamentals.items()}
 
     def format_for_json(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -203,8 +210,10 @@ class EarningsSection(ReportSection):
     """Earnings section"""
 
     def fetch_data(self, fetcher, ticker: str, use_cache: bool = True, **kwargs) -> Dict[str, Any]:
-        logger.info(f"Fetching earnings for {ticker}")
-        earnings = fetcher.fetch_earnings(ticker, use_cache=use_cache)
+        earnings = kwargs.get("earnings")  # Optional, prefetched by the generator
+        if earnings is None:
+            logger.info(f"Fetching earnings for {ticker}")
+            earnings = fetcher.fetch_earnings(ticker, use_cache=use_cache)
         return {
             "history_count": len(earnings["earnings_history"]),
             "dates_count": len(earnings["earnings_dates"]),
@@ -305,8 +314,10 @@ class DividendsSection(ReportSection):
     """Dividends and stock splits section"""
 
     def fetch_data(self, fetcher, ticker: str, use_cache: bool = True, **kwargs) -> Dict[str, Any]:
-        logger.info(f"Fetching dividends for {ticker}")
-        dividends = fetcher.fetch_dividends(ticker, use_cache=use_cache)
+        dividends = kwargs.get("dividends")  # Optional, prefetched by the generator
+        if dividends is None:
+            logger.info(f"Fetching dividends for {ticker}")
+            dividends = fetcher.fetch_dividends(ticker, use_cache=use_cache)
         return {
             "dividend_count": len(dividends["dividends"]),
             "split_count": len(dividends["splits"]),
@@ -468,10 +479,14 @@ class TechnicalAnalysisSection(ReportSection):
 
         # Fetch 1 year of data for 200-day SMA calculation
         period = kwargs.get("period", "1y")
-        price_data = fetcher.fetch_ticker(ticker, period=period, use_cache=use_cache)
-        
+        price_data = kwargs.get("price_data")  # Optional, passed from generator
+        if price_data is None:
+            price_data = fetcher.fetch_ticker(ticker, period=period, use_cache=use_cache)
+
         # Get currency from ticker info
-        ticker_info = fetcher.get_ticker_info(ticker, use_cache=use_cache)
+        ticker_info = kwargs.get("ticker_info")
+        if ticker_info is None:
+            ticker_info = fetcher.get_ticker_info(ticker, use_cache=use_cache)
         currency = ticker_info.get("currency", "USD")
 
         # Calculate all indicators
@@ -557,9 +572,13 @@ class FundamentalAnalysisSection(ReportSection):
         Returns:
             FundamentalAnalyzer instance (not dict - for dual formatting)
         """
-        # Fetch required data
-        ticker_info = fetcher.get_ticker_info(ticker, use_cache=use_cache)
-        fundamentals = fetcher.fetch_fundamentals(ticker, use_cache=use_cache)
+        # Fetch required data (unless prefetched by the generator)
+        ticker_info = kwargs.get("ticker_info")
+        if ticker_info is None:
+            ticker_info = fetcher.get_ticker_info(ticker, use_cache=use_cache)
+        fundamentals = kwargs.get("fundamentals")
+        if fundamentals is None:
+            fundamentals = fetcher.fetch_fundamentals(ticker, use_cache=use_cache)
         price_data = kwargs.get("price_data")  # Optional, passed from generator
 
         # Create analyzer
@@ -614,7 +633,9 @@ class RiskAnalysisSection(ReportSection):
 
         # Calculate all metrics (pass benchmark to avoid re-fetch)
         risk_analyzer = RiskMetrics()
-        metrics = risk_analyzer.calculate_all_metrics(price_data, benchmark_data=benchmark_data)
+        metrics = risk_analyzer.calculate_all_metrics(
+            price_data, benchmark_data=benchmark_data, parallel=kwargs.get("parallel", True)
+        )
 
         # Return tuple: (analyzer, metrics, benchmark) for dual formatting
         return (risk_analyzer, metrics, benchmark_data)
@@ -1,7 +1,8 @@
 """Utility modules for financial calculations, serialization, and reporting"""
 
-from .dataframe_utils import normalize_datetime_index, safe_get_dataframe_value
+from .dataframe_utils import normalize_datetime_index, optimize_dtypes, safe_get_dataframe_value
 from .financial import (
+    SQRT_TRADING_DAYS_PER_YEAR,
     TRADING_DAYS_PER_YEAR,
     annualize_return,
     annualize_volatility,
@@ -9,6 +10,7 @@ from .financial import (
     calculate_daily_returns,
     calculate_growth_rate,
     convert_annual_to_daily_rate,
+    daily_return_std,
     safe_divide,
     to_float,
     validate_price_data,
@@ -32,14 +34,17 @@ from .serialization import (
     dataframe_to_records,
     format_date,
     series_to_dataframe,
+    write_json,
 )
 from .toon_serializer import TOON_EXCLUDED_SECTIONS, report_to_toon
 
 __all__ = [
     # DataFrame utilities
     "normalize_datetime_index",
+    "optimize_dtypes",
     "safe_get_dataframe_value",
     # Financial utilities
+    "SQRT_TRADING_DAYS_PER_YEAR",
     "TRADING_DAYS_PER_YEAR",
     "annualize_return",
     "annualize_volatility",
@@ -47,6 +52,7 @@ __all__ = [
     "calculate_daily_returns",
     "calculate_growth_rate",
     "convert_annual_to_daily_rate",
+    "daily_return_std",
     "safe_divide",
     "to_float",
     "validate_price_data",
@@ -68,6 +74,7 @@ __all__ = [
     "dataframe_to_records",
     "format_date",
     "series_to_dataframe",
+    "write_json",
     # TOON serialization
     "TOON_EXCLUDED_SECTIONS",
     "report_to_toon",
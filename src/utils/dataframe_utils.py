@@ -9,6 +9,8 @@ from typing import Any, Optional
 
 import pandas as pd
 
+PRICE_COLUMNS = ("Open", "High", "Low", "Close", "Adj Close")
+
 
 def normalize_datetime_index(series: pd.Series) -> pd.Series:
     """
@@ -37,6 +39,33 @@ def normalize_datetime_index(series: pd.Series) -> pd.Series:
     return result
 
 
+def optimize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast OHLCV columns to compact numeric dtypes
+
+    Price columns are downcast to float32 at most (never float16, which loses
+    too much precision for prices). Volume is left as int64: indicators such as
+    OBV negate and cumulatively sum it, which wraps around on unsigned types and
+    overflows on narrow signed ones. Other columns and the index are left untouched.
+
+    Args:
+        df: OHLCV DataFrame as returned by Yahoo Finance
+
+    Returns:
+        DataFrame with downcast column dtypes
+    """
+    if df.empty:
+        return df
+
+    result = df.copy()
+
+    for col in PRICE_COLUMNS:
+        if col in result.columns:
+            result[col] = pd.to_numeric(result[col], downcast="float")
+
+    return result
+
+
 def safe_get_dataframe_value(
     df: Optional[pd.DataFrame], row_name: str, col_index: int = 0
 ) -> Optional[float]:
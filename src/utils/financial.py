@@ -5,13 +5,21 @@ Provides reusable financial calculations and type-safe conversions
 used across technical, fundamental, and risk analysis modules.
 """
 
+import math
+from functools import lru_cache
 from typing import Any, Optional
 
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # Financial constants
 TRADING_DAYS_PER_YEAR = 252
+SQRT_TRADING_DAYS_PER_YEAR = math.sqrt(TRADING_DAYS_PER_YEAR)  # Daily -> annual volatility scale
 
 
 def to_float(value: Any) -> float:
@@ -43,6 +51,67 @@ def calculate_daily_returns(price_data: pd.DataFrame, column: str = "Close") ->
     return price_data[column].pct_change().dropna()
 
 
+def _daily_return_std_loop(values: np.ndarray) -> float:
+    """
+    Sample std of simple daily returns in one Welford pass (JIT-compiled when numba is installed)
+
+    Args:
+        values: 1-D float64 array of prices
+
+    Returns:
+        Std with ddof=1 of the finite returns; NaN if there are fewer than two
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(1, values.shape[0]):
+        r = values[i] / values[i - 1] - 1.0
+        if not np.isfinite(r):
+            continue
+        n += 1
+        delta = r - mean
+        mean += delta / n
+        m2 += delta * (r - mean)
+
+    if n < 2:
+        return np.nan
+    return np.sqrt(m2 / (n - 1))
+
+
+def _daily_return_std_numpy(values: np.ndarray) -> float:
+    """NumPy fallback for _daily_return_std_loop"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = values[1:] / values[:-1] - 1.0
+    returns = returns[np.isfinite(returns)]
+    if returns.size < 2:
+        return float("nan")
+    return float(returns.std(ddof=1))
+
+
+# error_model="numpy" keeps a zero price from raising; its inf return is skipped
+_daily_return_std = (
+    njit(cache=True, error_model="numpy")(_daily_return_std_loop)
+    if njit is not None
+    else _daily_return_std_numpy
+)
+
+
+def daily_return_std(prices: Any) -> float:
+    """
+    Standard deviation of simple daily returns, computed on the raw ndarray
+
+    Equivalent to ``prices.pct_change().std()`` but without materializing an
+    intermediate Series. Returns involving missing prices are skipped.
+
+    Args:
+        prices: Price Series or array (e.g. Close prices)
+
+    Returns:
+        Sample standard deviation of daily returns (NaN if fewer than 2 returns)
+    """
+    return float(_daily_return_std(np.ascontiguousarray(prices, dtype=np.float64)))
+
+
 def annualize_return(daily_return: float, periods: int = TRADING_DAYS_PER_YEAR) -> float:
     """
     Convert daily return to annualized return
@@ -85,9 +154,10 @@ def validate_price_data(price_data: pd.DataFrame, column: str = "Close") -> bool
     return price_data is not None and not price_data.empty and column in price_data.columns
 
 
+@lru_cache(maxsize=64)
 def convert_annual_to_daily_rate(annual_rate_pct: float) -> float:
     """
-    Convert annual rate (percentage) to daily rate
+    Convert annual rate (percentage) to daily rate (memoized; called per metric)
 
     Args:
         annual_rate_pct: Annual rate as percentage (e.g., 4.0 for 4%)
@@ -8,25 +8,17 @@ Eliminates duplication across report sections and generators.
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
 
 # ==================== Formatting Utilities ====================
 
-
-def get_currency_symbol(currency_code: str) -> str:
-    """
-    Get currency symbol from currency code
-
-    Args:
-        currency_code: ISO 4217 currency code (e.g., 'USD', 'NOK', 'CAD')
-
-    Returns:
-        Currency symbol or code if symbol not recognized
-    """
-    symbols = {
+# Read-only: shared by every report section and analyzer
+_CURRENCY_SYMBOLS: Mapping[str, str] = MappingProxyType(
+    {
         "USD": "$",
         "CAD": "CA$",
         "EUR": "€",
@@ -46,7 +38,20 @@ def get_currency_symbol(currency_code: str) -> str:
         "SGD": "S$",
         "KRW": "₩",
     }
-    return symbols.get(currency_code, currency_code)
+)
+
+
+def get_currency_symbol(currency_code: str) -> str:
+    """
+    Get currency symbol from currency code
+
+    Args:
+        currency_code: ISO 4217 currency code (e.g., 'USD', 'NOK', 'CAD')
+
+    Returns:
+        Currency symbol or code if symbol not recognized
+    """
+    return _CURRENCY_SYMBOLS.get(currency_code, currency_code)
 
 
 def format_currency(value: Any, currency: str = "USD") -> str:
@@ -221,18 +226,21 @@ def validate_dataframe(
     Returns:
         True if valid, False otherwise
     """
+    if df is None:
+        return False
+
     import pandas as pd
 
-    if df is None or not isinstance(df, pd.DataFrame):
+    if not isinstance(df, pd.DataFrame):
         return False
 
-    if df.empty or len(df) < min_rows:
+    # Axis lengths directly: DataFrame.empty / len() go through extra property dispatch
+    columns = df.columns
+    if len(columns) == 0 or len(df.index) < max(min_rows, 1):
         return False
 
     if required_columns:
-        missing = [col for col in required_columns if col not in df.columns]
-        if missing:
-            return False
+        return all(col in columns for col in required_columns)
 
     return True
 
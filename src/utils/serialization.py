@@ -6,11 +6,20 @@ Provides consistent DataFrame/Series to JSON conversion with proper handling of:
 - Index preservation (dates, quarters, etc.)
 """
 
+import json
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Dict, List, Sequence, Union
 
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def format_date(date_value: Any, format_type: str = "iso") -> str:
     """
@@ -30,20 +39,28 @@ def format_date(date_value: Any, format_type: str = "iso") -> str:
         # Extract YYYY-MM-DD portion only (no time/milliseconds)
         return date_str[:10]
     elif format_type == "readable":
-        # Parse and format as readable
-        try:
-            if isinstance(date_value, (pd.Timestamp, datetime)):
-                dt = date_value
-            else:
-                dt = pd.to_datetime(date_str)
-            return dt.strftime("%b %d, %Y")
-        except:
-            # Fallback to ISO if parsing fails
-            return date_str[:10]
+        if isinstance(date_value, (pd.Timestamp, datetime)):
+            try:
+                return date_value.strftime("%b %d, %Y")
+            except ValueError:
+                # NaT and out-of-range values: fall back to ISO
+                return date_str[:10]
+        # Strings need parsing, which is slow; the same labels recur a lot
+        return _format_readable_date_str(date_str)
     else:
         return date_str[:10]
 
 
+@lru_cache(maxsize=4096)
+def _format_readable_date_str(date_str: str) -> str:
+    """Parse a date string and format it as 'Jan 29, 2026' (memoized)"""
+    try:
+        return pd.to_datetime(date_str).strftime("%b %d, %Y")
+    except Exception:
+        # Fallback to ISO if parsing fails
+        return date_str[:10]
+
+
 def dataframe_to_records(
     df: pd.DataFrame, preserve_index: bool = True, handle_datetimes: bool = True
 ) -> List[Dict[str, Any]]:
@@ -162,3 +179,31 @@ def clean_for_json(data: Any) -> Any:
         return str(data)
     else:
         return data
+
+
+def _json_default(value: Any) -> Any:
+    """Fallback encoder: unwrap NumPy scalars, stringify everything else"""
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def write_json(data: Any, path: Union[str, Path]) -> None:
+    """
+    Write data to a JSON file with 2-space indentation
+
+    Uses orjson when it is installed (native NumPy support, no intermediate
+    Python string), falling back to the standard library otherwise. Values
+    that are not JSON-serializable (timestamps etc.) are converted with str().
+
+    Args:
+        data: JSON-compatible data (dicts, lists, scalars, NumPy values)
+        path: Output file path
+    """
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        Path(path).write_bytes(orjson.dumps(data, default=_json_default, option=options))
+        return
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, default=_json_default)
@@ -67,7 +67,7 @@ class TestAnalyzeCommand:
     """Test the 'analyze' subcommand."""
 
     @patch("src.cli.StockScorer")
-    @patch("src.cli.ReportGenerator")
+    @patch("src.reporting.ReportGenerator")
     def test_analyze_basic(self, mock_gen_cls, mock_scorer_cls):
         mock_gen = MagicMock()
         mock_gen.generate_full_report.return_value = _mock_report_data()
@@ -84,7 +84,7 @@ class TestAnalyzeCommand:
         mock_gen.generate_full_report.assert_called_once()
 
     @patch("src.cli.StockScorer")
-    @patch("src.cli.ReportGenerator")
+    @patch("src.reporting.ReportGenerator")
     def test_analyze_with_options(self, mock_gen_cls, mock_scorer_cls):
         mock_gen = MagicMock()
         mock_gen.generate_full_report.return_value = _mock_report_data()
@@ -113,7 +113,7 @@ class TestScoreCommand:
     """Test the 'score' subcommand."""
 
     @patch("src.cli.StockScorer")
-    @patch("src.cli.ReportGenerator")
+    @patch("src.reporting.ReportGenerator")
     def test_score_single(self, mock_gen_cls, mock_scorer_cls):
         mock_gen = MagicMock()
         mock_gen.generate_full_report.return_value = _mock_report_data()
@@ -130,7 +130,7 @@ class TestScoreCommand:
         assert "STOCK SCORES" in result.output
 
     @patch("src.cli.StockScorer")
-    @patch("src.cli.ReportGenerator")
+    @patch("src.reporting.ReportGenerator")
     def test_score_multiple(self, mock_gen_cls, mock_scorer_cls):
         mock_gen = MagicMock()
         mock_gen.generate_full_report.side_effect = [
@@ -153,7 +153,7 @@ class TestScoreCommand:
         assert "MSFT" in result.output
 
     @patch("src.cli.StockScorer")
-    @patch("src.cli.ReportGenerator")
+    @patch("src.reporting.ReportGenerator")
     def test_score_with_config(self, mock_gen_cls, mock_scorer_cls):
         mock_gen = MagicMock()
         mock_gen.generate_full_report.return_value = _mock_report_data()
@@ -175,7 +175,7 @@ class TestScoreCommand:
 class TestCompareCommand:
     """Test the 'compare' subcommand."""
 
-    @patch("src.cli.TickerComparator")
+    @patch("src.comparison.TickerComparator")
     def test_compare_basic(self, mock_comp_cls):
         import pandas as pd
 
@@ -203,7 +203,7 @@ class TestWatchCommand:
     """Test the 'watch' subcommand."""
 
     @patch("src.cli.StockScorer")
-    @patch("src.cli.ReportGenerator")
+    @patch("src.reporting.ReportGenerator")
     def test_watch_single_iteration(self, mock_gen_cls, mock_scorer_cls):
         mock_gen = MagicMock()
         mock_gen.generate_full_report.return_value = _mock_report_data()
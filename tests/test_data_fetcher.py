@@ -0,0 +1,388 @@
+"""
+Tests for the DataFetcher caches and batched price downloads.
+Yahoo Finance is never contacted: downloads are patched and caches live in tmp_path.
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import data_fetcher
+from src.data_fetcher import DataFetcher
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+
+def _prices(n: int = 5, start: float = 100.0) -> pd.DataFrame:
+    """Daily OHLCV frame shaped like Ticker.history output"""
+    index = pd.date_range("2024-01-02", periods=n, freq="D", tz="America/New_York", name="Date")
+    close = start + np.arange(n, dtype=np.float64)
+    return pd.DataFrame(
+        {
+            "Open": close - 0.5,
+            "High": close + 1.0,
+            "Low": close - 1.0,
+            "Close": close,
+            "Volume": np.arange(1_000, 1_000 + n, dtype=np.int64),
+        },
+        index=index,
+    )
+
+
+def _key(ticker: str = "TEST") -> tuple:
+    return (ticker, None, None, "1y", "1d")
+
+
+def _age(path: Path, hours: float):
+    """Backdate a file's mtime by the given number of hours"""
+    stamp = time.time() - hours * 3600
+    os.utime(path, (stamp, stamp))
+
+
+@pytest.fixture
+def fetcher(tmp_path):
+    return DataFetcher(cache_dir=str(tmp_path), cache_ttl=1)
+
+
+# ============================================================
+# Price Cache (Disk)
+# ============================================================
+
+
+class TestPriceCacheFiles:
+    """Parquet/feather price caches round-trip and respect the TTL"""
+
+    @pytest.mark.parametrize("cache_format", ["parquet", "feather"])
+    def test_round_trip(self, tmp_path, cache_format):
+        pytest.importorskip("pyarrow")
+        fetcher = DataFetcher(cache_dir=str(tmp_path), cache_format=cache_format)
+        cache_file = fetcher._get_cache_filename("TEST", None, None, "1y", "1d")
+        assert cache_file.suffix == f".{cache_format}"
+
+        fetcher._store_fetched_prices(_key(), cache_file, _prices())
+        fetcher._price_cache.clear()  # force a disk read
+
+        loaded = fetcher._load_cached_prices(_key(), cache_file)
+        pd.testing.assert_frame_equal(loaded, _prices(), check_dtype=False, check_freq=False)
+
+    def test_invalid_format_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="Invalid cache format"):
+            DataFetcher(cache_dir=str(tmp_path), cache_format="csv")
+
+    def test_expired_file_is_ignored(self, fetcher):
+        pytest.importorskip("pyarrow")
+        cache_file = fetcher._get_cache_filename("TEST", None, None, "1y", "1d")
+        fetcher._store_fetched_prices(_key(), cache_file, _prices())
+        fetcher._price_cache.clear()
+
+        _age(cache_file, 2)
+        assert fetcher._load_cached_prices(_key(), cache_file) is None
+
+    def test_no_ttl_never_expires(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(DataFetcher.CACHE_TTL_ENV_VAR, raising=False)
+        fetcher = DataFetcher(cache_dir=str(tmp_path))
+        fetcher.cache_ttl = None
+        cache_file = tmp_path / "old.json"
+        cache_file.write_text("{}")
+        _age(cache_file, 24 * 365)
+        assert fetcher._is_cache_fresh(cache_file)
+
+    def test_ttl_from_environment(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(DataFetcher.CACHE_TTL_ENV_VAR, "6")
+        assert DataFetcher(cache_dir=str(tmp_path)).cache_ttl == 6.0
+        # An explicit argument wins over the environment
+        assert DataFetcher(cache_dir=str(tmp_path), cache_ttl=2).cache_ttl == 2
+
+
+class TestLegacyCsvMigration:
+    """CSV caches from older versions are read once and converted"""
+
+    def test_csv_is_migrated(self, fetcher):
+        pytest.importorskip("pyarrow")
+        cache_file = fetcher._get_cache_filename("TEST", None, None, "1y", "1d")
+        legacy_file = cache_file.with_suffix(".csv")
+        legacy_file.parent.mkdir(parents=True)
+        _prices().to_csv(legacy_file)
+        _age(legacy_file, 0.5)
+        legacy_mtime = legacy_file.stat().st_mtime
+
+        loaded = fetcher._load_cached_prices(_key(), cache_file)
+
+        assert loaded is not None
+        assert loaded["Close"].tolist() == _prices()["Close"].tolist()
+        assert not legacy_file.exists()
+        assert cache_file.exists()
+        # The migrated file keeps the CSV's fetch time so the TTL still counts from it
+        assert cache_file.stat().st_mtime == pytest.approx(legacy_mtime)
+
+    def test_dst_offsets_are_parsed(self, fetcher, monkeypatch):
+        """A CSV spanning a DST change has mixed UTC offsets in its index"""
+        pytest.importorskip("pyarrow")
+        monkeypatch.setattr(DataFetcher, "_exchange_timezone", lambda self, symbol: "Europe/Oslo")
+        prices = _prices(n=4)
+        prices.index = pd.DatetimeIndex(
+            ["2024-03-28", "2024-03-29", "2024-04-01", "2024-04-02"], name="Date"
+        ).tz_localize("Europe/Oslo")
+        cache_file = fetcher._get_cache_filename("TEST", None, None, "1y", "1d")
+        legacy_file = cache_file.with_suffix(".csv")
+        legacy_file.parent.mkdir(parents=True)
+        prices.to_csv(legacy_file)
+
+        loaded = fetcher._load_cached_prices(_key(), cache_file)
+
+        assert isinstance(loaded.index, pd.DatetimeIndex)
+        assert str(loaded.index.tz) == "Europe/Oslo"
+        assert loaded.index.equals(prices.index)
+        assert cache_file.exists()
+
+    def test_stale_csv_is_ignored(self, fetcher):
+        cache_file = fetcher._get_cache_filename("TEST", None, None, "1y", "1d")
+        legacy_file = cache_file.with_suffix(".csv")
+        legacy_file.parent.mkdir(parents=True)
+        _prices().to_csv(legacy_file)
+        _age(legacy_file, 2)
+
+        assert fetcher._load_cached_prices(_key(), cache_file) is None
+        assert legacy_file.exists()
+
+
+# ============================================================
+# Price Cache (Memory)
+# ============================================================
+
+
+class TestMemoryPriceCache:
+    """In-memory LRU of parsed price frames"""
+
+    def test_hit_returns_copy(self, fetcher):
+        fetcher._set_memory_cached_prices(_key(), _prices(), time.time())
+        first = fetcher._get_memory_cached_prices(_key())
+        first["Close"] = 0.0
+        assert fetcher._get_memory_cached_prices(_key())["Close"].iloc[0] == 100.0
+
+    def test_evicts_least_recently_used(self, fetcher, monkeypatch):
+        monkeypatch.setattr(DataFetcher, "PRICE_MEMORY_CACHE_SIZE", 2)
+        now = time.time()
+        fetcher._set_memory_cached_prices(_key("A"), _prices(), now)
+        fetcher._set_memory_cached_prices(_key("B"), _prices(), now)
+        fetcher._get_memory_cached_prices(_key("A"))  # A becomes most recent
+        fetcher._set_memory_cached_prices(_key("C"), _prices(), now)
+
+        assert fetcher._get_memory_cached_prices(_key("B")) is None
+        assert fetcher._get_memory_cached_prices(_key("A")) is not None
+        assert fetcher._get_memory_cached_prices(_key("C")) is not None
+
+    def test_expired_entry_is_dropped(self, fetcher):
+        fetcher._set_memory_cached_prices(_key(), _prices(), time.time() - 2 * 3600)
+        assert fetcher._get_memory_cached_prices(_key()) is None
+        assert _key() not in fetcher._price_cache
+
+    def test_disk_load_keeps_file_age(self, fetcher):
+        """A frame loaded from disk expires with its file, not an hour after loading"""
+        pytest.importorskip("pyarrow")
+        cache_file = fetcher._get_cache_filename("TEST", None, None, "1y", "1d")
+        fetcher._store_fetched_prices(_key(), cache_file, _prices())
+        fetcher._price_cache.clear()
+        _age(cache_file, 0.5)
+
+        assert fetcher._load_cached_prices(_key(), cache_file) is not None
+        fetched_at, _ = fetcher._price_cache[_key()]
+        assert fetched_at == pytest.approx(cache_file.stat().st_mtime)
+
+    def test_clear_cache_for_one_ticker(self, fetcher):
+        now = time.time()
+        fetcher._set_memory_cached_prices(_key("A"), _prices(), now)
+        fetcher._set_memory_cached_prices(_key("B"), _prices(), now)
+        fetcher.clear_cache("a")
+        assert list(fetcher._price_cache) == [_key("B")]
+
+
+# ============================================================
+# Metadata Cache
+# ============================================================
+
+
+class TestMetadataCache:
+    """msgpack (when installed) or JSON metadata caches"""
+
+    DATA = {"shortName": "Test Corp", "beta": 1.2, "sectors": ["Tech", "Retail"], "count": 3}
+
+    def test_json_round_trip(self, fetcher, monkeypatch):
+        monkeypatch.setattr(data_fetcher, "msgpack", None)
+        path = fetcher._get_cache_file_path("TEST", "info")
+        assert path.suffix == ".json"
+
+        fetcher._save_cache(path, self.DATA)
+        assert json.loads(path.read_text()) == self.DATA
+        assert fetcher._load_cache(path) == self.DATA
+
+    def test_json_without_orjson(self, fetcher, monkeypatch):
+        monkeypatch.setattr(data_fetcher, "msgpack", None)
+        monkeypatch.setattr(data_fetcher, "orjson", None)
+        path = fetcher._get_cache_file_path("TEST", "info")
+
+        fetcher._save_cache(path, self.DATA)
+        assert fetcher._load_cache(path) == self.DATA
+
+    def test_msgpack_round_trip(self, fetcher):
+        pytest.importorskip("msgpack")
+        path = fetcher._get_cache_file_path("TEST", "info")
+        assert path.suffix == ".mpk"
+
+        fetcher._save_cache(path, self.DATA)
+        assert fetcher._load_cache(path) == self.DATA
+
+    def test_corrupt_file_is_a_miss(self, fetcher, monkeypatch):
+        monkeypatch.setattr(data_fetcher, "msgpack", None)
+        path = fetcher._get_cache_file_path("TEST", "info")
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+        assert fetcher._load_cache(path) is None
+
+    def test_expired_file_is_a_miss(self, fetcher, monkeypatch):
+        monkeypatch.setattr(data_fetcher, "msgpack", None)
+        path = fetcher._get_cache_file_path("TEST", "info")
+        fetcher._save_cache(path, self.DATA)
+        _age(path, 2)
+        assert fetcher._load_cache(path) is None
+
+
+# ============================================================
+# Batched Downloads
+# ============================================================
+
+
+def _download_frame(symbols) -> pd.DataFrame:
+    """yf.download(group_by="ticker") result: (ticker, field) column MultiIndex"""
+    return pd.concat({symbol: _prices() for symbol in symbols}, axis=1)
+
+
+class TestFetchMultipleTickers:
+    """Cache misses are fetched with one yf.download call per batch"""
+
+    @pytest.fixture(autouse=True)
+    def _exchange_timezones(self, monkeypatch):
+        """yfinance's timezone cache, as filled by a real download"""
+        timezones = {"OSL": "Europe/Oslo"}
+        monkeypatch.setattr(
+            DataFetcher,
+            "_exchange_timezone",
+            lambda self, symbol: timezones.get(symbol, "America/New_York"),
+        )
+
+    def test_one_download_for_all_misses(self, fetcher):
+        with (
+            patch.object(
+                data_fetcher.yf, "download", return_value=_download_frame(["AAA", "BBB"])
+            ) as download,
+            patch.object(DataFetcher, "fetch_ticker") as fetch_ticker,
+        ):
+            results = fetcher.fetch_multiple_tickers(["aaa", "BBB"])
+
+        download.assert_called_once()
+        assert download.call_args.args[0] == ["AAA", "BBB"]
+        fetch_ticker.assert_not_called()
+        # Caller's spelling and order are kept
+        assert list(results) == ["aaa", "BBB"]
+        assert results["aaa"]["Close"].tolist() == _prices()["Close"].tolist()
+
+    def test_cached_tickers_are_not_downloaded(self, fetcher):
+        fetcher._set_memory_cached_prices(_key("AAA"), _prices(), time.time())
+        with patch.object(
+            data_fetcher.yf, "download", return_value=_download_frame(["BBB"])
+        ) as download:
+            results = fetcher.fetch_multiple_tickers(["AAA", "BBB"])
+
+        assert download.call_args.args[0] == ["BBB"]
+        assert list(results) == ["AAA", "BBB"]
+
+    def test_batches_are_bounded(self, fetcher, monkeypatch):
+        monkeypatch.setattr(DataFetcher, "PRICE_DOWNLOAD_BATCH_SIZE", 2)
+        tickers = ["A1", "A2", "A3", "A4", "A5"]
+        with patch.object(
+            data_fetcher.yf, "download", side_effect=lambda symbols, **_: _download_frame(symbols)
+        ) as download:
+            results = fetcher.fetch_multiple_tickers(tickers)
+
+        assert [call.args[0] for call in download.call_args_list] == [
+            ["A1", "A2"],
+            ["A3", "A4"],
+            ["A5"],
+        ]
+        assert list(results) == tickers
+
+    def test_failed_download_falls_back_to_fetch_ticker(self, fetcher):
+        with (
+            patch.object(data_fetcher.yf, "download", side_effect=RuntimeError("boom")),
+            patch.object(DataFetcher, "fetch_ticker", return_value=_prices()) as fetch_ticker,
+        ):
+            results = fetcher.fetch_multiple_tickers(["AAA", "BBB"])
+
+        assert sorted(call.args[0] for call in fetch_ticker.call_args_list) == ["AAA", "BBB"]
+        assert list(results) == ["AAA", "BBB"]
+
+    def test_partial_batch_falls_back_to_fetch_ticker(self, fetcher):
+        """Tickers missing from the batch result are fetched one by one"""
+        with (
+            patch.object(data_fetcher.yf, "download", return_value=_download_frame(["AAA"])),
+            patch.object(
+                DataFetcher, "fetch_ticker", return_value=_prices(start=50.0)
+            ) as fetch_ticker,
+        ):
+            results = fetcher.fetch_multiple_tickers(["AAA", "MISSING", "CCC"])
+
+        assert sorted(call.args[0] for call in fetch_ticker.call_args_list) == ["CCC", "MISSING"]
+        assert list(results) == ["AAA", "MISSING", "CCC"]
+        assert results["AAA"]["Close"].iloc[0] == 100.0
+        assert results["MISSING"]["Close"].iloc[0] == 50.0
+
+    def test_fallback_failures_are_skipped(self, fetcher):
+        with (
+            patch.object(data_fetcher.yf, "download", return_value=_download_frame(["AAA"])),
+            patch.object(DataFetcher, "fetch_ticker", side_effect=ValueError("Invalid ticker")),
+        ):
+            results = fetcher.fetch_multiple_tickers(["AAA", "BAD"])
+
+        assert list(results) == ["AAA"]
+
+    def test_minority_timezone_is_restored(self, fetcher):
+        """yf.download aligns the batch to New York; Oslo bars keep their own dates"""
+        oslo = _prices()
+        oslo.index = pd.date_range(
+            "2024-01-02", periods=5, freq="D", tz="Europe/Oslo", name="Date"
+        ).tz_convert("America/New_York")
+        batch = pd.concat({"AAA": _prices(), "BBB": _prices(), "OSL": oslo}, axis=1, sort=True)
+        with patch.object(data_fetcher.yf, "download", return_value=batch):
+            results = fetcher.fetch_multiple_tickers(["AAA", "BBB", "OSL"])
+
+        assert str(results["OSL"].index.tz) == "Europe/Oslo"
+        assert results["OSL"].index[0] == pd.Timestamp("2024-01-02", tz="Europe/Oslo")
+        assert results["OSL"]["Close"].tolist() == _prices()["Close"].tolist()
+        assert str(results["AAA"].index.tz) == "America/New_York"
+
+        cached = fetcher._load_cached_prices(
+            _key("OSL"), fetcher._get_cache_filename("OSL", None, None, "1y", "1d")
+        )
+        assert cached.index[0] == pd.Timestamp("2024-01-02", tz="Europe/Oslo")
+
+    def test_unknown_timezone_falls_back_to_fetch_ticker(self, fetcher, monkeypatch):
+        monkeypatch.setattr(DataFetcher, "_exchange_timezone", lambda self, symbol: None)
+        with (
+            patch.object(data_fetcher.yf, "download", return_value=_download_frame(["AAA"])),
+            patch.object(DataFetcher, "fetch_ticker", return_value=_prices()) as fetch_ticker,
+        ):
+            results = fetcher.fetch_multiple_tickers(["AAA"])
+
+        assert [call.args[0] for call in fetch_ticker.call_args_list] == ["AAA"]
+        assert list(results) == ["AAA"]
@@ -0,0 +1,67 @@
+"""
+Tests for DataFrame utilities.
+Checks that dtype optimization keeps indicator math on Volume intact.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.dataframe_utils import optimize_dtypes
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+
+def _make_prices() -> pd.DataFrame:
+    """Small OHLCV frame with down days (negative OBV contributions)"""
+    closes = [10.0, 11.0, 12.0, 11.0, 10.0, 11.0]
+    return pd.DataFrame(
+        {
+            "Open": closes,
+            "High": [c + 0.5 for c in closes],
+            "Low": [c - 0.5 for c in closes],
+            "Close": closes,
+            "Volume": np.array([1000, 2000, 1500, 1200, 1100, 1300], dtype=np.int64),
+        },
+        index=pd.date_range("2024-01-01", periods=6, freq="D"),
+    )
+
+
+# ============================================================
+# optimize_dtypes
+# ============================================================
+
+
+class TestOptimizeDtypes:
+    """Tests for optimize_dtypes"""
+
+    def test_prices_downcast_to_float32(self):
+        result = optimize_dtypes(_make_prices())
+        assert result["Close"].dtype == np.float32
+
+    def test_volume_stays_signed(self):
+        result = optimize_dtypes(_make_prices())
+        assert result["Volume"].dtype.kind == "i"
+
+    def test_volume_negation_and_diff(self):
+        result = optimize_dtypes(_make_prices())
+        assert (-result["Volume"]).tolist() == [-1000, -2000, -1500, -1200, -1100, -1300]
+        assert result["Volume"].diff().tolist()[1:] == [1000, -500, -300, -100, 200]
+
+    def test_obv_matches_int64(self):
+        pytest.importorskip("ta")
+        from src.analysis.technical import TechnicalAnalyzer
+
+        obv = TechnicalAnalyzer(optimize_dtypes(_make_prices())).calculate_obv()["OBV"]
+        assert obv.tolist() == [1000, 3000, 4500, 3300, 2200, 3500]
+
+    def test_empty_frame_unchanged(self):
+        empty = pd.DataFrame()
+        assert optimize_dtypes(empty) is empty
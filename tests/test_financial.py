@@ -0,0 +1,75 @@
+"""
+Tests for the shared financial calculation utilities.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils import financial
+from src.utils.financial import (
+    _daily_return_std_loop,
+    _daily_return_std_numpy,
+    annualize_volatility,
+    daily_return_std,
+)
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+
+def _close(n: int = 300, seed: int = 5) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    return pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.015, n))))
+
+
+# ============================================================
+# Daily Return Volatility
+# ============================================================
+
+
+class TestDailyReturnStd:
+    """daily_return_std matches pct_change().std() on every kernel"""
+
+    KERNELS = [_daily_return_std_loop, _daily_return_std_numpy]
+
+    def test_matches_pandas(self):
+        close = _close()
+        assert daily_return_std(close) == pytest.approx(close.pct_change().std(), rel=1e-12)
+
+    def test_missing_prices_are_skipped(self):
+        close = _close()
+        close.iloc[[10, 11, 150]] = np.nan
+        expected = close.pct_change().std()
+        assert daily_return_std(close) == pytest.approx(expected, rel=1e-12)
+
+    @pytest.mark.parametrize("kernel", KERNELS, ids=["loop", "numpy"])
+    def test_kernels_agree(self, kernel):
+        values = _close().to_numpy(copy=True)
+        values[[3, 40]] = np.nan
+        values[100] = 0.0  # inf return, skipped
+        with np.errstate(divide="ignore"):  # the interpreted loop divides numpy scalars
+            actual = kernel(values)
+        assert actual == pytest.approx(financial._daily_return_std(values), rel=1e-10)
+
+    @pytest.mark.parametrize("kernel", KERNELS, ids=["loop", "numpy"])
+    @pytest.mark.parametrize("prices", [[], [100.0], [100.0, 101.0]])
+    def test_fewer_than_two_returns_is_nan(self, kernel, prices):
+        assert np.isnan(kernel(np.array(prices, dtype=np.float64)))
+
+    def test_accepts_lists(self):
+        assert daily_return_std([100.0, 110.0, 99.0]) == pytest.approx(
+            pd.Series([100.0, 110.0, 99.0]).pct_change().std()
+        )
+
+    def test_annualized(self):
+        close = _close()
+        assert annualize_volatility(daily_return_std(close)) == pytest.approx(
+            close.pct_change().std() * np.sqrt(252)
+        )
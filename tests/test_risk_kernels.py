@@ -0,0 +1,196 @@
+"""
+Tests for the RiskMetrics array kernels.
+The pure-Python loops (what numba compiles) must agree with the NumPy fallbacks,
+and the optional bottleneck / fast_math paths with the default float64 pandas path.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analysis import risk
+from src.analysis.risk import (
+    RiskMetrics,
+    _drawdown_scan_loop,
+    _drawdown_scan_numpy,
+    _mean_downside_std_loop,
+    _mean_downside_std_numpy,
+    _mean_std_loop,
+    _mean_std_numpy,
+    _rolling_downside_std,
+)
+from src.config import AnalysisConfig
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+
+def _random_walk(n: int, seed: int) -> np.ndarray:
+    """Positive float64 price path"""
+    rng = np.random.default_rng(seed)
+    return 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+
+
+def _price_frame(n: int = 400, seed: int = 3) -> pd.DataFrame:
+    index = pd.bdate_range("2022-01-03", periods=n)
+    return pd.DataFrame({"Close": _random_walk(n, seed)}, index=index)
+
+
+def _assert_same_scan(actual, expected):
+    """Compare (max_dd, max_dd_pos, current_dd, days_since_peak, recovery_pos) tuples"""
+    max_dd, max_dd_pos, current_dd, days_since_peak, recovery_pos = actual
+    np.testing.assert_allclose(max_dd, expected[0], rtol=1e-12, equal_nan=True)
+    assert max_dd_pos == expected[1]
+    np.testing.assert_allclose(current_dd, expected[2], rtol=1e-12, equal_nan=True)
+    assert days_since_peak == expected[3]
+    assert recovery_pos == expected[4]
+
+
+PRICE_CASES = {
+    "random_walk": _random_walk(500, 1),
+    "recovered": np.array([10.0, 12.0, 9.0, 11.0, 12.0, 13.0]),
+    "never_recovered": np.array([10.0, 12.0, 9.0, 8.0, 11.0]),
+    "monotonic_up": np.arange(1.0, 20.0),
+    "with_nan": np.array([10.0, np.nan, 12.0, 9.0, np.nan, 12.5, 11.0]),
+    "trailing_nan": np.array([10.0, 8.0, 11.0, np.nan]),
+    "single": np.array([5.0]),
+}
+
+
+# ============================================================
+# Drawdown Scan
+# ============================================================
+
+
+class TestDrawdownScan:
+    """_drawdown_scan_loop and _drawdown_scan_numpy share one contract"""
+
+    @pytest.mark.parametrize("name", sorted(PRICE_CASES))
+    def test_loop_matches_numpy(self, name):
+        prices = PRICE_CASES[name]
+        _assert_same_scan(_drawdown_scan_loop(prices), _drawdown_scan_numpy(prices))
+
+    @pytest.mark.parametrize("name", sorted(PRICE_CASES))
+    def test_active_kernel_matches_numpy(self, name):
+        """The kernel in use (numba-compiled when installed) gives the same answer"""
+        prices = PRICE_CASES[name]
+        _assert_same_scan(risk._drawdown_scan(prices), _drawdown_scan_numpy(prices))
+
+    def test_matches_pandas_definition(self):
+        prices = PRICE_CASES["random_walk"]
+        close = pd.Series(prices)
+        drawdown = (close - close.cummax()) / close.cummax()
+
+        max_dd, max_dd_pos, current_dd, _, _ = _drawdown_scan_loop(prices)
+        assert max_dd == pytest.approx(drawdown.min())
+        assert max_dd_pos == drawdown.idxmin()
+        assert current_dd == pytest.approx(drawdown.iloc[-1])
+
+    def test_zero_close_is_skipped_like_pandas(self):
+        """A 0.0 peak gives a NaN drawdown instead of a ZeroDivisionError"""
+        prices = pd.DataFrame(
+            {"Close": [0.0, 4.0, 3.0, 3.5]}, index=pd.bdate_range("2024-01-01", periods=4)
+        )
+        result = RiskMetrics().calculate_drawdown(prices)
+        assert result["max_drawdown"] == pytest.approx(-0.25)
+        assert result["max_drawdown_date"] == "2024-01-03"
+
+    def test_all_nan(self):
+        prices = np.array([np.nan, np.nan])
+        _assert_same_scan(_drawdown_scan_loop(prices), (np.nan, -1, np.nan, 2, -1))
+        _assert_same_scan(_drawdown_scan_numpy(prices), (np.nan, -1, np.nan, 2, -1))
+
+
+# ============================================================
+# Welford Mean / Std
+# ============================================================
+
+
+class TestWelfordKernels:
+    """One-pass mean/std loops agree with the NumPy fallbacks"""
+
+    @pytest.mark.parametrize("size", [0, 1, 2, 250, 5000])
+    def test_mean_std(self, size):
+        r = np.random.default_rng(size).normal(0.0005, 0.02, size)
+        np.testing.assert_allclose(
+            _mean_std_loop(r), _mean_std_numpy(r), rtol=1e-10, equal_nan=True
+        )
+        np.testing.assert_allclose(
+            risk._mean_std(r), _mean_std_numpy(r), rtol=1e-10, equal_nan=True
+        )
+
+    @pytest.mark.parametrize("size", [0, 1, 3, 250, 5000])
+    @pytest.mark.parametrize("threshold", [0.0, 0.00016])
+    def test_mean_downside_std(self, size, threshold):
+        r = np.random.default_rng(size).normal(0.0005, 0.02, size)
+        expected = _mean_downside_std_numpy(r, threshold)
+        for kernel in (_mean_downside_std_loop, risk._mean_downside_std):
+            mean, downside_std, n_neg = kernel(r, threshold)
+            np.testing.assert_allclose(
+                (mean, downside_std), expected[:2], rtol=1e-10, equal_nan=True
+            )
+            assert n_neg == expected[2]
+
+
+# ============================================================
+# Rolling Windows
+# ============================================================
+
+
+class TestRollingDownsideStd:
+    """Rolling-sum downside std matches a direct per-window computation"""
+
+    def test_matches_window_by_window(self):
+        returns = np.random.default_rng(11).normal(0, 0.02, 300)
+        window = 30
+
+        def downside_std(values):
+            negative = values[values < 0]
+            return negative.std(ddof=1) if negative.size > 1 else np.nan
+
+        expected = pd.Series(returns).rolling(window).apply(downside_std, raw=True).to_numpy()
+        np.testing.assert_allclose(
+            _rolling_downside_std(returns, window), expected, rtol=1e-8, equal_nan=True
+        )
+
+    def test_short_input_is_all_nan(self):
+        assert np.isnan(_rolling_downside_std(np.array([-0.01, 0.02]), 5)).all()
+
+
+class TestRollingRatios:
+    """bottleneck and fast_math paths agree with the default pandas float64 path"""
+
+    WINDOWS = [30, 60, 90]
+
+    def _ratios(self, monkeypatch, bottleneck=None, fast_math=False):
+        monkeypatch.setattr(risk, "bn", bottleneck)
+        metrics = RiskMetrics()
+        metrics.config = AnalysisConfig(fast_math=fast_math)
+        return metrics.calculate_rolling_ratios(_price_frame(), windows=self.WINDOWS)
+
+    def _assert_close(self, actual, expected, rtol):
+        assert actual.keys() == expected.keys()
+        for key, stats in expected.items():
+            for stat, value in stats.items():
+                assert actual[key][stat] == pytest.approx(value, rel=rtol, abs=1e-9), (key, stat)
+
+    def test_reference_path_has_all_windows(self, monkeypatch):
+        ratios = self._ratios(monkeypatch)
+        assert set(ratios) == {
+            f"{kind}_{w}d" for kind in ("sharpe", "sortino") for w in self.WINDOWS
+        }
+
+    def test_bottleneck_matches_pandas(self, monkeypatch):
+        bn = pytest.importorskip("bottleneck")
+        expected = self._ratios(monkeypatch)
+        self._assert_close(self._ratios(monkeypatch, bottleneck=bn), expected, rtol=1e-9)
+
+    def test_fast_math_close_to_float64(self, monkeypatch):
+        expected = self._ratios(monkeypatch)
+        self._assert_close(self._ratios(monkeypatch, fast_math=True), expected, rtol=1e-3)
@@ -0,0 +1,283 @@
+"""
+Tests for the ValuationAnalyzer and batch valuation helpers.
+Uses small synthetic statements — no network calls.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analysis.valuation import (
+    ValuationAnalyzer,
+    ValuationBatch,
+    _sustainability_score_kernel,
+    dividend_sustainability_scores,
+)
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+
+def _statement(rows: dict) -> pd.DataFrame:
+    """Annual statement with line items as rows and the newest period first"""
+    periods = pd.to_datetime(["2024-12-31", "2023-12-31", "2022-12-31", "2021-12-31"])
+    return pd.DataFrame(rows, index=periods).T
+
+
+def _make_analyzer(fundamentals: dict, info: dict = None) -> ValuationAnalyzer:
+    return ValuationAnalyzer(
+        ticker="TEST",
+        ticker_info=info or {"currency": "USD", "currentPrice": 100.0},
+        fundamentals=fundamentals,
+    )
+
+
+def _dcf_analyzer(fcf: float, shares: float, cash: float, debt: float, price: float):
+    """Analyzer with just enough statements and info for a DCF valuation"""
+    fundamentals = {
+        "income_stmt_annual": _statement({"Net Income": [1.0, 1.0, 1.0, 1.0]}),
+        "cash_flow_annual": _statement({"Free Cash Flow": [fcf, fcf, fcf, fcf]}),
+    }
+    info = {
+        "currency": "USD",
+        "currentPrice": price,
+        "sharesOutstanding": shares,
+        "totalCash": cash,
+        "totalDebt": debt,
+    }
+    return _make_analyzer(fundamentals, info)
+
+
+# ============================================================
+# DCF Valuation
+# ============================================================
+
+
+class TestValuationBatch:
+    """Batch DCF must reproduce ValuationAnalyzer.calculate_dcf_valuation"""
+
+    CASES = [
+        # (fcf, growth %, wacc %, shares, cash, debt, price)
+        (1.0e9, 8.0, 10.0, 1.0e8, 5.0e8, 2.0e9, 150.0),
+        (2.5e8, -3.0, 7.5, 4.0e7, 0.0, 0.0, 20.0),
+        (5.0e8, 9.0, 9.0, 2.0e8, 1.0e9, 3.0e8, 42.0),  # growth == wacc (q == 1)
+        (7.0e7, 15.0, 12.0, 1.5e7, 2.0e7, 9.0e7, 8.5),
+    ]
+
+    def test_matches_scalar_dcf(self):
+        fcf, growth, wacc, shares, cash, debt, price = map(np.array, zip(*self.CASES))
+        batch = ValuationBatch(
+            tickers=[f"T{i}" for i in range(len(self.CASES))],
+            fcf_current=fcf,
+            growth_rate=growth,
+            wacc=wacc,
+            shares_outstanding=shares,
+            net_debt=debt - cash,
+            current_price=price,
+        ).calculate_dcf_batch()
+
+        for i, (fcf_i, g, w, sh, c, d, p) in enumerate(self.CASES):
+            scalar = _dcf_analyzer(fcf_i, sh, c, d, p).calculate_dcf_valuation(
+                growth_rate=g, wacc=w
+            )
+            assert scalar["error"] is None
+            row = batch.iloc[i]
+            for column in (
+                "enterprise_value",
+                "equity_value",
+                "intrinsic_value_per_share",
+                "discount_premium_pct",
+            ):
+                assert row[column] == pytest.approx(scalar[column], rel=1e-9)
+
+    def test_inapplicable_rows_are_nan(self):
+        batch = ValuationBatch(
+            tickers=["NEG_FCF", "LOW_WACC", "NO_SHARES", "OK"],
+            fcf_current=[-1.0e8, 1.0e8, 1.0e8, 1.0e8],
+            growth_rate=5.0,
+            wacc=[9.0, 2.0, 9.0, 9.0],
+            shares_outstanding=[1.0e6, 1.0e6, 0.0, 1.0e6],
+        ).calculate_dcf_batch()
+
+        assert batch.loc[["NEG_FCF", "LOW_WACC", "NO_SHARES"]].isna().all().all()
+        assert np.isfinite(batch.loc["OK", "intrinsic_value_per_share"])
+
+    def test_scalars_broadcast(self):
+        batch = ValuationBatch(
+            tickers=["A", "B"], fcf_current=1.0e8, growth_rate=5.0, wacc=9.0, shares_outstanding=1e6
+        ).calculate_dcf_batch()
+        assert batch.loc["A", "enterprise_value"] == batch.loc["B", "enterprise_value"]
+
+    def test_mismatched_lengths_raise(self):
+        with pytest.raises(ValueError, match="one value per ticker"):
+            ValuationBatch(
+                tickers=["A", "B", "C"],
+                fcf_current=[1.0, 2.0],
+                growth_rate=5.0,
+                wacc=9.0,
+                shares_outstanding=1.0,
+            )
+
+
+# ============================================================
+# Dividend Analysis
+# ============================================================
+
+
+class TestDividendSustainabilityScores:
+    """Batch and scalar sustainability scorers agree"""
+
+    def test_batch_matches_scalar(self):
+        rng = np.random.default_rng(7)
+        payouts = rng.uniform(0, 120, 500)
+        growths = rng.uniform(-10, 20, 500)
+        consecutive = rng.integers(0, 15, 500)
+        # Missing inputs and exact band edges
+        payouts[:6] = [np.nan, 50, 70, 90, 100, 100.5]
+        growths[:6] = [np.nan, 10, 5, 0, -0.1, np.nan]
+        consecutive[:6] = [0, 10, 5, 3, 1, 0]
+
+        batch = dividend_sustainability_scores(payouts, growths, consecutive)
+        scalar = [
+            _sustainability_score_kernel(p, g, int(c))
+            for p, g, c in zip(payouts, growths, consecutive)
+        ]
+        assert batch.tolist() == scalar
+
+    def test_none_inputs(self):
+        scores = dividend_sustainability_scores([None, 40.0], [None, 12.0], [None, 12])
+        assert scores.tolist() == [0, 100]
+
+    def test_analyzer_uses_same_score(self):
+        analyzer = _make_analyzer(
+            {}, {"currency": "USD", "dividendYield": 0.03, "payoutRatio": 0.65}
+        )
+        result = analyzer.analyze_dividends()
+        expected = dividend_sustainability_scores([65.0], [None], [0])[0]
+        assert result["sustainability_score"] == expected
+
+
+class TestRatingLadders:
+    """Threshold lookups keep the original if/elif boundaries"""
+
+    @pytest.mark.parametrize(
+        "payout_ratio, score, rating",
+        [
+            (0.5, 40, "Fair"),  # score on a threshold earns the higher label
+            (0.6, 30, "Poor"),
+            (0.95, 5, "High Risk"),
+        ],
+    )
+    def test_sustainability_rating(self, payout_ratio, score, rating):
+        info = {"currency": "USD", "dividendYield": 0.03, "payoutRatio": payout_ratio}
+        result = _make_analyzer({}, info).analyze_dividends()
+        assert result["sustainability_score"] == score
+        assert result["sustainability_rating"] == rating
+
+    @pytest.mark.parametrize(
+        "ocf, score",
+        [(0.79, 25), (0.8, 50), (1.0, 75), (1.2, 90), (1.5, 90)],
+    )
+    def test_earnings_quality_grade(self, ocf, score):
+        fundamentals = {
+            "income_stmt_annual": _statement({"Net Income": [1.0, 1.0, 1.0, 1.0]}),
+            "cash_flow_annual": _statement({"Operating Cash Flow": [ocf, ocf, ocf, ocf]}),
+        }
+        quality = _make_analyzer(fundamentals)._assess_earnings_quality()
+        assert quality["score"] == score
+
+    @pytest.mark.parametrize(
+        "eps, trend",
+        [
+            (12.5, "Strong Growth"),
+            (11.0, "Moderate Growth"),  # exactly +10% is not above the threshold
+            (10.5, "Moderate Growth"),
+            (10.0, "Slight Decline"),
+            (9.5, "Slight Decline"),
+            (9.0, "Declining"),
+        ],
+    )
+    def test_trend(self, eps, trend):
+        income = _statement({"Diluted EPS": [eps, 10.0, 10.0, 10.0]})
+        result = _make_analyzer({"income_stmt_annual": income}).analyze_earnings()
+        assert result["trend"] == trend
+
+
+# ============================================================
+# Earnings Analysis
+# ============================================================
+
+
+class TestEpsGrowth:
+    """EPS growth and trend from the annual income statement"""
+
+    def test_zero_current_eps_is_a_value(self):
+        income = _statement({"Diluted EPS": [0.0, 1.0, 1.2, 1.5]})
+        result = _make_analyzer({"income_stmt_annual": income}).analyze_earnings()
+        assert result["eps_growth_1y"] == pytest.approx(-100.0)
+        assert result["trend"] == "Declining"
+
+    def test_falls_back_to_basic_eps_when_diluted_missing(self):
+        income = _statement({"Basic EPS": [2.1, 2.0, 1.8, 1.5]})
+        result = _make_analyzer({"income_stmt_annual": income}).analyze_earnings()
+        assert result["eps_growth_1y"] == pytest.approx(5.0)
+        assert result["trend"] == "Moderate Growth"
+
+    def test_flat_growth_is_classified(self):
+        income = _statement({"Diluted EPS": [2.0, 2.0, 1.8, 1.5]})
+        result = _make_analyzer({"income_stmt_annual": income}).analyze_earnings()
+        assert result["eps_growth_1y"] == 0.0
+        assert result["trend"] == "Slight Decline"
+
+
+# ============================================================
+# Dividend History
+# ============================================================
+
+
+def _dividends(days_ago: list, unit: str = "s") -> pd.Series:
+    """Quarterly-ish dividends on a timezone-naive index in the given datetime unit"""
+    now = pd.Timestamp.now().floor("D")
+    index = pd.DatetimeIndex([now - pd.Timedelta(days=d) for d in days_ago]).as_unit(unit)
+    return pd.Series(0.5, index=index)
+
+
+class TestTtmDividend:
+    """TTM dividend window on indexes of any datetime resolution"""
+
+    @pytest.mark.parametrize("unit", ["s", "ms", "us", "ns"])
+    def test_window_on_any_unit(self, unit):
+        dividends = _dividends([640, 550, 460, 370, 280, 190, 100, 10], unit=unit)
+        assert _make_analyzer({})._calculate_ttm_dividend(dividends) == pytest.approx(2.0)
+
+    def test_second_resolution_from_yfinance_timestamps(self):
+        now = pd.Timestamp.now(tz="UTC").floor("D")
+        stamps = [(now - pd.Timedelta(days=d)).timestamp() for d in (460, 370, 280, 190, 100, 10)]
+        index = pd.to_datetime(stamps, unit="s", utc=True).tz_convert("Europe/Oslo")
+        dividends = pd.Series(0.5, index=index.tz_localize(None).as_unit("s"))
+        assert _make_analyzer({})._calculate_ttm_dividend(dividends) == pytest.approx(2.0)
+
+
+class TestDividendFrequency:
+    """Payment frequency from the median gap between payments"""
+
+    @pytest.mark.parametrize("unit", ["s", "ms", "us", "ns"])
+    @pytest.mark.parametrize(
+        "step, expected",
+        [
+            (365, "annual"),
+            (182, "semi-annual"),
+            (91, "quarterly"),
+            (30, "monthly"),
+            (7, "irregular"),
+        ],
+    )
+    def test_any_index_unit(self, unit, step, expected):
+        dividends = _dividends([step * i for i in range(6, 0, -1)], unit=unit)
+        assert _make_analyzer({})._get_dividend_frequency(dividends) == expected